@@ -0,0 +1,278 @@
+"""
+Persistent, memory-mapped cache for distance matrices keyed by stop set.
+
+Depot stop sets change only slightly from one optimization run to the next, so recomputing
+the full distance matrix each time wastes most of the work. This module stores matrices on
+disk as `.npy` files and opens them with `mmap_mode='r'`, which means every worker process
+on a node shares the same page-cache copy instead of holding its own.
+
+Features:
+- Cache key: SHA-1 of the sorted, de-duplicated coordinate set (rounded to a fixed precision).
+- Exact hits return the mapped matrix (zero-copy when the request is already in canonical order).
+- Subset hits: a request whose stops are all contained in a cached set is served by slicing.
+- LRU eviction by total size on disk, using file modification times as the access clock
+  so that eviction order is shared across processes.
+
+Assumptions:
+- Coordinates are (latitude, longitude) pairs in decimal degrees.
+- The cache directory lives on a local filesystem shared by the worker processes.
+"""
+
+import os
+import glob
+import hashlib
+import logging
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+from src.core.distance_matrix import haversine_matrix, Coordinates
+
+logger = logging.getLogger(__name__)
+
+_MATRIX_SUFFIX = ".matrix.npy"
+_CODES_SUFFIX = ".codes.npy"
+
+class DistanceMatrixCache:
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3, dtype: np.dtype = np.float32,
+                 precision: int = 6):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory holding cached matrices; created if missing.
+            max_bytes (int): Maximum total size of cached matrices before LRU eviction.
+            dtype (np.dtype): Dtype used for stored matrices.
+            precision (int): Decimal places kept when keying coordinates (6 is ~0.1 m).
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.dtype = np.dtype(dtype)
+        self.scale = 10 ** precision
+        self.hits = 0
+        self.subset_hits = 0
+        self.misses = 0
+        self._mapped: Dict[str, np.ndarray] = {}
+        self._codes: Dict[str, np.ndarray] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _encode(self, coordinates: Coordinates) -> np.ndarray:
+        """
+        Encode each (lat, lon) pair as a single int64 whose order matches (lat, lon) order.
+
+        Args:
+            coordinates (Coordinates): Coordinates of shape (N, 2).
+
+        Returns:
+            np.ndarray: int64 codes of shape (N,).
+        """
+        coords = np.asarray(coordinates, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] != 2:
+            raise ValueError("Coordinates must have shape (N, 2) as (latitude, longitude) pairs.")
+        lat = np.round((coords[:, 0] + 90.0) * self.scale).astype(np.int64)
+        lon = np.round((coords[:, 1] + 180.0) * self.scale).astype(np.int64)
+        return lat * (360 * self.scale + 1) + lon
+
+    def _decode(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Decode int64 codes back into (lat, lon) coordinates.
+
+        Args:
+            codes (np.ndarray): Codes produced by `_encode`.
+
+        Returns:
+            np.ndarray: Coordinates of shape (N, 2).
+        """
+        lat, lon = np.divmod(codes, 360 * self.scale + 1)
+        return np.column_stack([lat / self.scale - 90.0, lon / self.scale - 180.0])
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, key + suffix)
+
+    def _keys_by_recency(self):
+        """
+        List cached keys, most recently used first.
+
+        Returns:
+            List[str]: Cache keys.
+        """
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, "*" + _CODES_SUFFIX)):
+            key = os.path.basename(path)[:-len(_CODES_SUFFIX)]
+            try:
+                entries.append((os.path.getmtime(path), key))
+            except OSError:
+                continue  # Evicted by another process.
+        entries.sort(reverse=True)
+        return [key for _, key in entries]
+
+    def _load_codes(self, key: str) -> Optional[np.ndarray]:
+        if key not in self._codes:
+            try:
+                self._codes[key] = np.load(self._path(key, _CODES_SUFFIX))
+            except (OSError, ValueError):
+                return None
+        return self._codes[key]
+
+    def _open(self, key: str) -> Optional[np.ndarray]:
+        """
+        Memory-map a cached matrix and mark it as recently used.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[np.ndarray]: Read-only mapped matrix, or None if the entry is gone.
+        """
+        try:
+            if key not in self._mapped:
+                self._mapped[key] = np.load(self._path(key, _MATRIX_SUFFIX), mmap_mode="r")
+            os.utime(self._path(key, _CODES_SUFFIX))
+        except (OSError, ValueError):
+            self._mapped.pop(key, None)
+            self._codes.pop(key, None)
+            return None
+        return self._mapped[key]
+
+    def _save_array(self, path: str, array: np.ndarray):
+        # Write to a process-unique temporary file, then rename atomically.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+
+    def _store(self, key: str, codes: np.ndarray) -> np.ndarray:
+        """
+        Compute, persist, and map the matrix for a canonical code set.
+
+        Args:
+            key (str): Cache key.
+            codes (np.ndarray): Sorted unique coordinate codes.
+
+        Returns:
+            np.ndarray: Read-only mapped matrix.
+        """
+        matrix = haversine_matrix(self._decode(codes), dtype=self.dtype)
+        # The matrix is written before the codes file, which marks the entry as complete.
+        self._save_array(self._path(key, _MATRIX_SUFFIX), matrix)
+        self._save_array(self._path(key, _CODES_SUFFIX), codes)
+        self._codes[key] = codes
+        self.evict(keep=key)
+        mapped = self._open(key)
+        return matrix if mapped is None else mapped
+
+    def lookup(self, coordinates: Coordinates) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return a (possibly shared) matrix covering the coordinates and an index into it.
+
+        The returned matrix is the memory-mapped cache entry itself, so it is never copied;
+        row/column `index[i]` corresponds to the i-th requested coordinate.
+
+        Args:
+            coordinates (Coordinates): Stop coordinates of shape (N, 2).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Read-only matrix and int index array of shape (N,).
+        """
+        codes = self._encode(coordinates)
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        key = hashlib.sha1(unique_codes.tobytes()).hexdigest()
+
+        matrix = self._open(key) if os.path.exists(self._path(key, _CODES_SUFFIX)) else None
+        if matrix is not None:
+            self.hits += 1
+            return matrix, inverse
+
+        for cached_key in self._keys_by_recency():
+            cached_codes = self._load_codes(cached_key)
+            if cached_codes is None or cached_codes.size < unique_codes.size:
+                continue
+            positions = np.searchsorted(cached_codes, unique_codes)
+            positions = np.minimum(positions, cached_codes.size - 1)
+            if np.array_equal(cached_codes[positions], unique_codes):
+                matrix = self._open(cached_key)
+                if matrix is not None:
+                    self.subset_hits += 1
+                    return matrix, positions[inverse]
+
+        self.misses += 1
+        return self._store(key, unique_codes), inverse
+
+    def get_matrix(self, coordinates: Coordinates) -> np.ndarray:
+        """
+        Return the distance matrix for the coordinates in the order they were given.
+
+        When the request maps one-to-one onto a cache entry in canonical order, the shared
+        mapped matrix is returned directly; otherwise the needed sub-matrix is gathered.
+
+        Args:
+            coordinates (Coordinates): Stop coordinates of shape (N, 2).
+
+        Returns:
+            np.ndarray: Distance matrix of shape (N, N) in kilometers.
+        """
+        matrix, index = self.lookup(coordinates)
+        if index.size == matrix.shape[0] and np.array_equal(index, np.arange(index.size)):
+            return matrix
+        return np.asarray(matrix[np.ix_(index, index)])
+
+    def size_bytes(self) -> int:
+        """
+        Total size of cached matrices on disk.
+
+        Returns:
+            int: Size in bytes.
+        """
+        total = 0
+        for key in self._keys_by_recency():
+            try:
+                total += os.path.getsize(self._path(key, _MATRIX_SUFFIX))
+            except OSError:
+                continue
+        return total
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Evict least recently used entries until the cache fits within `max_bytes`.
+
+        Files that are still mapped by other processes remain valid for them until unmapped.
+
+        Args:
+            keep (str, optional): Key that must not be evicted (e.g. the entry just written).
+        """
+        keys = self._keys_by_recency()
+        sizes = {}
+        for key in keys:
+            try:
+                sizes[key] = os.path.getsize(self._path(key, _MATRIX_SUFFIX))
+            except OSError:
+                sizes[key] = 0
+        total = sum(sizes.values())
+        for key in reversed(keys):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for suffix in (_CODES_SUFFIX, _MATRIX_SUFFIX):
+                try:
+                    os.remove(self._path(key, suffix))
+                except OSError:
+                    pass
+            self._mapped.pop(key, None)
+            self._codes.pop(key, None)
+            total -= sizes[key]
+            logger.info(f"Evicted distance matrix {key} ({sizes[key]} bytes) from cache.")
+
+# Example usage:
+if __name__ == "__main__":
+    import tempfile
+
+    logging.basicConfig(level=logging.INFO)
+    rng = np.random.default_rng(7)
+    depot_stops = np.column_stack([rng.uniform(24.0, 26.0, 500), rng.uniform(54.0, 56.0, 500)])
+
+    cache = DistanceMatrixCache(tempfile.mkdtemp(prefix="distance-cache-"))
+    cache.get_matrix(depot_stops)          # Miss: computed and persisted.
+    cache.get_matrix(depot_stops)          # Exact hit.
+    cache.get_matrix(depot_stops[::2])     # Subset hit: sliced from the cached matrix.
+    print(f"hits={cache.hits} subset_hits={cache.subset_hits} misses={cache.misses}")
@@ -6,6 +6,8 @@ Functions include:
 - format_date: Standardize date/time formatting.
 - validate_numeric: Check if input is numeric and within an expected range.
 - merge_dicts: Merge two dictionaries recursively.
+
+For distances between many points at once, use `src.core.distance_matrix.haversine_matrix`.
 """
 
 import math
@@ -0,0 +1,425 @@
+"""
+Asynchronous optimization jobs for the API.
+
+Optimizer runs take seconds of CPU, so running one inside an `async def` handler would stall every
+other request on the event loop. This module moves them to a bounded process pool:
+- JobManager.submit: registers a job and hands the normalized request to the pool, returning the
+  job immediately; the API answers with its id.
+- Job: status ("queued", "running", "succeeded", "failed"), the best distance reported so far
+  while running (from the optimizer's progress events), and the final result or error.
+- Back-pressure: at most `max_workers + max_queue` jobs are active at once; further submissions
+  raise JobQueueFullError (served as HTTP 429) instead of piling up unbounded work.
+- Finished jobs are kept for `retention` seconds so that clients can still poll their results.
+- JobManager.run_batch: runs many problems on the same warm pool with a window of at most one
+  in-flight problem per worker, yielding results as they finish; the window's slots count
+  against the queue depth until the returned BatchResults is exhausted or closed (or dropped),
+  whether or not iteration ever started.
+
+Worker processes report "started" and progress messages through a multiprocessing manager queue,
+which a daemon thread drains into the job table; pool futures report completion, and `run` awaits
+its job's pool future directly. If a worker process dies (e.g. killed for running out of memory),
+the jobs still in the pool fail with BrokenProcessPool and the next submission starts a new pool.
+
+Assumptions:
+- One JobManager per API process; its state is guarded by a lock because pool callbacks and the
+  drain thread run outside the event loop.
+- Job payloads and results are small JSON-serializable dicts (they are pickled to the workers).
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.services.api.solver import solve_route_request
+from src.services.optimization.progress import ProgressEvent
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+class JobQueueFullError(RuntimeError):
+    """
+    Raised when a submission would exceed the job manager's queue depth.
+    """
+
+class Job:
+    def __init__(self, job_id: str, request: Dict[str, Any]):
+        """
+        State of one optimization job.
+
+        Args:
+            job_id (str): Unique job id.
+            request (Dict[str, Any]): Normalized route request.
+        """
+        self.id = job_id
+        self.request = request
+        self.status = QUEUED
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.progress = None
+        self.result = None
+        self.error = None
+        # Bumped on every change, so that streams can tell when there is something new to send.
+        self.version = 0
+        # The pool future computing the result.
+        self._future = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON-serializable view of the job (without the request).
+        """
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+        }
+
+class _QueueCallback:
+    """
+    Picklable progress callback that forwards a job's events to the manager queue.
+    """
+    def __init__(self, queue: Any, job_id: str):
+        self.queue = queue
+        self.job_id = job_id
+
+    def __call__(self, event: ProgressEvent):
+        self.queue.put((self.job_id, "progress", {
+            "iteration": event.iteration,
+            "best_distance_km": -event.best_fitness,
+            "evaluations": event.evaluations,
+            "elapsed": event.elapsed,
+        }))
+
+def _run_job(job_id: str, request: Dict[str, Any], time_limit: float, queue: Any) -> Dict[str, Any]:
+    # Module-level so that it can be pickled for the process pool.
+    queue.put((job_id, "started", time.time()))
+    return solve_route_request(request, time_limit, progress_callback=_QueueCallback(queue, job_id))
+
+class BatchResults:
+    """
+    Async iterator over a batch's results that owns the batch's reserved queue slots.
+
+    The slots are released exactly once: when iteration ends or fails, on `aclose`, or when the
+    object is garbage-collected, so that a client that disconnects before (or while) the results
+    stream cannot leak capacity.
+    """
+    def __init__(self, manager: "JobManager", requests: List[Dict[str, Any]], window: int):
+        self._manager = manager
+        self._window = window
+        self._results = manager._batch(requests, window)
+        self._released = False
+
+    def __aiter__(self) -> "BatchResults":
+        return self
+
+    async def __anext__(self) -> Tuple[int, Optional[Dict[str, Any]], Optional[str]]:
+        try:
+            return await self._results.__anext__()
+        except BaseException:
+            # StopAsyncIteration, cancellation, or a failure: the batch is over either way.
+            self.release()
+            raise
+
+    async def aclose(self):
+        """
+        Cancel the problems not yet started and release the reserved slots.
+        """
+        try:
+            await self._results.aclose()
+        finally:
+            self.release()
+
+    def release(self):
+        """
+        Give the reserved slots back to the manager (idempotent).
+        """
+        if not self._released:
+            self._released = True
+            self._manager._release(self._window)
+
+    def __del__(self):
+        self.release()
+
+class JobManager:
+    def __init__(self, max_workers: Optional[int] = None, max_queue: int = 32, time_limit: float = 5.0,
+                 retention: float = 600.0, mp_context: Optional[str] = None):
+        """
+        Initialize the job manager; the pool starts on the first submission.
+
+        Args:
+            max_workers (int, optional): Worker processes; defaults to the number of CPUs.
+            max_queue (int): Jobs allowed to wait for a worker before submissions are rejected.
+            time_limit (float): Wall-clock budget of each optimization, in seconds.
+            retention (float): Seconds finished jobs are kept for polling.
+            mp_context (str, optional): Multiprocessing start method for the pool (e.g. "spawn").
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.time_limit = time_limit
+        self.retention = retention
+        self.mp_context = mp_context
+        self.jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._manager = None
+        self._queue = None
+        self._drain_thread = None
+        self._reserved = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        Maximum number of active (queued or running) jobs.
+        """
+        return self.max_workers + self.max_queue
+
+    def _start(self):
+        # Callers hold the lock.
+        context = multiprocessing.get_context(self.mp_context)
+        if self._manager is None:
+            self._manager = context.Manager()
+            self._queue = self._manager.Queue()
+            self._drain_thread = threading.Thread(target=self._drain, args=(self._queue,), name="job-progress",
+                                                  daemon=True)
+            self._drain_thread.start()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+
+    def _pool_submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Submit a call to the pool, replacing the pool first if a worker process has died.
+        """
+        with self._lock:
+            self._start()
+            executor = self._executor
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            # A worker died after the last completion callback ran; retry once on a new pool.
+            self._discard_pool(executor)
+            with self._lock:
+                self._start()
+                executor = self._executor
+            future = executor.submit(fn, *args)
+        future.add_done_callback(lambda done: self._check_pool(executor, done))
+        return future
+
+    def _check_pool(self, executor: ProcessPoolExecutor, future: Future):
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._discard_pool(executor)
+
+    def _discard_pool(self, executor: ProcessPoolExecutor):
+        """
+        Drop a broken pool, so that the next submission starts a new one.
+        """
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False)
+
+    def _drain(self, queue: Any):
+        """
+        Apply worker messages to the job table until the stop sentinel (None) arrives.
+        """
+        while True:
+            try:
+                message = queue.get()
+            except (EOFError, OSError):
+                return
+            if message is None:
+                return
+            job_id, kind, payload = message
+            with self._lock:
+                job = self.jobs.get(job_id)
+                if job is None or job.status in FINISHED:
+                    continue
+                if kind == "started":
+                    job.status, job.started_at = RUNNING, payload
+                else:
+                    job.progress = payload
+                job.version += 1
+
+    def _finish(self, job: Job, future: Future):
+        with self._lock:
+            job.finished_at = time.time()
+            error = asyncio.CancelledError("The job was cancelled.") if future.cancelled() else future.exception()
+            if error is None:
+                job.status, job.result = SUCCEEDED, future.result()
+            else:
+                job.status, job.error = FAILED, f"{type(error).__name__}: {error}"
+            job.version += 1
+
+    def _prune(self, now: float):
+        expired = [job_id for job_id, job in self.jobs.items()
+                   if job.status in FINISHED and now - job.finished_at > self.retention]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def _active(self) -> int:
+        # Callers hold the lock.
+        return sum(job.status not in FINISHED for job in self.jobs.values()) + self._reserved
+
+    def active(self) -> int:
+        """
+        Number of queued or running jobs, plus the slots held by running batches.
+        """
+        with self._lock:
+            return self._active()
+
+    def submit(self, request: Dict[str, Any]) -> Job:
+        """
+        Queue an optimization job.
+
+        Args:
+            request (Dict[str, Any]): Normalized route request (see `solver.normalize_route_request`).
+
+        Returns:
+            Job: The queued job.
+
+        Raises:
+            JobQueueFullError: If `capacity` jobs are already active.
+        """
+        with self._lock:
+            self._prune(time.time())
+            if self._active() >= self.capacity:
+                raise JobQueueFullError(f"{self.capacity} optimization jobs are already queued or running.")
+            self._start()
+            job = Job(uuid.uuid4().hex, request)
+            self.jobs[job.id] = job
+        try:
+            job._future = self._pool_submit(_run_job, job.id, request, self.time_limit, self._queue)
+        except BaseException:
+            with self._lock:
+                del self.jobs[job.id]
+            raise
+        job._future.add_done_callback(lambda done: self._finish(job, done))
+        return job
+
+    async def run(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a job and wait for its result without blocking the event loop.
+
+        Raises:
+            JobQueueFullError: If the queue is full.
+            RuntimeError: If the optimization failed.
+        """
+        job = self.submit(request)
+        try:
+            return await asyncio.wrap_future(job._future)
+        except Exception as error:
+            raise RuntimeError(f"{type(error).__name__}: {error}") from error
+
+    def run_batch(self, requests: Sequence[Dict[str, Any]], window: Optional[int] = None) -> BatchResults:
+        """
+        Solve many problems on the pool, yielding each result as soon as it is ready.
+
+        The window's slots are reserved immediately (so a full queue is reported before any work
+        starts) and released when the returned iterator finishes, fails, or is closed, even if
+        iteration never started.
+
+        Args:
+            requests (Sequence[Dict[str, Any]]): Normalized route requests.
+            window (int, optional): Problems in flight at once; defaults to `max_workers`.
+
+        Returns:
+            BatchResults: Async iterator of (position in `requests`, result, error) in completion order;
+            exactly one of result and error is set.
+
+        Raises:
+            JobQueueFullError: If the window does not fit in the free queue capacity.
+        """
+        window = max(1, min(window or self.max_workers, len(requests)))
+        with self._lock:
+            self._prune(time.time())
+            if self._active() + window > self.capacity:
+                raise JobQueueFullError(f"No room for a batch of {window} concurrent problems; "
+                                        f"{self._active()} of {self.capacity} slots are in use.")
+            self._reserved += window
+            self._start()
+        return BatchResults(self, list(requests), window)
+
+    def _release(self, slots: int):
+        with self._lock:
+            self._reserved -= slots
+
+    async def _batch(self, requests: List[Dict[str, Any]],
+                     window: int) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+        pending: Dict[asyncio.Future, int] = {}
+        next_index = 0
+        try:
+            while next_index < len(requests) or pending:
+                while next_index < len(requests) and len(pending) < window:
+                    future = self._pool_submit(solve_route_request, requests[next_index], self.time_limit)
+                    pending[asyncio.wrap_future(future)] = next_index
+                    next_index += 1
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        yield index, future.result(), None
+                    else:
+                        yield index, None, f"{type(error).__name__}: {error}"
+        finally:
+            # Problems not yet started are dropped when the client goes away; BatchResults releases the slots.
+            for future in pending:
+                future.cancel()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Job counts by status, and the queue limits.
+        """
+        with self._lock:
+            counts = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)}
+            for job in self.jobs.values():
+                counts[job.status] += 1
+            reserved = self._reserved
+        return dict(counts, batch_slots=reserved, max_workers=self.max_workers, capacity=self.capacity)
+
+    def shutdown(self, wait: bool = True):
+        """
+        Stop the pool, the progress queue, and the drain thread. Safe to call more than once.
+        """
+        if self._manager is None:
+            return
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+        self._queue.put(None)
+        self._drain_thread.join(timeout=1.0)
+        self._manager.shutdown()
+        self._executor = self._manager = self._queue = self._drain_thread = None
+
+# Example usage:
+if __name__ == "__main__":
+    import numpy as np
+    from src.services.api.solver import normalize_route_request
+
+    rng = np.random.default_rng(0)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 50), rng.uniform(54.0, 55.0, 50)]).tolist()
+    request = normalize_route_request({"route": list(range(50)), "vehicle_capacity": 50, "coordinates": coordinates})
+    manager = JobManager(max_workers=2, max_queue=2, time_limit=1.0)
+    job = manager.submit(request)
+    while job.status not in FINISHED:
+        print(job.status, job.progress)
+        time.sleep(0.3)
+    print(job.status, f"{job.result['distance_km']:.1f} km")
+    manager.shutdown()
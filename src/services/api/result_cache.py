@@ -0,0 +1,171 @@
+"""
+In-memory cache of optimization results keyed by a fingerprint of the request.
+
+Dispatch UIs and partner integrations re-send identical optimization requests (retries, page
+reloads), and every one of them would otherwise re-run the optimizer. This module provides:
+- fingerprint: a SHA-256 digest of the canonical JSON form of a (normalized) request, so that
+  requests differing only in key order or whitespace share a key.
+- ResultCache: a TTL + LRU cache of results. Entries expire `ttl` seconds after they were stored
+  and the least recently used entry is evicted once `max_entries` is reached.
+- ResultCache.get_or_compute: coalesces concurrent identical requests, so that while a result
+  is being computed every other request for the same key awaits the same computation instead of
+  starting its own.
+- Hit, miss, coalesced, eviction and expiration counters, reported by `ResultCache.stats`.
+
+Assumptions:
+- The cache is used from a single asyncio event loop (e.g. the FastAPI application), so its state
+  needs no locking; the computation itself may run in an executor.
+- Failed computations are not cached; every request coalesced onto one receives its exception.
+"""
+
+import json
+import time
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+def fingerprint(request: Any) -> str:
+    """
+    SHA-256 fingerprint of the canonical JSON form of a request.
+
+    Args:
+        request (Any): JSON-serializable request, normalized by the caller (e.g. numbers in one form).
+
+    Returns:
+        str: Hex digest.
+    """
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 600.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached results before LRU eviction.
+            ttl (float, optional): Seconds a result stays valid; None keeps results until evicted.
+            clock (Callable[[], float]): Monotonic time source (injectable for tests).
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Cached result for a key, or `default` when it is missing or expired (counted as a miss).
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires >= self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store a result, evicting the least recently used entries beyond `max_entries`.
+        """
+        expires = float("inf") if self.ttl is None else self.clock() + self.ttl
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Tuple[Any, str]:
+        """
+        Cached result for a key, computing (once across concurrent callers) and storing it on a miss.
+
+        Args:
+            key (Hashable): Request fingerprint.
+            compute (Callable[[], Awaitable[Any]]): Coroutine function producing the result.
+
+        Returns:
+            Tuple[Any, str]: The result and how it was obtained: "hit", "coalesced" (awaited another
+            caller's computation), or "miss" (computed by this call).
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] >= self.clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1], "hit"
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight), "coalesced"
+
+        if entry is not None:
+            del self._entries[key]
+            self.expirations += 1
+        self.misses += 1
+        # The computation runs as its own task, so a cancelled caller does not abort it for the others.
+        task = asyncio.ensure_future(compute())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task), "miss"
+
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        """
+        Store a finished computation's result and stop coalescing onto it.
+        """
+        del self._in_flight[key]
+        if not task.cancelled() and task.exception() is None:
+            self.put(key, task.result())
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache metrics: counters, current size and in-flight computations, and the hit ratio.
+        """
+        lookups = self.hits + self.coalesced + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "in_flight": len(self._in_flight),
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+# Example usage:
+if __name__ == "__main__":
+    async def main():
+        cache = ResultCache(max_entries=2, ttl=60.0)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return {"route": [0, 2, 1]}
+
+        key = fingerprint({"route": [0, 1, 2], "vehicle_capacity": 50})
+        results = await asyncio.gather(*(cache.get_or_compute(key, compute) for _ in range(5)))
+        print("Sources:", [source for _, source in results], "computations:", len(calls))
+        print("Metrics:", cache.stats())
+
+    asyncio.run(main())
@@ -5,16 +5,62 @@ This module uses FastAPI to expose endpoints for various functionalities, such a
 health checks, data retrieval, and integration with analytics modules. It provides
 a clear and extendable structure for building RESTful APIs for the fleet optimization platform.
 
+Route optimization requests are served through a result cache (see result_cache.py): each
+validated request is normalized and fingerprinted, repeated requests are answered from the
+cache until their entry expires, and concurrent identical requests share one optimizer run.
+
+Optimizer runs never execute on the event loop: they go through a bounded process pool (see
+jobs.py). Long runs can be submitted as jobs and polled, or followed as server-sent events;
+when the pool's queue is full, requests are rejected with 429 instead of piling up. Many
+independent problems can be sent in one batch request, whose results stream back as NDJSON
+lines in completion order.
+
 Assumptions:
 - FastAPI and Uvicorn are installed and configured.
 - In production, endpoints will integrate with databases and downstream services.
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+import json
+import asyncio
+from typing import Any, Dict
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from jsonschema import ValidationError
+
+from src.services.api.jobs import FINISHED, JobManager, JobQueueFullError
+from src.services.api.result_cache import ResultCache, fingerprint
+from src.services.api.solver import normalize_route_request
+from src.services.optimization.validators import validate_route_data_bulk
 
 app = FastAPI(title="Fleet Optimization API", version="1.0")
 
+# Wall-clock budget of one optimization run, in seconds.
+OPTIMIZATION_TIME_LIMIT = 1.0
+result_cache = ResultCache(max_entries=1024, ttl=600.0)
+job_manager = JobManager(max_queue=32, time_limit=OPTIMIZATION_TIME_LIMIT)
+# Maximum number of problems in one batch request.
+MAX_BATCH_SIZE = 2000
+
+@app.on_event("shutdown")
+def shutdown_job_manager():
+    job_manager.shutdown()
+
+def _error_message(error: Exception) -> str:
+    return error.message if isinstance(error, ValidationError) else str(error)
+
+def _normalize(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a route payload, answering invalid ones with 422.
+    """
+    try:
+        return normalize_route_request(payload)
+    except (ValidationError, ValueError) as error:
+        raise HTTPException(status_code=422, detail=_error_message(error))
+
+def _queue_full(error: JobQueueFullError) -> HTTPException:
+    return HTTPException(status_code=429, detail=str(error), headers={"Retry-After": "1"})
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
@@ -42,6 +88,169 @@ async def get_sample_data():
     }
     return JSONResponse(content=sample_data)
 
+@app.post("/api/optimize", tags=["Optimization"])
+async def optimize_route(payload: Dict[str, Any] = Body(...)):
+    """
+    Optimize the stop order of a route, answering repeated requests from the result cache.
+
+    Args:
+        payload (Dict[str, Any]): Route data as accepted by `validate_route_data`, with coordinates.
+
+    Returns:
+        JSONResponse: The optimized route with its request fingerprint; the X-Cache header tells
+        whether it was a cache HIT, a MISS, or COALESCED onto an identical in-flight request.
+    """
+    request = _normalize(payload)
+    key = fingerprint(request)
+    try:
+        result, source = await result_cache.get_or_compute(key, lambda: job_manager.run(request))
+    except JobQueueFullError as error:
+        raise _queue_full(error)
+    return JSONResponse(content=dict(result, fingerprint=key), headers={"X-Cache": source.upper()})
+
+@app.get("/api/optimize/cache", tags=["Optimization"])
+async def optimization_cache_metrics():
+    """
+    Hit/miss metrics of the optimization result cache.
+
+    Returns:
+        JSONResponse: Cache counters, size, and hit ratio.
+    """
+    return JSONResponse(content=result_cache.stats())
+
+@app.post("/api/jobs", status_code=202, tags=["Optimization"])
+async def submit_job(payload: Dict[str, Any] = Body(...)):
+    """
+    Submit a route optimization job; it runs in the background process pool.
+
+    Args:
+        payload (Dict[str, Any]): Route data as accepted by `validate_route_data`, with coordinates.
+
+    Returns:
+        JSONResponse: The job id and status (202), or 429 when the job queue is full.
+    """
+    request = _normalize(payload)
+    try:
+        job = job_manager.submit(request)
+    except JobQueueFullError as error:
+        raise _queue_full(error)
+    return JSONResponse(status_code=202, content={"job_id": job.id, "status": job.status,
+                                                  "status_url": f"/api/jobs/{job.id}",
+                                                  "events_url": f"/api/jobs/{job.id}/events"})
+
+@app.get("/api/jobs", tags=["Optimization"])
+async def job_queue_stats():
+    """
+    Job counts by status and the pool limits.
+
+    Returns:
+        JSONResponse: Job queue statistics.
+    """
+    return JSONResponse(content=job_manager.stats())
+
+@app.get("/api/jobs/{job_id}", tags=["Optimization"])
+async def get_job(job_id: str):
+    """
+    Poll a job: its status, the best distance found so far while running, and the final result.
+
+    Args:
+        job_id (str): Id returned by POST /api/jobs.
+
+    Returns:
+        JSONResponse: The job state, or 404 for unknown (or expired) jobs.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}.")
+    return JSONResponse(content=job.to_dict())
+
+@app.get("/api/jobs/{job_id}/events", tags=["Optimization"])
+async def stream_job(job_id: str):
+    """
+    Follow a job as server-sent events: a "progress" event on every change, then one "done" event.
+
+    Args:
+        job_id (str): Id returned by POST /api/jobs.
+
+    Returns:
+        StreamingResponse: A text/event-stream of job states.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}.")
+
+    async def events():
+        version = -1
+        while True:
+            if job.version != version:
+                version = job.version
+                event = "done" if job.status in FINISHED else "progress"
+                yield f"event: {event}\ndata: {json.dumps(job.to_dict())}\n\n"
+                if event == "done":
+                    return
+            await asyncio.sleep(0.1)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+@app.post("/api/batch", tags=["Optimization"])
+async def optimize_batch(payload: Dict[str, Any] = Body(...)):
+    """
+    Optimize many independent route problems, streaming one NDJSON line per problem as it finishes.
+
+    All problems are validated up front in bulk; invalid ones are reported first (status "invalid",
+    with every schema error of the item) and the rest run across the process pool, one in flight
+    per worker.
+
+    Args:
+        payload (Dict[str, Any]): {"problems": [route data, ...]}, each as accepted by `validate_route_data`.
+
+    Returns:
+        StreamingResponse: application/x-ndjson lines {"index", "status", "result", "error" or "errors"}, where
+        "index" is the problem's position in the request; 429 when the pool has no room for the batch.
+    """
+    problems = payload.get("problems")
+    if not isinstance(problems, list) or not problems:
+        raise HTTPException(status_code=422, detail="'problems' must be a non-empty list of route payloads.")
+    if len(problems) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batches are limited to {MAX_BATCH_SIZE} problems.")
+
+    indices, requests, invalid = [], [], []
+    for index, (problem, errors) in enumerate(zip(problems, validate_route_data_bulk(problems))):
+        if errors:
+            invalid.append({"index": index, "status": "invalid", "errors": errors})
+            continue
+        try:
+            requests.append(normalize_route_request(problem, validate=False))
+            indices.append(index)
+        except ValueError as error:
+            invalid.append({"index": index, "status": "invalid", "errors": [{"path": "", "message": str(error)}]})
+    results = None
+    if requests:
+        try:
+            results = job_manager.run_batch(requests)
+        except JobQueueFullError as error:
+            raise _queue_full(error)
+
+    async def lines():
+        try:
+            for line in invalid:
+                yield json.dumps(line) + "\n"
+            if results is None:
+                return
+            async for position, result, error in results:
+                if error is None:
+                    line = {"index": indices[position], "status": "succeeded", "result": result}
+                else:
+                    line = {"index": indices[position], "status": "failed", "error": error}
+                yield json.dumps(line) + "\n"
+        finally:
+            if results is not None:
+                await results.aclose()
+
+    # The background task also runs when the client disconnects before `lines` ever starts.
+    release = BackgroundTask(results.release) if results is not None else None
+    return StreamingResponse(lines(), media_type="application/x-ndjson", background=release)
+
 # Additional endpoints can be defined as needed.
 
 # To run the API, use: uvicorn routes:app --reload
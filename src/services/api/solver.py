@@ -0,0 +1,140 @@
+"""
+Turns validated route payloads into optimization runs for the API.
+
+This module is the bridge between the request schema of `validators.validate_route_data` and the
+Optimizer:
+- normalize_route_request: validates a payload and rewrites it in one canonical form (integer stop
+  ids, rounded coordinates, UTC timestamps, no optional fields with default values), so that
+  requests meaning the same problem have the same fingerprint.
+- solve_route_request: orders the route's stops with simulated annealing started from the best
+  construction heuristic, under a wall-clock budget, and returns a JSON-serializable result.
+
+Both functions are plain module-level functions, so they can run in thread or process pools.
+
+Assumptions:
+- 'route' lists stop ids that index into 'coordinates' (required here, optional in the schema).
+- When 'delivery_windows' has one window per route stop, the first route stop is the depot the
+  route leaves from, and travel times assume a constant speed of `speed_kmh`; otherwise windows
+  are ignored by the solver (they are still part of the fingerprint).
+- The route is open (it does not return to its first stop).
+- Delivery window timestamps without a timezone are in UTC.
+"""
+
+from datetime import timezone
+from typing import Any, Dict, Optional
+import numpy as np
+
+from src.core.distance_matrix import haversine_matrix, route_length
+from src.services.optimization.validators import validate_route_data
+from src.services.optimization.optimizer import Optimizer
+from src.services.optimization.progress import ProgressCallback
+from src.services.optimization.time_windows import (TimeWindows, _parse_timestamp, parse_delivery_windows,
+                                                    travel_time_matrix)
+
+# Coordinates are rounded to 6 decimals (about 0.1 m) before fingerprinting.
+COORDINATE_DECIMALS = 6
+
+def _number(value: float) -> Any:
+    """
+    Integral floats as ints, so that 50 and 50.0 normalize alike.
+    """
+    return int(value) if float(value).is_integer() else float(value)
+
+def _timestamp(value: str) -> str:
+    """
+    A timestamp in UTC; timestamps without a timezone are taken to be UTC already.
+    """
+    moment = _parse_timestamp(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
+
+def normalize_route_request(payload: Dict[str, Any], validate: bool = True) -> Dict[str, Any]:
+    """
+    Validate a route payload and return its canonical form.
+
+    Args:
+        payload (Dict[str, Any]): Request body as accepted by `validate_route_data`, with coordinates.
+        validate (bool): Check the payload against the schema first; pass False only for payloads that
+            were already validated (e.g. in bulk with `validate_route_data_bulk`).
+
+    Returns:
+        Dict[str, Any]: Normalized request.
+
+    Raises:
+        jsonschema.ValidationError: If the payload does not match the schema.
+        ValueError: If coordinates are missing or stop ids are not valid indices into them.
+    """
+    if validate:
+        validate_route_data(payload)
+    if "coordinates" not in payload:
+        raise ValueError("Optimization requests require 'coordinates' for the route's stops.")
+    coordinates = [[round(float(lat), COORDINATE_DECIMALS), round(float(lon), COORDINATE_DECIMALS)]
+                   for lat, lon in payload["coordinates"]]
+    route = [_number(stop) for stop in payload["route"]]
+    invalid = [stop for stop in route if not isinstance(stop, int) or not 0 <= stop < len(coordinates)]
+    if invalid:
+        raise ValueError(f"Route stops {invalid} are not indices into the {len(coordinates)} coordinates.")
+    if len(set(route)) != len(route):
+        raise ValueError("Route stops must be distinct.")
+
+    request = {"route": route, "vehicle_capacity": _number(payload["vehicle_capacity"]), "coordinates": coordinates}
+    if payload.get("delivery_windows"):
+        request["delivery_windows"] = [{"start": _timestamp(window["start"]), "end": _timestamp(window["end"])}
+                                       for window in payload["delivery_windows"]]
+    return request
+
+def solve_route_request(request: Dict[str, Any], time_limit: float = 1.0, speed_kmh: float = 40.0,
+                        progress_callback: Optional[ProgressCallback] = None,
+                        progress_interval: float = 0.25) -> Dict[str, Any]:
+    """
+    Optimize the stop order of a normalized route request.
+
+    Args:
+        request (Dict[str, Any]): Output of `normalize_route_request`.
+        time_limit (float): Wall-clock budget of the optimization, in seconds.
+        speed_kmh (float): Travel speed used to check delivery windows.
+        progress_callback (ProgressCallback, optional): Receives the run's progress events (best fitness
+            so far is the negative route length, plus lateness penalties with delivery windows).
+        progress_interval (float): Minimum seconds between progress events.
+
+    Returns:
+        Dict[str, Any]: The optimized "route" (stop ids), its "distance_km", and the run statistics.
+    """
+    route = np.asarray(request["route"], dtype=np.intp)
+    coordinates = np.asarray(request["coordinates"], dtype=np.float64)[route]
+    windows = request.get("delivery_windows")
+    time_windows = None
+    if windows is not None and len(windows) == len(route):
+        earliest, latest, _ = parse_delivery_windows(windows)
+        time_windows = TimeWindows(travel_time_matrix(haversine_matrix(coordinates), speed_kmh), earliest, latest,
+                                   depot=0, return_to_depot=False)
+    optimizer = Optimizer.from_coordinates(coordinates, time_windows=time_windows)
+    optimizer.progress_callback = progress_callback
+    optimizer.progress_min_interval = progress_interval
+
+    if len(optimizer.gene_pool) < 3:
+        order, stats = list(optimizer.gene_pool), None
+    else:
+        order, _ = optimizer.run_simulated_annealing(construction="best", initial_temp=1.0, min_temp=1e-4,
+                                                     max_iter=5000, time_limit=time_limit)
+        stats = optimizer.last_run_stats.to_dict()
+    if time_windows is not None:
+        order = [0] + list(order)
+    return {
+        "route": route[order].tolist(),
+        "distance_km": route_length(optimizer.distance_matrix, order),
+        "stats": stats,
+    }
+
+# Example usage:
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    sample = {
+        "route": list(range(20)),
+        "vehicle_capacity": 50,
+        "coordinates": np.column_stack([rng.uniform(24.0, 25.0, 20), rng.uniform(54.0, 55.0, 20)]).tolist(),
+    }
+    normalized = normalize_route_request(sample)
+    result = solve_route_request(normalized, time_limit=0.5)
+    print(f"Route: {result['route']} ({result['distance_km']:.1f} km)")
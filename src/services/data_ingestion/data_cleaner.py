@@ -11,49 +11,62 @@ Assumptions:
 - Data validation rules may be extended as needed.
 """
 
+import json
 import logging
+from typing import Any, Dict, Hashable
 
 # Configure logger for this module.
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+    # Example normalization: strip and lowercase string fields. Returns a new dict, so that the
+    # caller's records are left untouched.
+    return {key: value.strip().lower() if isinstance(value, str) else value for key, value in record.items()}
+
+def _record_key(record: Dict[str, Any]) -> Hashable:
+    key = tuple(sorted(record.items()))
+    try:
+        hash(key)
+    except TypeError:
+        # Nested values (e.g. coordinate lists) are not hashable; compare their canonical JSON instead.
+        key = json.dumps(record, sort_keys=True, default=str)
+    return key
+
 def clean_data(raw_data):
     """
     Clean the raw data by removing null entries and duplicates,
     and normalizing values where necessary.
 
+    Records are normalized before duplicates are detected, so records that differ only in the
+    case or surrounding whitespace of string values count as duplicates. Anything that is not a
+    non-empty dict (e.g. a decoded JSON number or list) is dropped with the null entries.
+
     Args:
         raw_data (list): List of raw data records (dicts).
 
     Returns:
-        list: Cleaned list of data records.
+        list: Cleaned list of data records (new dicts), in their original order.
     """
     if not isinstance(raw_data, list):
         logger.error("Raw data is not a list.")
         raise ValueError("Raw data must be provided as a list.")
 
-    # Remove records that are None or empty.
-    cleaned_data = [record for record in raw_data if record]
-    logger.info(f"Removed null/empty records: {len(raw_data) - len(cleaned_data)} entries dropped.")
+    # Remove records that are None, empty, or not records at all.
+    cleaned_data = [_normalize(record) for record in raw_data if isinstance(record, dict) and record]
 
-    # Remove duplicate records (assuming records can be hashed or compared).
+    # Remove duplicate records, keeping the first occurrence.
     unique_data = []
     seen = set()
     for record in cleaned_data:
-        # Create a tuple of sorted key-value pairs for comparison.
-        record_tuple = tuple(sorted(record.items()))
-        if record_tuple not in seen:
-            seen.add(record_tuple)
+        key = _record_key(record)
+        if key not in seen:
+            seen.add(key)
             unique_data.append(record)
-    logger.info(f"Removed duplicates: {len(cleaned_data) - len(unique_data)} entries dropped.")
-
-    # Additional normalization steps can be added here.
-    # Example: Normalize string fields to lowercase.
-    for record in unique_data:
-        for key, value in record.items():
-            if isinstance(value, str):
-                record[key] = value.strip().lower()
 
+    # Debug level: the ingestion pipeline cleans thousands of batches per minute.
+    logger.debug("Cleaned %d records: %d null/empty and %d duplicate entries dropped.", len(raw_data),
+                 len(raw_data) - len(cleaned_data), len(cleaned_data) - len(unique_data))
     return unique_data
 
 # Example usage:
@@ -2,69 +2,300 @@
 Consumes real-time data from Kafka topics and forwards it for processing.
 
 This module uses the kafka-python library to subscribe to one or more Kafka topics.
-It includes robust error handling, logging, and a placeholder processing function
-for incoming messages. In production, the process_message function should be extended
-to integrate with the rest of the data pipeline.
+It includes robust error handling and logging, and forwards the messages to a batch handler
+supplied by the caller (e.g. a bulk write to the downstream store).
+
+Ingestion has to keep up with 1M+ data points per minute, so messages are handled in batches
+by a long-running IngestionService:
+- The consumer is polled for up to `max_records` messages at a time.
+- Each partition's share of a poll becomes one batch, which a bounded worker pool decodes
+  (decode_batch), cleans (data_cleaner.clean_data), and hands to the batch handler. Batches of
+  different partitions are processed concurrently; each partition's batches wait in a queue
+  that one worker at a time works through in offset order, so the handler never sees them out
+  of order and a slow partition does not hold up the others (parallelism is limited to the
+  number of partitions with queued batches).
+- At most `max_in_flight` batches are queued or running; the poll loop waits for a free slot
+  before taking on more work, so that a slow handler cannot make memory grow without bound.
+- Auto-commit is off. A partition's offset is committed only once its batch, and every earlier
+  batch of that partition, has been processed; after a crash, uncommitted records are delivered
+  again (at-least-once).
 
 Assumptions:
 - Kafka cluster and topics are pre-configured.
 - Environment variables or configuration files provide Kafka connection details.
+- Messages are UTF-8 JSON objects; malformed messages are counted and skipped.
+- The batch handler is durable when it returns (e.g. the rows are written) and idempotent
+  enough for redelivered records. A batch that still fails after `retries` retries stops the
+  service, leaving that batch and everything after it uncommitted.
 """
 
 import json
+import time
 import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 from kafka import KafkaConsumer, TopicPartition
 from kafka.errors import KafkaError
+from kafka.structs import OffsetAndMetadata
+
+from src.services.data_ingestion.data_cleaner import clean_data
 
 # Configure logger for this module.
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def process_message(message_value: dict):
+BatchHandler = Callable[[List[Dict[str, Any]]], None]
+
+def decode_batch(values: Sequence[Optional[bytes]]) -> Tuple[List[Any], int]:
     """
-    Process a single message.
-    
+    Decode raw message values as UTF-8 JSON.
+
     Args:
-        message_value (dict): The JSON-decoded message payload.
+        values (Sequence[Optional[bytes]]): Raw message values (None for tombstones).
+
+    Returns:
+        Tuple[List[Any], int]: The decoded payloads, and the number of messages that could not be
+        decoded (and were skipped).
     """
-    # TODO: Integrate with data cleansing, transformation, and downstream pipelines.
-    logger.info(f"Processing message: {message_value}")
+    decoded = []
+    for value in values:
+        try:
+            decoded.append(json.loads(value))
+        except (TypeError, ValueError):
+            # ValueError covers JSONDecodeError and UnicodeDecodeError; TypeError covers tombstones.
+            pass
+    return decoded, len(values) - len(decoded)
+
+def _commit_offset(offset: int) -> OffsetAndMetadata:
+    # kafka-python 2.0 has (offset, metadata); later releases add leader_epoch.
+    if "leader_epoch" in OffsetAndMetadata._fields:
+        return OffsetAndMetadata(offset, "", -1)
+    return OffsetAndMetadata(offset, "")
+
+class IngestionService:
+    def __init__(self, consumer: Any, handler: BatchHandler, max_records: int = 1000,
+                 max_workers: int = 4, max_in_flight: Optional[int] = None, poll_timeout_ms: int = 100,
+                 retries: int = 2):
+        """
+        Initialize the service around a consumer.
+
+        Args:
+            consumer (Any): A KafkaConsumer created with `enable_auto_commit=False` and without a value
+                deserializer (or a stand-in with the same poll/commit API, see memory_broker.py).
+            handler (BatchHandler): Durably processes one batch of cleaned records; offsets are committed
+                once it returns. It may run concurrently for different partitions, but never for two
+                batches of the same partition, which it receives in offset order.
+            max_records (int): Maximum messages fetched per poll.
+            max_workers (int): Worker threads decoding, cleaning, and handling batches.
+            max_in_flight (int, optional): Batches queued or running at once; defaults to twice `max_workers`.
+            poll_timeout_ms (int): Maximum wait of each poll for new messages.
+            retries (int): Retries of a failing handler call before the service stops.
+        """
+        self.consumer = consumer
+        self.handler = handler
+        self.max_records = max_records
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or 2 * max_workers
+        self.poll_timeout_ms = poll_timeout_ms
+        self.retries = retries
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        # Per partition, the uncommitted batches in offset order: (offset to commit after it, future).
+        self._pending: Dict[TopicPartition, Deque[Tuple[int, Future]]] = {}
+        # Per partition, the batches not yet processed: (raw values, future). A partition's lane is
+        # drained by at most one worker at a time, so its batches are handled one by one in order.
+        self._lanes: Dict[TopicPartition, Deque[Tuple[List[Optional[bytes]], Future]]] = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._error = None
+        self.counters = {"polled": 0, "malformed": 0, "dropped": 0, "processed": 0, "batches": 0, "commits": 0}
+        self.elapsed = 0.0
+
+    def _count(self, **increments: int):
+        with self._lock:
+            for name, increment in increments.items():
+                self.counters[name] += increment
+
+    def _process(self, values: List[Optional[bytes]]):
+        """
+        Decode, clean, and handle one batch (runs on a worker thread).
+        """
+        decoded, malformed = decode_batch(values)
+        records = clean_data(decoded)
+        for attempt in range(self.retries + 1):
+            try:
+                self.handler(records)
+                break
+            except Exception as e:
+                if attempt == self.retries:
+                    raise
+                logger.warning(f"Batch handler failed (attempt {attempt + 1}), retrying: {e}")
+        self._count(malformed=malformed, dropped=len(decoded) - len(records), processed=len(records), batches=1)
+
+    def _drain_lane(self, tp: TopicPartition):
+        """
+        Process a partition's queued batches in order until its lane is empty (runs on a worker thread).
+        """
+        error = None
+        while True:
+            with self._lock:
+                values, future = self._lanes[tp][0]
+            if error is not None:
+                # Later batches of a failed partition are not handled; the service is stopping.
+                future.set_exception(error)
+            else:
+                future.set_running_or_notify_cancel()
+                try:
+                    self._process(values)
+                    future.set_result(None)
+                except Exception as e:
+                    error = e
+                    future.set_exception(e)
+            with self._lock:
+                lane = self._lanes[tp]
+                lane.popleft()
+                if not lane:
+                    return
+
+    def _submit(self, executor: ThreadPoolExecutor, tp: TopicPartition, records: Sequence[Any]):
+        # Wait for a free slot, committing finished batches meanwhile.
+        while not self._slots.acquire(timeout=0.05):
+            self._commit_finished()
+        future = Future()
+        future.add_done_callback(lambda done: self._slots.release())
+        self._pending.setdefault(tp, deque()).append((records[-1].offset + 1, future))
+        with self._lock:
+            lane = self._lanes.setdefault(tp, deque())
+            lane.append(([record.value for record in records], future))
+            idle = len(lane) == 1
+        if idle:
+            executor.submit(self._drain_lane, tp)
 
-def consume_messages(topic: str, bootstrap_servers: list, group_id: str = "fleet-optimization-group"):
+    def _commit_finished(self):
+        """
+        Commit every partition up to its first unfinished (or failed) batch.
+        """
+        offsets = {}
+        for tp, batches in self._pending.items():
+            while batches and batches[0][1].done():
+                offset, future = batches[0]
+                error = future.exception()
+                if error is not None:
+                    self._error = self._error or error
+                    break
+                batches.popleft()
+                offsets[tp] = _commit_offset(offset)
+        if not offsets:
+            return
+        try:
+            self.consumer.commit(offsets)
+            self._count(commits=1)
+        except KafkaError as ke:
+            # E.g. the partitions were reassigned; their records will be delivered again.
+            logger.warning(f"Offset commit failed: {ke}")
+
+    def in_flight(self) -> int:
+        """
+        Number of polled batches that have not been committed yet.
+        """
+        return sum(len(batches) for batches in self._pending.values())
+
+    def run(self, idle_timeout: Optional[float] = None):
+        """
+        Poll, process, and commit until `stop` is called (or no messages arrive for `idle_timeout`).
+
+        Batches already polled are finished and committed before returning.
+
+        Args:
+            idle_timeout (float, optional): Return after this many seconds without new messages.
+
+        Raises:
+            Exception: The error of a batch whose handler failed after all retries.
+        """
+        self._stop.clear()
+        start = last_message = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingestion")
+        try:
+            while not self._stop.is_set() and self._error is None:
+                batches = self.consumer.poll(timeout_ms=self.poll_timeout_ms, max_records=self.max_records)
+                for tp, records in batches.items():
+                    if records:
+                        self._submit(executor, tp, records)
+                        self._count(polled=len(records))
+                        last_message = time.perf_counter()
+                self._commit_finished()
+                if (idle_timeout is not None and not self.in_flight()
+                        and time.perf_counter() - last_message >= idle_timeout):
+                    break
+        finally:
+            executor.shutdown(wait=True)
+            self._commit_finished()
+            self.elapsed += time.perf_counter() - start
+        if self._error is not None:
+            raise self._error
+
+    def stop(self):
+        """
+        Ask `run` to return after finishing the batches already polled (e.g. from a signal handler).
+        """
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Record and batch counters, and the processing rate over the time spent in `run`.
+        """
+        with self._lock:
+            stats = dict(self.counters)
+        stats["elapsed"] = self.elapsed
+        stats["records_per_second"] = stats["polled"] / self.elapsed if self.elapsed else 0.0
+        return stats
+
+def consume_messages(topic: str, bootstrap_servers: list, handler: BatchHandler,
+                     group_id: str = "fleet-optimization-group", max_records: int = 1000, max_workers: int = 4):
     """
-    Consume messages from a specified Kafka topic.
+    Consume messages from a specified Kafka topic until interrupted.
 
     Args:
         topic (str): The Kafka topic to subscribe to.
         bootstrap_servers (list): List of Kafka broker addresses.
+        handler (BatchHandler): Durably processes one batch of cleaned records (see IngestionService).
         group_id (str): Consumer group ID for coordinated consumption.
+        max_records (int): Maximum messages fetched per poll.
+        max_workers (int): Worker threads processing batches.
     """
+    consumer = None
     try:
         consumer = KafkaConsumer(
             topic,
             bootstrap_servers=bootstrap_servers,
             group_id=group_id,
             auto_offset_reset="earliest",
-            value_deserializer=lambda m: json.loads(m.decode('utf-8')),
-            consumer_timeout_ms=1000  # Allows the loop to exit gracefully.
+            enable_auto_commit=False,  # Offsets are committed once their batch has been processed.
+            max_poll_records=max_records
         )
         logger.info(f"Subscribed to Kafka topic: {topic}")
-
-        for message in consumer:
-            logger.debug(f"Received message at offset {message.offset}")
-            try:
-                process_message(message.value)
-            except Exception as e:
-                logger.error(f"Error processing message at offset {message.offset}: {e}")
+        service = IngestionService(consumer, handler, max_records=max_records, max_workers=max_workers)
+        try:
+            service.run()
+        except KeyboardInterrupt:
+            logger.info("Interrupted; in-flight batches were processed and committed.")
+        logger.info(f"Ingestion stats: {service.stats()}")
 
     except KafkaError as ke:
         logger.error(f"Kafka error encountered: {ke}")
     finally:
-        consumer.close()
+        if consumer is not None:
+            consumer.close()
         logger.info("Kafka consumer closed.")
 
 # Example usage:
 if __name__ == "__main__":
     TOPIC = "fleet_data"
     BOOTSTRAP_SERVERS = ["localhost:9092"]
-    consume_messages(TOPIC, BOOTSTRAP_SERVERS)
+
+    def print_batch(records):
+        # Stand-in for a bulk write to the downstream store.
+        print(f"Received {len(records)} records, e.g. {records[:1]}")
+
+    consume_messages(TOPIC, BOOTSTRAP_SERVERS, print_batch)
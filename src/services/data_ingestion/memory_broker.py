@@ -0,0 +1,123 @@
+"""
+In-memory stand-in for a Kafka topic and consumer, for local testing and benchmarks.
+
+This module provides:
+- InMemoryConsumer: holds the records of one topic's partitions in memory and implements
+  the parts of the kafka-python `KafkaConsumer` API that the ingestion service uses:
+  `poll(timeout_ms, max_records)`, `commit(offsets)`, `committed(partition)` and `close()`.
+- `send` / `send_batch`: append raw (bytes) message values, the way a producer would. Callers
+  may use them from another thread while the consumer is polling.
+
+Assumptions:
+- A single consumer owns every partition (no consumer group or rebalancing).
+- Consumption starts at offset 0 of every partition, like `auto_offset_reset="earliest"` on a
+  new group.
+"""
+
+import threading
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Sequence
+from kafka import TopicPartition
+
+# The fields of kafka-python's ConsumerRecord that the ingestion pipeline reads.
+MemoryRecord = namedtuple("MemoryRecord", ["topic", "partition", "offset", "value"])
+
+class InMemoryConsumer:
+    def __init__(self, topic: str = "fleet_data", partitions: int = 1):
+        """
+        Initialize an empty topic.
+
+        Args:
+            topic (str): Topic name of the records.
+            partitions (int): Number of partitions.
+        """
+        self.topic = topic
+        self.partitions = [TopicPartition(topic, partition) for partition in range(partitions)]
+        self._logs: Dict[TopicPartition, List[MemoryRecord]] = {tp: [] for tp in self.partitions}
+        self._positions = {tp: 0 for tp in self.partitions}
+        self._committed: Dict[TopicPartition, int] = {}
+        self._next_partition = 0
+        self._fetch_order = list(self.partitions)
+        self._condition = threading.Condition()
+        self.closed = False
+
+    def send(self, value: Optional[bytes], partition: Optional[int] = None):
+        """
+        Append one message (round-robin over partitions unless `partition` is given).
+        """
+        self.send_batch([value], partition)
+
+    def send_batch(self, values: Sequence[Optional[bytes]], partition: Optional[int] = None):
+        """
+        Append messages, spread round-robin over the partitions unless `partition` is given.
+        """
+        with self._condition:
+            for value in values:
+                if partition is None:
+                    tp = self.partitions[self._next_partition]
+                    self._next_partition = (self._next_partition + 1) % len(self.partitions)
+                else:
+                    tp = self.partitions[partition]
+                log = self._logs[tp]
+                log.append(MemoryRecord(tp.topic, tp.partition, len(log), value))
+            self._condition.notify_all()
+
+    def _available(self) -> int:
+        return sum(len(self._logs[tp]) - self._positions[tp] for tp in self.partitions)
+
+    def poll(self, timeout_ms: int = 0, max_records: Optional[int] = None) -> Dict[TopicPartition, List[MemoryRecord]]:
+        """
+        Fetch the next records, waiting up to `timeout_ms` if none are available.
+
+        Args:
+            timeout_ms (int): Maximum wait in milliseconds.
+            max_records (int, optional): Maximum records returned, taken from the partitions in turn.
+
+        Returns:
+            Dict[TopicPartition, List[MemoryRecord]]: Records by partition, in offset order; empty on timeout.
+        """
+        with self._condition:
+            if not self._available():
+                self._condition.wait(timeout_ms / 1000.0)
+            remaining = self._available() if max_records is None else max_records
+            fetched = {}
+            for tp in self._fetch_order:
+                if remaining <= 0:
+                    break
+                start = self._positions[tp]
+                records = self._logs[tp][start:start + remaining]
+                if records:
+                    fetched[tp] = records
+                    self._positions[tp] = start + len(records)
+                    remaining -= len(records)
+            # Start the next fetch at another partition, so that none of them starves.
+            self._fetch_order.append(self._fetch_order.pop(0))
+            return fetched
+
+    def commit(self, offsets: Dict[TopicPartition, Any]):
+        """
+        Record committed offsets (ints or OffsetAndMetadata) by partition.
+        """
+        with self._condition:
+            for tp, offset in offsets.items():
+                self._committed[tp] = getattr(offset, "offset", offset)
+
+    def committed(self, partition: TopicPartition) -> Optional[int]:
+        """
+        Last committed offset of a partition (the offset of the next record to consume), or None.
+        """
+        with self._condition:
+            return self._committed.get(partition)
+
+    def close(self):
+        self.closed = True
+
+# Example usage:
+if __name__ == "__main__":
+    consumer = InMemoryConsumer("fleet_data", partitions=2)
+    consumer.send_batch([b'{"vehicle_id": %d}' % i for i in range(5)])
+    batch = consumer.poll(timeout_ms=100, max_records=3)
+    for tp, records in batch.items():
+        print(tp.partition, [record.offset for record in records])
+        consumer.commit({tp: records[-1].offset + 1})
+    print({tp.partition: consumer.committed(tp) for tp in consumer.partitions})
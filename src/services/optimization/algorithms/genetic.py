@@ -2,23 +2,50 @@
 Implements Genetic Algorithm for route optimization.
 
 This module provides a GeneticAlgorithm class that supports:
-- Initialization of a population from a gene pool.
+- Initialization of a population from a gene pool, optionally seeded with constructed routes
+  (see `construction.py`) so early generations start from good tours.
 - Selection of parents via tournament selection.
-- Crossover using an ordered crossover (OX) approach.
-- Mutation through random gene swaps.
-- Iterative evolution to produce improved solutions over a set number of generations.
+- Crossover using ordered (OX), partially mapped (PMX), or edge recombination (ERX) crossover, each
+  building a child in linear time (see `crossover.py`).
+- Mutation through random gene swaps, optionally restricted by k-nearest candidate lists (see
+  `src/core/spatial_index.py`) to moving a gene next to one of its nearby genes.
+- Iterative evolution to produce improved solutions over a set number of generations, with optional
+  wall-clock deadline and stagnation-based early stopping.
+- Optional sampled progress events (see `progress.py`) instead of per-generation printing.
+- Fitness memoization: each individual is scored exactly once per generation, with an optional
+  bounded cross-generation cache keyed by the permutation.
+- Parallel evaluation: an optional executor spreads fitness evaluation across processes or threads.
+- Batch mode: with a `batch_fitness_fn`, the population is stored as a 2-D integer array
+  (population x chromosome_length) and selection, crossover, mutation, and scoring are vectorized.
 
 Assumptions:
 - The gene pool represents available route nodes.
 - A chromosome is represented as a permutation (ordering) of genes.
 - The fitness function is user-defined and evaluates route quality (e.g., lower distance equals higher fitness).
+- In batch mode genes are non-negative integers (e.g., distance-matrix indices).
 """
 
 import random
-from typing import List, Callable, Tuple
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import List, Callable, Tuple, Optional, Union
+import numpy as np
+
+from src.services.optimization.parallel import parallel_map, parallel_map_batches
+from src.services.optimization.stopping import StoppingCriteria, RunStats, COMPLETED
+from src.services.optimization.progress import ProgressReporter
+from src.services.optimization.algorithms.crossover import (
+    CROSSOVER_METHODS, ordered_crossover, pmx_crossover, edge_recombination, batch_ordered_crossover,
+    batch_pmx_crossover,
+)
+
+Population = Union[List[List[int]], np.ndarray]
 
 class GeneticAlgorithm:
-    def __init__(self, population_size: int, mutation_rate: float, crossover_rate: float, fitness_fn: Callable[[List[int]], float]):
+    def __init__(self, population_size: int, mutation_rate: float, crossover_rate: float, fitness_fn: Callable[[List[int]], float],
+                 fitness_cache_size: int = 0, batch_fitness_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 executor: Optional[Executor] = None, crossover_method: str = "ox",
+                 seed_solutions: Optional[List[List[int]]] = None, neighbor_lists: Optional[np.ndarray] = None):
         """
         Initialize the Genetic Algorithm.
         
@@ -27,45 +54,155 @@ class GeneticAlgorithm:
             mutation_rate (float): Probability of mutation for each gene.
             crossover_rate (float): Probability of performing crossover.
             fitness_fn (Callable[[List[int]], float]): Function to evaluate the fitness of a chromosome.
+            fitness_cache_size (int): Maximum number of chromosomes whose fitness is remembered across
+                generations (LRU). 0 disables the cross-generation cache.
+            batch_fitness_fn (Callable[[np.ndarray], np.ndarray], optional): Scores a whole population given as
+                a 2-D integer array and returns a 1-D fitness array. Enables the vectorized batch mode.
+            executor (Executor, optional): Pool used to evaluate the population in parallel. Process pools
+                require a picklable fitness function; thread pools suit GIL-releasing batch fitness.
+            crossover_method (str): "ox" (ordered), "pmx" (partially mapped), or "erx" (edge recombination).
+            seed_solutions (List[List[int]], optional): Chromosomes placed in the initial population before
+                the random individuals (at most population_size are used).
+            neighbor_lists (np.ndarray, optional): Candidate neighbors per gene, shape (N, k). When given, a
+                mutated gene is swapped with the gene beside one of its candidates instead of a random one.
         """
+        if crossover_method not in CROSSOVER_METHODS:
+            raise ValueError(f"Unknown crossover method {crossover_method!r}; expected one of {CROSSOVER_METHODS}.")
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.fitness_fn = fitness_fn
+        self.fitness_cache_size = fitness_cache_size
+        self._fitness_cache = OrderedDict()
+        self.batch_fitness_fn = batch_fitness_fn
+        self.executor = executor
+        self.crossover_method = crossover_method
+        self.seed_solutions = [list(seed) for seed in seed_solutions or []]
+        self.neighbor_lists = None
+        if neighbor_lists is not None and np.asarray(neighbor_lists).shape[1] > 0:
+            self.neighbor_lists = np.asarray(neighbor_lists, dtype=np.intp)
+        self.evaluations = 0  # Number of chromosomes scored by fitness_fn or batch_fitness_fn.
+        self.cache_hits = 0
+        self._rng = None
+        self.last_run_stats = None
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """
+        NumPy generator used by batch mode, seeded from `random` so `random.seed` keeps runs reproducible.
+        """
+        if self._rng is None:
+            self._rng = np.random.default_rng(random.getrandbits(64))
+        return self._rng
+
+    def evaluate_population(self, population: Population) -> Union[List[float], np.ndarray]:
+        """
+        Score every chromosome in the population once.
+
+        Scores are looked up in the cross-generation cache first when it is enabled, so elites and
+        offspring that survive unchanged are not re-evaluated. In batch mode the whole population is
+        scored in a single `batch_fitness_fn` call.
+
+        Args:
+            population (Population): Population of chromosomes.
 
-    def initialize_population(self, gene_pool: List[int], chromosome_length: int) -> List[List[int]]:
+        Returns:
+            Union[List[float], np.ndarray]: Fitness of each chromosome, aligned with the population.
+        """
+        if self.batch_fitness_fn is not None:
+            self.evaluations += len(population)
+            population = np.asarray(population)
+            if self.executor is None:
+                return np.asarray(self.batch_fitness_fn(population), dtype=np.float64)
+            slices = parallel_map_batches(self.executor, self.batch_fitness_fn, population)
+            return np.concatenate([np.asarray(part, dtype=np.float64) for part in slices])
+
+        if self.fitness_cache_size <= 0:
+            self.evaluations += len(population)
+            return [float(score) for score in parallel_map(self.executor, self.fitness_fn, population)]
+
+        cache = self._fitness_cache
+        fitnesses = [None] * len(population)
+        pending = OrderedDict()  # Uncached chromosome key -> positions in the population.
+        for i, chromosome in enumerate(population):
+            key = tuple(chromosome)
+            fitness = cache.get(key)
+            if fitness is not None:
+                self.cache_hits += 1
+                cache.move_to_end(key)
+                fitnesses[i] = fitness
+            elif key in pending:
+                self.cache_hits += 1
+                pending[key].append(i)
+            else:
+                pending[key] = [i]
+
+        chromosomes = [population[positions[0]] for positions in pending.values()]
+        scores = parallel_map(self.executor, self.fitness_fn, chromosomes)
+        self.evaluations += len(chromosomes)
+        for (key, positions), score in zip(pending.items(), scores):
+            fitness = float(score)
+            cache[key] = fitness
+            for i in positions:
+                fitnesses[i] = fitness
+        while len(cache) > self.fitness_cache_size:
+            cache.popitem(last=False)
+        return fitnesses
+
+    def initialize_population(self, gene_pool: List[int], chromosome_length: int) -> Population:
         """
         Create an initial population of chromosomes.
 
+        The seed solutions, if any, come first; the remaining individuals are random permutations.
+
         Args:
             gene_pool (List[int]): List of available genes (e.g., route nodes).
             chromosome_length (int): Number of genes per chromosome.
         
         Returns:
-            List[List[int]]: A list containing the initial population.
+            Population: The initial population (a 2-D integer array in batch mode).
         """
-        population = []
-        for _ in range(self.population_size):
+        seeds = self.seed_solutions[:self.population_size]
+        if any(len(seed) != chromosome_length for seed in seeds):
+            raise ValueError("Seed solutions must have chromosome_length genes.")
+        if self.batch_fitness_fn is not None:
+            # Random permutations via argsort of uniform keys, one row per individual.
+            keys = self.rng.random((self.population_size - len(seeds), len(gene_pool)))
+            order = np.argsort(keys, axis=1)[:, :chromosome_length]
+            population = np.asarray(gene_pool, dtype=np.intp)[order]
+            if seeds:
+                population = np.concatenate([np.asarray(seeds, dtype=np.intp), population])
+            return population
+
+        population = [list(seed) for seed in seeds]
+        for _ in range(self.population_size - len(seeds)):
             # Generate a random permutation from the gene pool.
             chromosome = random.sample(gene_pool, chromosome_length)
             population.append(chromosome)
         return population
 
-    def tournament_selection(self, population: List[List[int]], tournament_size: int = 3) -> List[int]:
+    def tournament_selection(self, population: List[List[int]], tournament_size: int = 3,
+                             fitnesses: Optional[List[float]] = None) -> List[int]:
         """
         Select one individual from the population using tournament selection.
 
         Args:
             population (List[List[int]]): Current population of chromosomes.
             tournament_size (int): Number of individuals competing in the tournament.
+            fitnesses (List[float], optional): Precomputed fitness of each individual; if None,
+                only the tournament participants are evaluated.
         
         Returns:
             List[int]: The selected chromosome.
         """
-        tournament = random.sample(population, tournament_size)
-        # Sort based on fitness (higher fitness is better).
-        tournament.sort(key=self.fitness_fn, reverse=True)
-        return tournament[0]
+        tournament = random.sample(range(len(population)), tournament_size)
+        if fitnesses is None:
+            scores = self.evaluate_population([population[i] for i in tournament])
+        else:
+            scores = [fitnesses[i] for i in tournament]
+        # Higher fitness is better; ties go to the first participant drawn.
+        winner = max(range(tournament_size), key=scores.__getitem__)
+        return population[tournament[winner]]
 
     def crossover(self, parent1: List[int], parent2: List[int]) -> Tuple[List[int], List[int]]:
         """
@@ -79,112 +216,217 @@ class GeneticAlgorithm:
             Tuple[List[int], List[int]]: Two offspring chromosomes.
         """
         if random.random() < self.crossover_rate:
+            if self.crossover_method == "erx":
+                return edge_recombination(parent1, parent2), edge_recombination(parent2, parent1)
             size = len(parent1)
             point1 = random.randint(0, size - 2)
             point2 = random.randint(point1 + 1, size - 1)
-            child1 = self.__ordered_crossover(parent1, parent2, point1, point2)
-            child2 = self.__ordered_crossover(parent2, parent1, point1, point2)
+            operator = pmx_crossover if self.crossover_method == "pmx" else ordered_crossover
+            child1 = operator(parent1, parent2, point1, point2)
+            child2 = operator(parent2, parent1, point1, point2)
             return child1, child2
         else:
             # No crossover occurs; return copies of the parents.
             return parent1.copy(), parent2.copy()
 
-    def __ordered_crossover(self, parent1: List[int], parent2: List[int], point1: int, point2: int) -> List[int]:
-        """
-        Helper method to perform ordered crossover (OX).
-
-        Args:
-            parent1 (List[int]): Chromosome to extract the segment from.
-            parent2 (List[int]): Chromosome to fill remaining genes.
-            point1 (int): Start index of crossover segment.
-            point2 (int): End index of crossover segment.
-        
-        Returns:
-            List[int]: Offspring chromosome after ordered crossover.
-        """
-        child = [None] * len(parent1)
-        # Copy a segment from parent1.
-        child[point1:point2] = parent1[point1:point2]
-        current_index = point2
-        # Fill in genes from parent2 that are not already in the child.
-        for gene in parent2:
-            if gene not in child:
-                if current_index >= len(parent1):
-                    current_index = 0
-                child[current_index] = gene
-                current_index += 1
-        return child
-
     def mutate(self, chromosome: List[int]) -> List[int]:
         """
         Mutate a chromosome by swapping two genes based on the mutation rate.
 
+        With candidate lists, gene i is swapped with the gene beside (before or after) a random
+        candidate neighbor of gene i, falling back to a random position if the candidate is absent.
+
         Args:
             chromosome (List[int]): Chromosome to mutate.
         
         Returns:
             List[int]: Mutated chromosome.
         """
+        if self.neighbor_lists is not None:
+            return self._mutate_focused(chromosome)
         for i in range(len(chromosome)):
             if random.random() < self.mutation_rate:
                 j = random.randint(0, len(chromosome) - 1)
                 chromosome[i], chromosome[j] = chromosome[j], chromosome[i]
         return chromosome
 
-    def evolve(self, population: List[List[int]], gene_pool: List[int]) -> List[List[int]]:
+    def _mutate_focused(self, chromosome: List[int]) -> List[int]:
+        size = len(chromosome)
+        position = None  # Gene -> index, built on the first mutation.
+        for i in range(size):
+            if random.random() < self.mutation_rate:
+                if position is None:
+                    position = {gene: index for index, gene in enumerate(chromosome)}
+                candidates = self.neighbor_lists[chromosome[i]]
+                target = position.get(int(candidates[random.randrange(len(candidates))]))
+                if target is None:
+                    j = random.randint(0, size - 1)
+                else:
+                    j = min(max(target + (1 if random.random() < 0.5 else -1), 0), size - 1)
+                chromosome[i], chromosome[j] = chromosome[j], chromosome[i]
+                position[chromosome[i]], position[chromosome[j]] = i, j
+        return chromosome
+
+    def _evolve_batch(self, population: np.ndarray, fitnesses: np.ndarray) -> np.ndarray:
+        """
+        Vectorized evolution step for batch mode.
+
+        Tournament selection draws contestants with replacement, OX or PMX crossover is applied to all
+        selected pairs at once (ERX pair by pair), and swap mutation is applied column by column
+        across all children.
+
+        Args:
+            population (np.ndarray): Population of shape (P, L).
+            fitnesses (np.ndarray): Fitness of each individual, shape (P,).
+
+        Returns:
+            np.ndarray: New population of shape (population_size, L).
+        """
+        rng = self.rng
+        length = population.shape[1]
+        num_children = self.population_size - 1
+        num_pairs = (num_children + 1) // 2
+
+        contestants = rng.integers(0, len(population), size=(2 * num_pairs, 3))
+        winners = contestants[np.arange(2 * num_pairs), np.argmax(fitnesses[contestants], axis=1)]
+        parents1 = population[winners[:num_pairs]]
+        parents2 = population[winners[num_pairs:]]
+
+        children1 = parents1.copy()
+        children2 = parents2.copy()
+        crossing = np.nonzero(rng.random(num_pairs) < self.crossover_rate)[0]
+        if crossing.size and length > 1 and self.crossover_method == "erx":
+            for i in crossing:
+                p1, p2 = parents1[i].tolist(), parents2[i].tolist()
+                children1[i] = edge_recombination(p1, p2, rng.random)
+                children2[i] = edge_recombination(p2, p1, rng.random)
+        elif crossing.size and length > 1:
+            points1 = rng.integers(0, length - 1, size=crossing.size)
+            points2 = rng.integers(points1 + 1, length)
+            p1, p2 = parents1[crossing], parents2[crossing]
+            operator = batch_pmx_crossover if self.crossover_method == "pmx" else batch_ordered_crossover
+            children1[crossing] = operator(p1, p2, points1, points2)
+            children2[crossing] = operator(p2, p1, points1, points2)
+        children = np.concatenate([children1, children2])[:num_children]
+
+        # Swap mutation: each gene is swapped with a random position with probability mutation_rate
+        # (with candidate lists, with the position beside one of its candidate neighbors).
+        mutating = rng.random(children.shape) < self.mutation_rate
+        lists = self.neighbor_lists
+        if lists is not None:
+            position = np.full((len(children), max(int(children.max()) + 1, lists.shape[0])), -1, dtype=np.intp)
+            position[np.arange(len(children))[:, np.newaxis], children] = np.arange(length)
+        for col in np.nonzero(mutating.any(axis=0))[0]:
+            rows = np.nonzero(mutating[:, col])[0]
+            targets = rng.integers(0, length, size=rows.size)
+            if lists is not None:
+                genes = children[rows, col]
+                near = position[rows, lists[genes, rng.integers(0, lists.shape[1], size=rows.size)]]
+                beside = np.clip(near + np.where(rng.random(rows.size) < 0.5, 1, -1), 0, length - 1)
+                targets = np.where(near >= 0, beside, targets)
+            swapped = children[rows, targets]
+            children[rows, targets] = children[rows, col]
+            children[rows, col] = swapped
+            if lists is not None:
+                position[rows, children[rows, col]] = col
+                position[rows, children[rows, targets]] = targets
+
+        # Apply elitism: preserve the best individual.
+        elite = population[int(np.argmax(fitnesses))]
+        return np.concatenate([elite[np.newaxis, :], children])
+
+    def evolve(self, population: Population, gene_pool: List[int],
+               fitnesses: Optional[Union[List[float], np.ndarray]] = None) -> Population:
         """
         Evolve the current population by applying selection, crossover, and mutation.
 
         Args:
-            population (List[List[int]]): Current population of chromosomes.
+            population (Population): Current population of chromosomes.
             gene_pool (List[int]): Gene pool for validation.
+            fitnesses (Union[List[float], np.ndarray], optional): Precomputed fitness of each individual;
+                evaluated here if None.
         
         Returns:
-            List[List[int]]: New population after evolution.
+            Population: New population after evolution.
         """
+        if fitnesses is None:
+            fitnesses = self.evaluate_population(population)
+        if self.batch_fitness_fn is not None:
+            return self._evolve_batch(np.asarray(population), np.asarray(fitnesses))
         new_population = []
         # Apply elitism: preserve the best individual.
-        population.sort(key=self.fitness_fn, reverse=True)
+        order = sorted(range(len(population)), key=fitnesses.__getitem__, reverse=True)
+        population[:] = [population[i] for i in order]
+        fitnesses = [fitnesses[i] for i in order]
         best_individual = population[0].copy()
         new_population.append(best_individual)
 
         # Generate rest of the new population.
         while len(new_population) < self.population_size:
-            parent1 = self.tournament_selection(population)
-            parent2 = self.tournament_selection(population)
+            parent1 = self.tournament_selection(population, fitnesses=fitnesses)
+            parent2 = self.tournament_selection(population, fitnesses=fitnesses)
             child1, child2 = self.crossover(parent1, parent2)
             new_population.append(self.mutate(child1))
             if len(new_population) < self.population_size:
                 new_population.append(self.mutate(child2))
         return new_population
 
-    def run(self, gene_pool: List[int], chromosome_length: int, generations: int) -> Tuple[List[int], float]:
+    def run(self, gene_pool: List[int], chromosome_length: int, generations: int,
+            stopping: Optional[StoppingCriteria] = None,
+            progress: Optional[ProgressReporter] = None) -> Tuple[List[int], float]:
         """
         Run the genetic algorithm for a specified number of generations.
 
+        The run stops early, returning the best-so-far chromosome, when the stopping criteria's
+        deadline passes or the best fitness stagnates. Details are recorded in `last_run_stats`.
+
         Args:
             gene_pool (List[int]): Available genes (e.g., route nodes).
             chromosome_length (int): Length of each chromosome.
-            generations (int): Number of generations to evolve.
+            generations (int): Maximum number of generations to evolve.
+            stopping (StoppingCriteria, optional): Deadline and stagnation criteria, checked every generation.
+            progress (ProgressReporter, optional): Receives sampled per-generation progress events.
         
         Returns:
             Tuple[List[int], float]: The best chromosome found and its corresponding fitness score.
         """
+        stopping = stopping or StoppingCriteria()
+        if stopping.started_at is None:
+            stopping.start()
+        evaluations_before = self.evaluations
+        stop_reason = COMPLETED
+        completed = 0
+
         population = self.initialize_population(gene_pool, chromosome_length)
+        fitnesses = self.evaluate_population(population)
         best_chromosome = None
         best_fitness = float('-inf')
 
         for gen in range(generations):
-            population = self.evolve(population, gene_pool)
-            current_best = max(population, key=self.fitness_fn)
-            current_fitness = self.fitness_fn(current_best)
+            population = self.evolve(population, gene_pool, fitnesses)
+            fitnesses = self.evaluate_population(population)
+            best_index = int(np.argmax(fitnesses))
+            current_best = population[best_index]
+            current_fitness = fitnesses[best_index]
             if current_fitness > best_fitness:
                 best_chromosome = current_best.copy()
                 best_fitness = current_fitness
-            # Debug output for each generation.
-            print(f"Generation {gen + 1}: Best Fitness = {best_fitness:.4f}")
+            completed = gen + 1
+            if progress is not None:
+                progress.report(completed, best_fitness, self.evaluations - evaluations_before, stopping.elapsed())
+            reason = stopping.update(best_fitness)
+            if reason is not None and completed < generations:
+                stop_reason = reason
+                break
 
-        return best_chromosome, best_fitness
+        self.last_run_stats = RunStats("genetic", completed, self.evaluations - evaluations_before,
+                                       stopping.elapsed(), float(best_fitness), stop_reason)
+        if progress is not None:
+            stats = self.last_run_stats
+            progress.report(completed, best_fitness, stats.evaluations, stats.elapsed, final=True)
+        if isinstance(best_chromosome, np.ndarray):
+            best_chromosome = best_chromosome.tolist()
+        return best_chromosome, float(best_fitness)
 
 # Example usage:
 if __name__ == "__main__":
@@ -0,0 +1,247 @@
+"""
+Implements an island-model Genetic Algorithm across worker processes.
+
+This module provides an IslandModel class that:
+- Evolves N independent sub-populations ("islands"), each in its own process, using the
+  GeneticAlgorithm operators (`evolve`, `crossover`, `mutate`).
+- Every K generations, copies each island's elites into shared memory and migrates them to the
+  next island in a ring, replacing that island's worst individuals.
+- Returns the best chromosome found on any island.
+- Stops early at a wall-clock deadline shared by all islands, or when an island's best fitness
+  stagnates; the first island to stop breaks the migration barrier so the others stop too.
+
+Separate islands keep diversity higher than one large population of the same total size, and
+the work is spread over multiple cores.
+
+Assumptions:
+- Genes are integers (they are exchanged through int64 shared-memory arrays).
+- The fitness function is picklable when a non-fork start method is used.
+"""
+
+import random
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from typing import List, Callable, Tuple, Optional
+import numpy as np
+
+from src.services.optimization.algorithms.genetic import GeneticAlgorithm
+from src.services.optimization.algorithms.crossover import CROSSOVER_METHODS
+from src.services.optimization.stopping import StoppingCriteria, RunStats, COMPLETED, TIME_LIMIT, STAGNATION
+from src.services.optimization.progress import ProgressReporter
+
+# Reasons an island stopped, stored as codes in shared memory. INTERRUPTED means another island
+# broke the migration barrier.
+INTERRUPTED = "interrupted"
+_REASONS = (COMPLETED, TIME_LIMIT, STAGNATION, INTERRUPTED)
+
+def _island_worker(index: int, seed: int, ga_kwargs: dict, gene_pool: List[int], chromosome_length: int,
+                   generations: int, migration_interval: int, migrants: int, num_islands: int,
+                   genes_name: str, scores_name: str, stats_name: str, barrier, timeout: Optional[float],
+                   deadline: Optional[float], patience: Optional[int]):
+    """
+    Evolve one island and exchange elites with its neighbors through shared memory.
+
+    Shared layout: genes[island, slot, gene] and scores[island, slot], where slots
+    0..migrants-1 hold outgoing migrants and slot `migrants` holds the island's final best;
+    stats[island] holds (generations, evaluations, stop reason code).
+    """
+    random.seed(seed)
+    genes_shm = shared_memory.SharedMemory(name=genes_name)
+    scores_shm = shared_memory.SharedMemory(name=scores_name)
+    stats_shm = shared_memory.SharedMemory(name=stats_name)
+    try:
+        genes = np.ndarray((num_islands, migrants + 1, chromosome_length), dtype=np.int64, buffer=genes_shm.buf)
+        scores = np.ndarray((num_islands, migrants + 1), dtype=np.float64, buffer=scores_shm.buf)
+        stats = np.ndarray((num_islands, 3), dtype=np.float64, buffer=stats_shm.buf)
+
+        stopping = StoppingCriteria(patience=patience).start(deadline)
+        ga = GeneticAlgorithm(**ga_kwargs)
+        population = ga.initialize_population(gene_pool, chromosome_length)
+        fitnesses = ga.evaluate_population(population)
+        best_index = int(np.argmax(fitnesses))
+        best_chromosome, best_fitness = list(population[best_index]), float(fitnesses[best_index])
+        stop_reason = COMPLETED
+
+        completed = 0
+        for gen in range(1, generations + 1):
+            population = ga.evolve(population, gene_pool, fitnesses)
+            fitnesses = ga.evaluate_population(population)
+            completed = gen
+            current = int(np.argmax(fitnesses))
+            if fitnesses[current] > best_fitness:
+                best_chromosome, best_fitness = list(population[current]), float(fitnesses[current])
+
+            reason = stopping.update(best_fitness)
+            if reason is not None and gen < generations:
+                stop_reason = reason
+                barrier.abort()  # Release islands waiting (now or later) at a migration barrier.
+                break
+
+            if num_islands > 1 and gen % migration_interval == 0 and gen < generations:
+                ranked = np.argsort(np.asarray(fitnesses), kind="stable")
+                elites = ranked[::-1][:migrants]
+                for slot, i in enumerate(elites):
+                    genes[index, slot] = population[i]
+                    scores[index, slot] = fitnesses[i]
+                try:
+                    barrier.wait(timeout)  # All islands have published their elites.
+                    source = (index - 1) % num_islands
+                    incoming_genes = genes[source, :migrants].copy()
+                    incoming_scores = scores[source, :migrants].copy()
+                    barrier.wait(timeout)  # All islands have read before anyone overwrites.
+                except threading.BrokenBarrierError:
+                    stop_reason = INTERRUPTED
+                    break
+
+                for slot, i in enumerate(ranked[:migrants]):
+                    if isinstance(population, np.ndarray):
+                        population[i] = incoming_genes[slot]
+                    else:
+                        population[i] = incoming_genes[slot].tolist()
+                    fitnesses[i] = float(incoming_scores[slot])
+
+        genes[index, migrants] = best_chromosome
+        scores[index, migrants] = best_fitness
+        stats[index] = (completed, ga.evaluations, _REASONS.index(stop_reason))
+    finally:
+        genes = scores = stats = None  # Release views before the shared memory is closed.
+        genes_shm.close()
+        scores_shm.close()
+        stats_shm.close()
+
+class IslandModel:
+    def __init__(self, num_islands: int, population_size: int, mutation_rate: float, crossover_rate: float,
+                 fitness_fn: Callable[[List[int]], float], migration_interval: int = 10, migrants: int = 2,
+                 batch_fitness_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 mp_context: Optional[str] = None, timeout: Optional[float] = 600.0, crossover_method: str = "ox",
+                 neighbor_lists: Optional[np.ndarray] = None):
+        """
+        Initialize the island model.
+
+        Args:
+            num_islands (int): Number of sub-populations, each evolved in its own process.
+            population_size (int): Individuals per island.
+            mutation_rate (float): Probability of mutation for each gene.
+            crossover_rate (float): Probability of performing crossover.
+            fitness_fn (Callable[[List[int]], float]): Function to evaluate the fitness of a chromosome.
+            migration_interval (int): Generations between migrations (K).
+            migrants (int): Elites sent from each island to the next per migration.
+            batch_fitness_fn (Callable[[np.ndarray], np.ndarray], optional): Enables GA batch mode on each island.
+            mp_context (str, optional): Multiprocessing start method (e.g. "spawn"); defaults to the platform's.
+            timeout (float, optional): Seconds an island waits at a migration barrier before giving up.
+            crossover_method (str): "ox", "pmx", or "erx" (see GeneticAlgorithm).
+            neighbor_lists (np.ndarray, optional): Candidate neighbors per gene for focused mutation
+                (see GeneticAlgorithm).
+        """
+        if migrants >= population_size:
+            raise ValueError("migrants must be smaller than population_size.")
+        if crossover_method not in CROSSOVER_METHODS:
+            raise ValueError(f"Unknown crossover method {crossover_method!r}; expected one of {CROSSOVER_METHODS}.")
+        self.num_islands = num_islands
+        self.migration_interval = max(1, migration_interval)
+        self.migrants = migrants
+        self.mp_context = mp_context
+        self.timeout = timeout
+        self.ga_kwargs = {
+            "population_size": population_size,
+            "mutation_rate": mutation_rate,
+            "crossover_rate": crossover_rate,
+            "fitness_fn": fitness_fn,
+            "batch_fitness_fn": batch_fitness_fn,
+            "crossover_method": crossover_method,
+            "neighbor_lists": neighbor_lists,
+        }
+        self.last_run_stats = None
+
+    def run(self, gene_pool: List[int], chromosome_length: int, generations: int,
+            stopping: Optional[StoppingCriteria] = None,
+            progress: Optional[ProgressReporter] = None) -> Tuple[List[int], float]:
+        """
+        Evolve all islands in parallel and return the overall best chromosome.
+
+        Every island applies the stopping criteria's deadline and its patience (in generations) to
+        its own best fitness; the first island to stop ends the run for all of them.
+
+        Args:
+            gene_pool (List[int]): Available genes (e.g., route nodes).
+            chromosome_length (int): Length of each chromosome.
+            generations (int): Number of generations each island evolves.
+            stopping (StoppingCriteria, optional): Deadline and stagnation criteria.
+            progress (ProgressReporter, optional): Receives the final progress event; islands run in
+                other processes and do not report per generation.
+
+        Returns:
+            Tuple[List[int], float]: The best chromosome found and its fitness.
+        """
+        stopping = stopping or StoppingCriteria()
+        if stopping.started_at is None:
+            stopping.start()
+        ctx = multiprocessing.get_context(self.mp_context)
+        slots = self.migrants + 1
+        genes_shm = shared_memory.SharedMemory(create=True, size=8 * self.num_islands * slots * chromosome_length)
+        scores_shm = shared_memory.SharedMemory(create=True, size=8 * self.num_islands * slots)
+        stats_shm = shared_memory.SharedMemory(create=True, size=8 * self.num_islands * 3)
+        try:
+            scores = np.ndarray((self.num_islands, slots), dtype=np.float64, buffer=scores_shm.buf)
+            scores[:] = -np.inf
+            barrier = ctx.Barrier(self.num_islands)
+            processes = [
+                ctx.Process(
+                    target=_island_worker,
+                    args=(index, random.getrandbits(32), self.ga_kwargs, list(gene_pool), chromosome_length,
+                          generations, self.migration_interval, self.migrants, self.num_islands,
+                          genes_shm.name, scores_shm.name, stats_shm.name, barrier, self.timeout,
+                          stopping.deadline, stopping.patience),
+                    daemon=True,
+                )
+                for index in range(self.num_islands)
+            ]
+            for process in processes:
+                process.start()
+            pending = list(processes)
+            while pending:
+                wait([process.sentinel for process in pending])
+                for process in [p for p in pending if not p.is_alive()]:
+                    pending.remove(process)
+                    process.join()
+                    if process.exitcode != 0:
+                        # Release the other islands if they are blocked at a migration barrier.
+                        barrier.abort()
+            failed = [p.exitcode for p in processes if p.exitcode != 0]
+            if failed:
+                raise RuntimeError(f"{len(failed)} island process(es) failed with exit codes {failed}.")
+
+            genes = np.ndarray((self.num_islands, slots, chromosome_length), dtype=np.int64, buffer=genes_shm.buf)
+            best_island = int(np.argmax(scores[:, self.migrants]))
+            best_chromosome = genes[best_island, self.migrants].tolist()
+            best_fitness = float(scores[best_island, self.migrants])
+            stats = np.ndarray((self.num_islands, 3), dtype=np.float64, buffer=stats_shm.buf)
+            reasons = [_REASONS[int(code)] for code in stats[:, 2]]
+            # Report why the run ended: an island's own reason wins over the interruptions it caused.
+            stop_reason = next((r for r in reasons if r not in (COMPLETED, INTERRUPTED)), reasons[0])
+            self.last_run_stats = RunStats("island_genetic", int(stats[:, 0].max()), int(stats[:, 1].sum()),
+                                           stopping.elapsed(), best_fitness, stop_reason)
+            if progress is not None:
+                run_stats = self.last_run_stats
+                progress.report(run_stats.iterations, best_fitness, run_stats.evaluations, run_stats.elapsed,
+                                final=True)
+            del genes, scores, stats  # Release views before the shared memory is closed.
+            return best_chromosome, best_fitness
+        finally:
+            for shm in (genes_shm, scores_shm, stats_shm):
+                shm.close()
+                shm.unlink()
+
+# Example usage:
+if __name__ == "__main__":
+    def fitness(chromosome: List[int]) -> float:
+        # Dummy fitness: penalize large jumps between consecutive stops.
+        return -float(sum(abs(a - b) for a, b in zip(chromosome, chromosome[1:])))
+
+    islands = IslandModel(num_islands=4, population_size=30, mutation_rate=0.05, crossover_rate=0.8,
+                          fitness_fn=fitness, migration_interval=5, migrants=2)
+    best_route, best_score = islands.run(list(range(30)), 30, generations=40)
+    print("Best Route Found:", best_route)
+    print("Best Fitness Score:", best_score)
@@ -0,0 +1,251 @@
+"""
+Move-based route neighborhoods with constant-time cost deltas.
+
+This module provides a TourNeighborhood class used by SimulatedAnnealing that:
+- Proposes batches of swap, 2-opt (segment reversal), and Or-opt (segment relocation) moves.
+- Computes each move's change in route length from a distance matrix in O(1), vectorized over
+  the whole batch, without copying the route.
+- Materializes a move on the route only when it is accepted.
+- Optionally focuses proposals with k-nearest candidate lists (see `src/core/spatial_index.py`):
+  each move picks a stop and one of its candidate neighbors and brings the two next to each other,
+  so proposals stay between nearby stops instead of pairing stops drawn uniformly from the route.
+
+Internally the route is kept as a closed tour whose first position never moves. Open routes are
+handled by prepending a dummy node at zero distance from every stop, so the same formulas apply.
+
+Assumptions:
+- Route nodes are integer indices into the distance matrix.
+- The distance matrix is symmetric (2-opt reverses segments in place); swap and Or-opt deltas
+  are exact for asymmetric matrices as well.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+MOVE_TYPES = ("swap", "two_opt", "or_opt")
+
+def prepare_tour_matrix(matrix: np.ndarray, closed: bool = False) -> np.ndarray:
+    """
+    The float64 matrix a TourNeighborhood works on: for open routes, padded with a dummy node
+    (the last index) at zero distance from every stop.
+
+    Args:
+        matrix (np.ndarray): Square distance matrix indexed by node.
+        closed (bool): Whether routes are closed tours.
+
+    Returns:
+        np.ndarray: The matrix itself (closed) or a padded copy of shape (N + 1, N + 1) (open).
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if closed:
+        return matrix
+    n = matrix.shape[0]
+    padded = np.zeros((n + 1, n + 1), dtype=np.float64)
+    padded[:n, :n] = matrix
+    return padded
+
+class TourNeighborhood:
+    def __init__(self, matrix: np.ndarray, route: Sequence[int], closed: bool = False,
+                 moves: Sequence[str] = MOVE_TYPES, max_segment: int = 3,
+                 rng: Optional[np.random.Generator] = None, neighbor_lists: Optional[np.ndarray] = None,
+                 tour_matrix: Optional[np.ndarray] = None):
+        """
+        Initialize the neighborhood around a starting route.
+
+        Args:
+            matrix (np.ndarray): Square distance matrix indexed by node.
+            route (Sequence[int]): Starting route (node indices).
+            closed (bool): If True, the route returns from its last stop to its first.
+            moves (Sequence[str]): Move types to draw from ("swap", "two_opt", "or_opt").
+            max_segment (int): Longest segment relocated by an Or-opt move.
+            rng (np.random.Generator, optional): Random generator for move sampling.
+            neighbor_lists (np.ndarray, optional): Candidate neighbors per node, shape (N, k); when given,
+                every proposal brings a stop next to one of its candidates. Moves that cannot (e.g. the
+                candidate is not on the route) get an infinite delta and are never accepted.
+            tour_matrix (np.ndarray, optional): `prepare_tour_matrix(matrix, closed)`, computed once by callers
+                that build many neighborhoods over the same matrix.
+        """
+        unknown = set(moves) - set(MOVE_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown move types {sorted(unknown)}; expected a subset of {MOVE_TYPES}.")
+        self.closed = closed
+        self.moves = tuple(moves)
+        self.max_segment = max_segment
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.matrix = prepare_tour_matrix(matrix, closed) if tour_matrix is None else tour_matrix
+        if closed:
+            self.tour = np.array(route, dtype=np.intp)
+        else:
+            self.tour = np.concatenate([[self.matrix.shape[0] - 1], np.asarray(route, dtype=np.intp)])
+        self.size = len(self.tour)
+        self.length = self._tour_length()
+        self.neighbor_lists = None
+        if neighbor_lists is not None and np.asarray(neighbor_lists).shape[1] > 0:
+            self.neighbor_lists = np.asarray(neighbor_lists, dtype=np.intp)
+            # Position of each node on the tour (-1 when absent), kept up to date by `apply`.
+            self.position = np.full(self.matrix.shape[0], -1, dtype=np.intp)
+            self.position[self.tour] = np.arange(self.size)
+
+    def _tour_length(self) -> float:
+        t = self.tour
+        return float(self.matrix[t, np.roll(t, -1)].sum())
+
+    def route(self) -> List[int]:
+        """
+        Return the current route as a list of nodes (without the dummy node for open routes).
+        """
+        return (self.tour if self.closed else self.tour[1:]).tolist()
+
+    def _focus(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Random movable positions and, for each, the tour position of one of its node's candidate
+        neighbors (-1 if that neighbor is not on the tour).
+        """
+        i = self.rng.integers(1, self.size, size=count)
+        lists = self.neighbor_lists
+        v = lists[self.tour[i], self.rng.integers(0, lists.shape[1], size=count)]
+        return i, self.position[v]
+
+    def _swap_delta(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        t, d, m = self.tour, self.matrix, self.size
+        ti, tj = t[i], t[j]
+        a, b, c, e = t[i - 1], t[i + 1], t[j - 1], t[(j + 1) % m]
+        adjacent = j == i + 1
+        # For adjacent positions b == tj and c == ti, and the shared edge flips direction.
+        general = d[a, tj] + d[tj, b] + d[c, ti] + d[ti, e] - d[a, ti] - d[ti, b] - d[c, tj] - d[tj, e]
+        paired = d[a, tj] + d[tj, ti] + d[ti, e] - d[a, ti] - d[ti, tj] - d[tj, e]
+        return np.where(adjacent, paired, general)
+
+    def _swap(self, count: int) -> Tuple[tuple, np.ndarray]:
+        m = self.size
+        if self.neighbor_lists is None:
+            i = self.rng.integers(1, m - 1, size=count)
+            j = self.rng.integers(i + 1, m)
+            return (i, j), self._swap_delta(i, j)
+        # Swap the stop with the node beside its candidate neighbor.
+        u, v = self._focus(count)
+        w = v + np.where(self.rng.random(count) < 0.5, 1, -1)
+        valid = (v >= 0) & (w >= 1) & (w < m) & (w != u)
+        i, j = np.minimum(u, w), np.maximum(u, w)
+        i, j = np.where(valid, i, 1), np.where(valid, j, 2)
+        return (i, j), np.where(valid, self._swap_delta(i, j), np.inf)
+
+    def _two_opt_delta(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        t, d, m = self.tour, self.matrix, self.size
+        a, ti, tj, e = t[i - 1], t[i], t[j], t[(j + 1) % m]
+        return d[a, tj] + d[ti, e] - d[a, ti] - d[tj, e]
+
+    def _two_opt(self, count: int) -> Tuple[tuple, np.ndarray]:
+        m = self.size
+        if self.neighbor_lists is None:
+            i = self.rng.integers(1, m - 1, size=count)
+            j = self.rng.integers(i + 1, m)
+            return (i, j), self._two_opt_delta(i, j)
+        # Make the stop and its candidate adjacent: for positions x < y, reversing x + 1..y creates
+        # edge (t[x], t[y]); reversing x..y - 1 creates edge (t[x], t[y]) from the other side.
+        u, v = self._focus(count)
+        x, y = np.minimum(u, v), np.maximum(u, v)
+        after = self.rng.random(count) < 0.5
+        i = np.where(after, x + 1, x)
+        j = np.where(after, y, y - 1)
+        valid = (v >= 0) & (i >= 1) & (j > i)
+        i, j = np.where(valid, i, 1), np.where(valid, j, 2)
+        return (i, j), np.where(valid, self._two_opt_delta(i, j), np.inf)
+
+    def _or_opt(self, count: int) -> Tuple[tuple, np.ndarray]:
+        t, d, m = self.tour, self.matrix, self.size
+        seg = self.rng.integers(1, min(self.max_segment, m - 2) + 1, size=count)
+        if self.neighbor_lists is None:
+            i = self.rng.integers(1, m - seg + 1)
+            # Insertion edge (p, p + 1) must not touch the segment or its predecessor edge.
+            q = self.rng.integers(0, m - seg - 1)
+            p = np.where(q < i - 1, q, q + seg + 1)
+            valid = None
+        else:
+            # Move the segment starting at the stop to just after or just before its candidate.
+            i, v = self._focus(count)
+            p = v - (self.rng.random(count) < 0.5)
+            valid = (v >= 0) & (p >= 0) & (i + seg <= m) & ((p < i - 1) | (p >= i + seg))
+            i, seg, p = np.where(valid, i, 1), np.where(valid, seg, 1), np.where(valid, p, m - 1)
+        a, s0, s_last, b = t[i - 1], t[i], t[i + seg - 1], t[(i + seg) % m]
+        tp, tp1 = t[p], t[(p + 1) % m]
+        delta = d[a, b] + d[tp, s0] + d[s_last, tp1] - d[a, s0] - d[s_last, b] - d[tp, tp1]
+        if valid is not None:
+            delta = np.where(valid, delta, np.inf)
+        return (i, seg, p), delta
+
+    def propose(self, count: int, move: Optional[str] = None) -> Tuple[str, tuple, np.ndarray]:
+        """
+        Draw a batch of candidate moves of one type and compute their length deltas.
+
+        Args:
+            count (int): Number of moves to draw.
+            move (str, optional): Move type; drawn uniformly from `moves` if None.
+
+        Returns:
+            Tuple[str, tuple, np.ndarray]: Move type, move parameter arrays, and the change in
+            route length each move would cause (negative is an improvement).
+        """
+        if move is None:
+            move = self.moves[self.rng.integers(len(self.moves))] if len(self.moves) > 1 else self.moves[0]
+        if move == "swap":
+            params, deltas = self._swap(count)
+        elif move == "two_opt":
+            params, deltas = self._two_opt(count)
+        else:
+            params, deltas = self._or_opt(count)
+        return move, params, deltas
+
+    def apply(self, move: str, params: tuple, k: int, delta: float):
+        """
+        Apply the k-th move of a proposed batch to the route.
+
+        Args:
+            move (str): Move type returned by `propose`.
+            params (tuple): Move parameter arrays returned by `propose`.
+            k (int): Index of the accepted move within the batch.
+            delta (float): The move's length delta, used to update the running length.
+        """
+        t = self.tour
+        if move == "swap":
+            i, j = params[0][k], params[1][k]
+            t[i], t[j] = t[j], t[i]
+            if self.neighbor_lists is not None:
+                self.position[t[i]], self.position[t[j]] = i, j
+        elif move == "two_opt":
+            i, j = params[0][k], params[1][k]
+            t[i:j + 1] = t[i:j + 1][::-1].copy()
+            if self.neighbor_lists is not None:
+                self.position[t[i:j + 1]] = np.arange(i, j + 1)
+        else:
+            i, seg, p = params[0][k], params[1][k], params[2][k]
+            segment = t[i:i + seg].copy()
+            rest = np.delete(t, np.arange(i, i + seg))
+            self.tour = np.insert(rest, p + 1 if p < i else p + 1 - seg, segment)
+            if self.neighbor_lists is not None:
+                self.position[self.tour] = np.arange(self.size)
+        self.length += float(delta)
+
+    @property
+    def valid(self) -> bool:
+        """
+        Whether the route is long enough for moves (at least two movable positions plus the fixed one).
+        """
+        return self.size >= 4
+
+# Example usage:
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    points = rng.random((500, 2))
+    matrix = np.sqrt(((points[:, np.newaxis, :] - points[np.newaxis, :, :]) ** 2).sum(axis=-1))
+    neighborhood = TourNeighborhood(matrix, rng.permutation(500), closed=True, rng=rng)
+
+    start = time.perf_counter()
+    evaluated = 0
+    while time.perf_counter() - start < 1.0:
+        move, params, deltas = neighborhood.propose(256)
+        evaluated += len(deltas)
+    print(f"Evaluated {evaluated / (time.perf_counter() - start):,.0f} moves per second on 500 stops")
@@ -0,0 +1,118 @@
+"""
+TensorFlow-free inference for trained DQN route-adjustment policies.
+
+Serving pods only need to choose actions, yet importing TensorFlow costs seconds of startup and
+hundreds of MB per worker. This module provides:
+- NumpyPolicy: the Q-network's forward pass (dense layers with relu/tanh/sigmoid/linear
+  activations) in plain NumPy, with batched greedy action selection.
+- save/load of a policy as an .npz file of weight arrays and activation names.
+
+A policy is exported from a trained agent with `RLAgent.export_policy()` (or saved with
+`RLAgent.save_policy(path)`) in a training environment; this module never imports TensorFlow,
+so loading and running the policy does not either.
+
+Assumptions:
+- The network is a stack of dense layers, as built by `RLAgent._build_model`.
+- Inference runs in float32, like the Keras model.
+"""
+
+from typing import Callable, Dict, Sequence
+import numpy as np
+
+ACTIVATIONS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "linear": lambda x: x,
+    "relu": lambda x: np.maximum(x, 0.0, out=x),
+    "tanh": np.tanh,
+    "sigmoid": lambda x: 1.0 / (1.0 + np.exp(-x)),
+}
+
+class NumpyPolicy:
+    def __init__(self, kernels: Sequence[np.ndarray], biases: Sequence[np.ndarray], activations: Sequence[str]):
+        """
+        Initialize the policy from dense-layer weights.
+
+        Args:
+            kernels (Sequence[np.ndarray]): Kernel of each layer, shape (inputs, units).
+            biases (Sequence[np.ndarray]): Bias of each layer, shape (units,).
+            activations (Sequence[str]): Activation name of each layer (see ACTIVATIONS).
+        """
+        if not (len(kernels) == len(biases) == len(activations)) or not kernels:
+            raise ValueError("Expected one kernel, bias, and activation per layer.")
+        unknown = set(activations) - set(ACTIVATIONS)
+        if unknown:
+            raise ValueError(f"Unsupported activations {sorted(unknown)}; expected one of {sorted(ACTIVATIONS)}.")
+        self.kernels = [np.ascontiguousarray(kernel, dtype=np.float32) for kernel in kernels]
+        self.biases = [np.asarray(bias, dtype=np.float32) for bias in biases]
+        self.activations = list(activations)
+        for previous, kernel in zip(self.kernels, self.kernels[1:]):
+            if previous.shape[1] != kernel.shape[0]:
+                raise ValueError("Layer shapes do not chain.")
+        self.state_size = self.kernels[0].shape[0]
+        self.action_size = self.kernels[-1].shape[1]
+
+    def q_values(self, states: np.ndarray) -> np.ndarray:
+        """
+        Q-values of a batch of states.
+
+        Args:
+            states (np.ndarray): States of shape (B, state_size) (or one state of shape (state_size,)).
+
+        Returns:
+            np.ndarray: Q-values of shape (B, action_size).
+        """
+        x = np.asarray(states, dtype=np.float32).reshape(-1, self.state_size)
+        for kernel, bias, activation in zip(self.kernels, self.biases, self.activations):
+            x = x @ kernel
+            x += bias
+            x = ACTIVATIONS[activation](x)
+        return x
+
+    def act_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Greedy actions for a batch of states, e.g. one per vehicle.
+
+        Returns:
+            np.ndarray: Action indices of shape (B,).
+        """
+        return np.argmax(self.q_values(states), axis=1)
+
+    def act(self, state: np.ndarray) -> int:
+        """
+        Greedy action for one state.
+        """
+        return int(self.act_batch(state)[0])
+
+    def save(self, path: str):
+        """
+        Save the weights and activations to an .npz file.
+        """
+        arrays = {}
+        for layer, (kernel, bias) in enumerate(zip(self.kernels, self.biases)):
+            arrays[f"kernel_{layer}"] = kernel
+            arrays[f"bias_{layer}"] = bias
+        np.savez(path, activations=np.array(self.activations), **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyPolicy":
+        """
+        Load a policy saved with `save` (or `RLAgent.save_policy`).
+        """
+        with np.load(path, allow_pickle=False) as data:
+            activations = [str(name) for name in data["activations"]]
+            kernels = [data[f"kernel_{layer}"] for layer in range(len(activations))]
+            biases = [data[f"bias_{layer}"] for layer in range(len(activations))]
+        return cls(kernels, biases, activations)
+
+# Example usage:
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    sizes = [20, 64, 64, 8]
+    policy = NumpyPolicy([rng.normal(0, 0.3, (a, b)) for a, b in zip(sizes, sizes[1:])],
+                         [np.zeros(b) for b in sizes[1:]], ["relu", "relu", "linear"])
+    fleet_states = rng.random((500, 20))
+    start = time.perf_counter()
+    actions = policy.act_batch(fleet_states)
+    print(f"Actions for {len(actions)} vehicles in {(time.perf_counter() - start) * 1000:.2f} ms:",
+          np.bincount(actions, minlength=8).tolist())
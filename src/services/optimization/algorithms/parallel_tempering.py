@@ -0,0 +1,299 @@
+"""
+Implements parallel tempering and multi-start Simulated Annealing across worker processes.
+
+This module provides:
+- ParallelTempering: runs several SA chains at fixed temperatures on a geometric ladder, one
+  chain per pool task, and periodically swaps states between adjacent temperatures using the
+  Metropolis criterion so good solutions found by hot (exploring) chains reach cold (refining) ones.
+- MultiStartAnnealing: runs independent SA chains with different seeds and returns the best.
+
+Both return the global best solution and use the shared process pools from `parallel.py`, so
+workers are reused across runs.
+
+A run's fitness function and SimulatedAnnealing arguments (which carry the distance matrix)
+are pickled once into shared memory as a ChainContext. Tasks carry only the segment's name plus
+the chain's state, temperature, and seed; each worker unpickles the context on first use and
+caches it, together with the tour matrix that SimulatedAnnealing would otherwise rebuild on
+every call, for the remaining rounds of the run.
+
+Assumptions:
+- The fitness function is picklable (module-level function or `RouteDistanceFitness`).
+- Higher fitness is better, as in SimulatedAnnealing.
+"""
+
+import math
+import pickle
+import random
+from collections import OrderedDict
+from concurrent.futures import Executor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Callable, Tuple, Optional
+import numpy as np
+
+from src.services.optimization.algorithms.simulated_annealing import SimulatedAnnealing
+from src.services.optimization.algorithms.neighborhoods import prepare_tour_matrix
+from src.services.optimization.stopping import StoppingCriteria, RunStats, COMPLETED, TIME_LIMIT
+from src.services.optimization.progress import ProgressReporter
+
+# Contexts unpickled by this (worker) process, by shared memory segment name; the most recent
+# runs only, since each holds its own copy of the distance matrix.
+_CONTEXTS: "OrderedDict[str, Tuple[Callable[[List[int]], float], Dict[str, Any]]]" = OrderedDict()
+_MAX_CONTEXTS = 2
+
+def _with_tour_matrix(sa_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    if sa_kwargs.get("distance_matrix") is None:
+        return sa_kwargs
+    return dict(sa_kwargs, tour_matrix=prepare_tour_matrix(sa_kwargs["distance_matrix"], sa_kwargs.get("closed", False)))
+
+class ChainContext:
+    """
+    The fitness function and SimulatedAnnealing arguments shared by every chain of a run.
+
+    With `share=True` the context is pickled once into a shared memory segment, and pickling the
+    ChainContext itself (once per task) sends only the segment's name and size. Call `close` when
+    the run is over.
+    """
+    def __init__(self, fitness_fn: Callable[[List[int]], float], sa_kwargs: Dict[str, Any], share: bool = False):
+        self._context = (fitness_fn, sa_kwargs)
+        self._loaded = None
+        self._shm = None
+        self.name, self.size = None, 0
+        if share:
+            payload = pickle.dumps(self._context, protocol=pickle.HIGHEST_PROTOCOL)
+            self._shm = shared_memory.SharedMemory(create=True, size=max(1, len(payload)))
+            self._shm.buf[:len(payload)] = payload
+            self.name, self.size = self._shm.name, len(payload)
+
+    def __getstate__(self):
+        if self.name is None:
+            return {"context": self._context}
+        return {"name": self.name, "size": self.size}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._context = state.get("context")
+        self._loaded = self._shm = None
+        self.name, self.size = state.get("name"), state.get("size", 0)
+
+    def load(self) -> Tuple[Callable[[List[int]], float], Dict[str, Any]]:
+        """
+        The fitness function and SimulatedAnnealing arguments (with a precomputed `tour_matrix`).
+        """
+        if self._context is not None:
+            # In-process (serial or thread pool) use.
+            if self._loaded is None:
+                fitness_fn, sa_kwargs = self._context
+                self._loaded = (fitness_fn, _with_tour_matrix(sa_kwargs))
+            return self._loaded
+        context = _CONTEXTS.get(self.name)
+        if context is None:
+            segment = shared_memory.SharedMemory(name=self.name)
+            try:
+                payload = bytes(segment.buf[:self.size])
+            finally:
+                segment.close()
+            fitness_fn, sa_kwargs = pickle.loads(payload)
+            context = _CONTEXTS[self.name] = (fitness_fn, _with_tour_matrix(sa_kwargs))
+            while len(_CONTEXTS) > _MAX_CONTEXTS:
+                _CONTEXTS.popitem(last=False)
+        else:
+            _CONTEXTS.move_to_end(self.name)
+        return context
+
+    def close(self):
+        """
+        Release the shared memory segment. Safe to call more than once.
+        """
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+def _anneal_chain(task: Tuple[int, List[int], ChainContext, Dict[str, Any], Optional[int], Optional[float],
+                              Optional[int]]):
+    """
+    Run one SA chain in a worker. Module-level so that it can be pickled for process pools.
+
+    The task carries the run's shared context, the chain's own SA arguments (e.g. its
+    temperature), and an absolute `time.time()` deadline shared by all chains, so a chain stops
+    with its best-so-far state when the caller's budget runs out.
+
+    Returns:
+        Tuple: (final_state, final_fitness, best_state, best_fitness, evaluations).
+    """
+    seed, state, context, chain_kwargs, max_levels, deadline, patience = task
+    random.seed(seed)
+    fitness_fn, sa_kwargs = context.load()
+    sa = SimulatedAnnealing(state, fitness_fn, **dict(sa_kwargs, **chain_kwargs))
+    best_state, best_fitness = sa.run(max_levels=max_levels,
+                                      stopping=StoppingCriteria(patience=patience).start(deadline))
+    return sa.final_state, sa.final_fitness, best_state, best_fitness, sa.last_run_stats.evaluations
+
+def _report_final(progress: Optional[ProgressReporter], stats: RunStats):
+    if progress is not None:
+        progress.report(stats.iterations, stats.best_fitness, stats.evaluations, stats.elapsed, final=True)
+
+def _map(executor: Optional[Executor], tasks: List[tuple]) -> List[tuple]:
+    if executor is None:
+        return [_anneal_chain(task) for task in tasks]
+    return list(executor.map(_anneal_chain, tasks))
+
+class ParallelTempering:
+    def __init__(self, initial_state: List[int], fitness_fn: Callable[[List[int]], float], num_chains: int = 4,
+                 min_temp: float = 1.0, max_temp: float = 100.0, sweep_iterations: int = 1000, rounds: int = 20,
+                 executor: Optional[Executor] = None, sa_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Initialize parallel tempering.
+
+        Args:
+            initial_state (List[int]): Starting solution shared by all chains.
+            fitness_fn (Callable[[List[int]], float]): Fitness function to evaluate a solution.
+            num_chains (int): Number of chains (temperatures).
+            min_temp (float): Temperature of the coldest chain.
+            max_temp (float): Temperature of the hottest chain.
+            sweep_iterations (int): Iterations each chain runs between swap attempts.
+            rounds (int): Number of sweep-then-swap rounds.
+            executor (Executor, optional): Process pool that runs the chains; serial if None.
+            sa_kwargs (Dict[str, Any], optional): Extra SimulatedAnnealing arguments (e.g. distance_matrix).
+        """
+        self.initial_state = initial_state
+        self.fitness_fn = fitness_fn
+        self.num_chains = num_chains
+        self.temperatures = np.geomspace(min_temp, max_temp, num_chains).tolist() if num_chains > 1 else [min_temp]
+        self.sweep_iterations = sweep_iterations
+        self.rounds = rounds
+        self.executor = executor
+        self.sa_kwargs = sa_kwargs or {}
+        self.swaps_attempted = 0
+        self.swaps_accepted = 0
+        self.last_run_stats = None
+
+    def run(self, stopping: Optional[StoppingCriteria] = None,
+            progress: Optional[ProgressReporter] = None) -> Tuple[List[int], float]:
+        """
+        Run all chains and return the best solution any of them found.
+
+        Chains stop mid-sweep at the stopping criteria's deadline; stagnation is counted in rounds.
+
+        Args:
+            stopping (StoppingCriteria, optional): Deadline and stagnation criteria.
+            progress (ProgressReporter, optional): Receives sampled per-round progress events.
+
+        Returns:
+            Tuple[List[int], float]: The best solution found and its corresponding fitness.
+        """
+        stopping = stopping or StoppingCriteria()
+        if stopping.started_at is None:
+            stopping.start()
+        states = [list(self.initial_state) for _ in range(self.num_chains)]
+        fitnesses = [None] * self.num_chains
+        best_state, best_fitness = None, float("-inf")
+        evaluations = 0
+        stop_reason = COMPLETED
+
+        completed = 0
+        context = ChainContext(self.fitness_fn, self.sa_kwargs, share=self.executor is not None)
+        try:
+            for round_index in range(self.rounds):
+                tasks = [
+                    (random.getrandbits(32), states[c], context,
+                     {"initial_temp": self.temperatures[c], "cooling_rate": 1.0, "min_temp": 0.0,
+                      "max_iter": self.sweep_iterations}, 1, stopping.deadline, None)
+                    for c in range(self.num_chains)
+                ]
+                for c, (state, fitness, chain_best, chain_best_fitness, chain_evaluations) in enumerate(_map(self.executor, tasks)):
+                    states[c], fitnesses[c] = state, fitness
+                    evaluations += chain_evaluations
+                    if chain_best_fitness > best_fitness:
+                        best_state, best_fitness = chain_best, chain_best_fitness
+                completed += 1
+                if progress is not None:
+                    progress.report(completed, best_fitness, evaluations, stopping.elapsed())
+                reason = stopping.update(best_fitness)
+                if reason is not None:
+                    stop_reason = reason
+                    break
+
+                # Alternate even and odd adjacent pairs so every pair is tried every two rounds.
+                for c in range(round_index % 2, self.num_chains - 1, 2):
+                    self.swaps_attempted += 1
+                    exponent = (1.0 / self.temperatures[c] - 1.0 / self.temperatures[c + 1]) * (fitnesses[c + 1] - fitnesses[c])
+                    if exponent >= 0 or random.random() < math.exp(exponent):
+                        self.swaps_accepted += 1
+                        states[c], states[c + 1] = states[c + 1], states[c]
+                        fitnesses[c], fitnesses[c + 1] = fitnesses[c + 1], fitnesses[c]
+        finally:
+            context.close()
+
+        self.last_run_stats = RunStats("parallel_tempering", completed, evaluations, stopping.elapsed(),
+                                       best_fitness, stop_reason)
+        _report_final(progress, self.last_run_stats)
+        return best_state, best_fitness
+
+class MultiStartAnnealing:
+    def __init__(self, initial_states: List[List[int]], fitness_fn: Callable[[List[int]], float],
+                 executor: Optional[Executor] = None, sa_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Initialize multi-start annealing.
+
+        Args:
+            initial_states (List[List[int]]): One starting solution per independent chain.
+            fitness_fn (Callable[[List[int]], float]): Fitness function to evaluate a solution.
+            executor (Executor, optional): Process pool that runs the chains; serial if None.
+            sa_kwargs (Dict[str, Any], optional): SimulatedAnnealing arguments shared by all chains.
+        """
+        self.initial_states = initial_states
+        self.fitness_fn = fitness_fn
+        self.executor = executor
+        self.sa_kwargs = sa_kwargs or {}
+        self.last_run_stats = None
+
+    def run(self, stopping: Optional[StoppingCriteria] = None,
+            progress: Optional[ProgressReporter] = None) -> Tuple[List[int], float]:
+        """
+        Run every chain with its own seed and return the best solution.
+
+        Every chain shares the stopping criteria's deadline and applies its patience (in temperature
+        levels) on its own.
+
+        Args:
+            stopping (StoppingCriteria, optional): Deadline and stagnation criteria.
+            progress (ProgressReporter, optional): Receives the final progress event.
+
+        Returns:
+            Tuple[List[int], float]: The best solution found and its corresponding fitness.
+        """
+        stopping = stopping or StoppingCriteria()
+        if stopping.started_at is None:
+            stopping.start()
+        context = ChainContext(self.fitness_fn, self.sa_kwargs, share=self.executor is not None)
+        try:
+            tasks = [(random.getrandbits(32), state, context, {}, None, stopping.deadline, stopping.patience)
+                     for state in self.initial_states]
+            results = _map(self.executor, tasks)
+        finally:
+            context.close()
+        _, _, best_state, best_fitness, _ = max(results, key=lambda result: result[3])
+        stop_reason = TIME_LIMIT if stopping.out_of_time() else COMPLETED
+        self.last_run_stats = RunStats("multistart_annealing", len(tasks), sum(result[4] for result in results),
+                                       stopping.elapsed(), best_fitness, stop_reason)
+        _report_final(progress, self.last_run_stats)
+        return best_state, best_fitness
+
+# Example usage:
+if __name__ == "__main__":
+    from src.services.optimization.parallel import get_executor
+
+    def fitness(state: List[int]) -> float:
+        # Dummy fitness: penalize large jumps between consecutive stops.
+        return -float(sum(abs(a - b) for a, b in zip(state, state[1:])))
+
+    initial = random.sample(range(30), 30)
+    pool = get_executor("process", max_workers=4)
+    tempering = ParallelTempering(initial, fitness, num_chains=4, min_temp=0.5, max_temp=20, sweep_iterations=500,
+                                  rounds=10, executor=pool)
+    print("Parallel tempering best fitness:", tempering.run()[1])
+    print(f"Swaps accepted: {tempering.swaps_accepted}/{tempering.swaps_attempted}")
+    starts = [random.sample(range(30), 30) for _ in range(4)]
+    multi = MultiStartAnnealing(starts, fitness, executor=pool,
+                                sa_kwargs={"initial_temp": 20, "cooling_rate": 0.8, "min_temp": 0.5, "max_iter": 500})
+    print("Multi-start best fitness:", multi.run()[1])
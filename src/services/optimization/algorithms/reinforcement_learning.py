@@ -6,6 +6,16 @@ This module provides an RLAgent class that:
 - Trains on provided state-action pairs to learn an optimal policy for route adjustments.
 - Offers methods to predict actions and perform incremental training.
 
+Inference and training avoid per-transition Keras dispatch:
+- ReplayBuffer: experience replay in preallocated NumPy ring arrays, with vectorized batch
+  insertion and uniform minibatch sampling.
+- RLAgent.act_batch: chooses actions for many states (e.g. every vehicle of a fleet) in one
+  forward pass through a compiled `tf.function`, instead of one `model.predict` per state.
+- RLAgent.replay: one compiled gradient step on a sampled minibatch, with bootstrapped targets
+  from a target network that is synchronized every `target_update_interval` steps.
+- RLAgent.export_policy / save_policy: the trained Q-network as plain weight arrays, served by
+  the TensorFlow-free NumpyPolicy (numpy_policy.py).
+
 Assumptions:
 - The environment provides states as numpy arrays.
 - The action space is discrete (e.g., a set of possible route adjustments).
@@ -15,57 +25,224 @@ Assumptions:
 import numpy as np
 import tensorflow as tf
 from tensorflow.keras import layers, models, optimizers
-from typing import Tuple
+from typing import Optional, Tuple
+
+from src.services.optimization.algorithms.numpy_policy import NumpyPolicy
+
+class ReplayBuffer:
+    def __init__(self, capacity: int, state_size: int, seed: Optional[int] = None):
+        """
+        Preallocate a ring buffer of transitions.
+
+        Args:
+            capacity (int): Maximum number of transitions kept; the oldest are overwritten first.
+            state_size (int): Dimensionality of states.
+            seed (int, optional): Seed of the sampling generator.
+        """
+        self.capacity = capacity
+        self.states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int32)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=np.float32)
+        self.position = 0
+        self.size = 0
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, state: np.ndarray, action: int, reward: float, next_state: np.ndarray, done: bool):
+        """
+        Store one transition.
+        """
+        self.add_batch(np.reshape(state, (1, -1)), [action], [reward], np.reshape(next_state, (1, -1)), [done])
+
+    def add_batch(self, states: np.ndarray, actions: np.ndarray, rewards: np.ndarray, next_states: np.ndarray,
+                  dones: np.ndarray):
+        """
+        Store a batch of transitions (e.g. one step of many parallel episodes) in one vectorized write.
+
+        Args:
+            states (np.ndarray): States of shape (B, state_size).
+            actions (np.ndarray): Actions of shape (B,).
+            rewards (np.ndarray): Rewards of shape (B,).
+            next_states (np.ndarray): Next states of shape (B, state_size).
+            dones (np.ndarray): Episode-end flags of shape (B,).
+        """
+        count = len(actions)
+        if count > self.capacity:
+            # Only the newest `capacity` transitions would survive anyway.
+            states, actions, rewards = states[-self.capacity:], actions[-self.capacity:], rewards[-self.capacity:]
+            next_states, dones = next_states[-self.capacity:], dones[-self.capacity:]
+            count = self.capacity
+        slots = (self.position + np.arange(count)) % self.capacity
+        self.states[slots] = states
+        self.actions[slots] = actions
+        self.rewards[slots] = rewards
+        self.next_states[slots] = next_states
+        self.dones[slots] = dones
+        self.position = (self.position + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def sample(self, batch_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Draw a uniform minibatch (with replacement) of stored transitions.
+
+        Returns:
+            Tuple[np.ndarray, ...]: States, actions, rewards, next states, and done flags.
+        """
+        if self.size == 0:
+            raise ValueError("Cannot sample from an empty replay buffer.")
+        slots = self.rng.integers(0, self.size, batch_size)
+        return self.states[slots], self.actions[slots], self.rewards[slots], self.next_states[slots], self.dones[slots]
 
 class RLAgent:
-    def __init__(self, state_size: int, action_size: int, learning_rate: float = 0.001, gamma: float = 0.95):
+    def __init__(self, state_size: int, action_size: int, learning_rate: float = 0.001, gamma: float = 0.95,
+                 buffer_size: int = 10000, batch_size: int = 64, target_update_interval: int = 100,
+                 seed: Optional[int] = None):
         """
         Initialize the RLAgent with a simple DQN model.
-        
+
         Args:
             state_size (int): Dimensionality of state space.
             action_size (int): Number of possible actions.
             learning_rate (float): Learning rate for the optimizer.
             gamma (float): Discount factor for future rewards.
+            buffer_size (int): Capacity of the experience replay buffer.
+            batch_size (int): Minibatch size of each training step.
+            target_update_interval (int): Training steps between target network synchronizations.
+            seed (int, optional): Seed of the replay sampling.
         """
         self.state_size = state_size
         self.action_size = action_size
         self.learning_rate = learning_rate
         self.gamma = gamma
+        self.batch_size = batch_size
+        self.target_update_interval = target_update_interval
         self.model = self._build_model()
+        self.target_model = self._build_model()
+        self.target_model.set_weights(self.model.get_weights())
+        self.optimizer = optimizers.Adam(learning_rate=self.learning_rate)
+        self.buffer = ReplayBuffer(buffer_size, state_size, seed)
+        self.train_steps = 0
+
+        # Fixed signatures, so that every batch size reuses one traced graph.
+        state_spec = tf.TensorSpec([None, state_size], tf.float32)
+        self._q_values = tf.function(lambda states: self.model(states, training=False),
+                                     input_signature=[state_spec])
+        self._train_step = tf.function(self._gradient_step, input_signature=[
+            state_spec, tf.TensorSpec([None], tf.int32), tf.TensorSpec([None], tf.float32), state_spec,
+            tf.TensorSpec([None], tf.float32)])
 
     def _build_model(self) -> models.Model:
         """
         Build the DQN model.
-        
+
         Returns:
             models.Model: Compiled Keras model.
         """
         model = models.Sequential()
-        model.add(layers.Dense(64, input_dim=self.state_size, activation='relu'))
+        model.add(layers.Input(shape=(self.state_size,)))
+        model.add(layers.Dense(64, activation='relu'))
         model.add(layers.Dense(64, activation='relu'))
         model.add(layers.Dense(self.action_size, activation='linear'))
         model.compile(optimizer=optimizers.Adam(learning_rate=self.learning_rate), loss='mse')
         return model
 
+    def q_values(self, states: np.ndarray) -> np.ndarray:
+        """
+        Q-values of a batch of states in one forward pass.
+
+        Args:
+            states (np.ndarray): States of shape (B, state_size).
+
+        Returns:
+            np.ndarray: Q-values of shape (B, action_size).
+        """
+        states = np.asarray(states, dtype=np.float32).reshape(-1, self.state_size)
+        return self._q_values(states).numpy()
+
+    def act_batch(self, states: np.ndarray, epsilon: float = 0.0,
+                  rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Choose greedy (or epsilon-greedy) actions for a batch of states in one forward pass.
+
+        Args:
+            states (np.ndarray): States of shape (B, state_size), e.g. one per vehicle.
+            epsilon (float): Probability of a uniformly random action per state.
+            rng (np.random.Generator, optional): Source of the exploration draws.
+
+        Returns:
+            np.ndarray: Action indices of shape (B,).
+        """
+        actions = np.argmax(self.q_values(states), axis=1)
+        if epsilon > 0.0:
+            rng = rng or np.random.default_rng()
+            explore = rng.random(len(actions)) < epsilon
+            actions[explore] = rng.integers(0, self.action_size, int(explore.sum()))
+        return actions
+
     def act(self, state: np.ndarray) -> int:
         """
         Choose an action based on the current state.
-        
+
         Args:
             state (np.ndarray): Current state.
-        
+
         Returns:
             int: Selected action index.
         """
-        state = np.reshape(state, [1, self.state_size])
-        q_values = self.model.predict(state, verbose=0)
-        return np.argmax(q_values[0])
+        return int(self.act_batch(np.reshape(state, [1, self.state_size]))[0])
+
+    def _gradient_step(self, states: tf.Tensor, actions: tf.Tensor, rewards: tf.Tensor, next_states: tf.Tensor,
+                       dones: tf.Tensor) -> tf.Tensor:
+        # Bootstrapped targets come from the (periodically synchronized) target network.
+        next_q = tf.reduce_max(self.target_model(next_states, training=False), axis=1)
+        targets = rewards + self.gamma * (1.0 - dones) * next_q
+        with tf.GradientTape() as tape:
+            q = self.model(states, training=True)
+            chosen = tf.gather(q, actions, axis=1, batch_dims=1)
+            loss = tf.reduce_mean(tf.square(targets - chosen))
+        gradients = tape.gradient(loss, self.model.trainable_variables)
+        self.optimizer.apply_gradients(zip(gradients, self.model.trainable_variables))
+        return loss
+
+    def update_target(self):
+        """
+        Copy the online network's weights to the target network.
+        """
+        self.target_model.set_weights(self.model.get_weights())
+
+    def remember(self, state: np.ndarray, action: int, reward: float, next_state: np.ndarray, done: bool):
+        """
+        Store a transition in the replay buffer.
+        """
+        self.buffer.add(state, action, reward, next_state, done)
+
+    def replay(self, batch_size: Optional[int] = None) -> Optional[float]:
+        """
+        Run one training step on a minibatch sampled from the replay buffer.
+
+        Args:
+            batch_size (int, optional): Minibatch size; defaults to the agent's.
+
+        Returns:
+            Optional[float]: The minibatch loss, or None while the buffer is empty.
+        """
+        if len(self.buffer) == 0:
+            return None
+        batch = self.buffer.sample(batch_size or self.batch_size)
+        loss = float(self._train_step(*batch))
+        self.train_steps += 1
+        if self.train_steps % self.target_update_interval == 0:
+            self.update_target()
+        return loss
 
     def train(self, state: np.ndarray, action: int, reward: float, next_state: np.ndarray, done: bool):
         """
-        Train the model on a single experience tuple.
-        
+        Store an experience tuple and train on a replayed minibatch.
+
         Args:
             state (np.ndarray): Current state.
             action (int): Action taken.
@@ -73,17 +250,34 @@ class RLAgent:
             next_state (np.ndarray): Next state after the action.
             done (bool): Whether the episode is finished.
         """
-        state = np.reshape(state, [1, self.state_size])
-        next_state = np.reshape(next_state, [1, self.state_size])
-        target = reward
-        if not done:
-            target += self.gamma * np.amax(self.model.predict(next_state, verbose=0)[0])
-        target_f = self.model.predict(state, verbose=0)
-        target_f[0][action] = target
-        self.model.fit(state, target_f, epochs=1, verbose=0)
+        self.remember(state, action, reward, next_state, done)
+        self.replay()
+
+    def export_policy(self) -> NumpyPolicy:
+        """
+        Export the online Q-network as a NumPy-only policy.
+
+        Returns:
+            NumpyPolicy: Policy with copies of the current weights.
+        """
+        kernels, biases, activations = [], [], []
+        for layer in self.model.layers:
+            kernel, bias = layer.get_weights()
+            kernels.append(kernel)
+            biases.append(bias)
+            activations.append(layer.activation.__name__)
+        return NumpyPolicy(kernels, biases, activations)
+
+    def save_policy(self, path: str):
+        """
+        Save the online Q-network's weights for `NumpyPolicy.load`.
+        """
+        self.export_policy().save(path)
 
 # Example usage:
 if __name__ == "__main__":
+    import time
+
     state_size = 10  # Example state dimension
     action_size = 4  # Example: 4 possible route adjustments
     agent = RLAgent(state_size, action_size)
@@ -95,5 +289,11 @@ if __name__ == "__main__":
     next_state = np.random.rand(state_size)
     done = False
     agent.train(state, action, reward, next_state, done)
-
     print("Action taken:", action)
+
+    # One forward pass chooses the adjustment of every vehicle in a 500-vehicle fleet.
+    fleet_states = np.random.rand(500, state_size)
+    agent.act_batch(fleet_states)
+    start = time.perf_counter()
+    actions = agent.act_batch(fleet_states)
+    print(f"Actions for {len(actions)} vehicles in {(time.perf_counter() - start) * 1000:.2f} ms")
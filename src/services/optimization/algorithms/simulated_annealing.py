@@ -4,8 +4,17 @@ Implements Simulated Annealing for route optimization with fallback strategies.
 This module provides a SimulatedAnnealing class that:
 - Generates a neighbor solution by swapping two elements.
 - Uses an acceptance probability function based on a cooling schedule.
-- Iterates until a minimum temperature is reached.
+- Iterates until a minimum temperature is reached, a wall-clock deadline passes, or the best
+  fitness stagnates for a configurable number of temperature levels.
 - Maintains and returns the best-known solution even if the algorithm stagnates.
+- Optionally evaluates several candidate neighbors per iteration in parallel and moves towards the best.
+- Given a distance matrix, uses move-based neighborhoods (swap, 2-opt, Or-opt) whose cost deltas are
+  computed in O(1) for whole batches of moves; the route is only modified when a move is accepted.
+- With time windows, restricts move mode to single-stop relocations whose feasibility is checked
+  in O(1) per move from the route's precomputed slack, so every visited route stays feasible.
+- Optional sampled progress events (see `progress.py`) instead of per-level printing.
+- Optional k-nearest candidate lists (see `src/core/spatial_index.py`) that focus every neighbor
+  on bringing a stop next to one of its nearby stops.
 
 Assumptions:
 - A chromosome is a list of route nodes.
@@ -14,11 +23,25 @@ Assumptions:
 
 import math
 import random
-from typing import List, Callable, Tuple
+from concurrent.futures import Executor
+from typing import List, Callable, Tuple, Optional, Sequence
+import numpy as np
+
+from src.core.distance_matrix import route_length
+from src.services.optimization.parallel import parallel_map
+from src.services.optimization.algorithms.neighborhoods import TourNeighborhood, MOVE_TYPES
+from src.services.optimization.stopping import StoppingCriteria, RunStats, COMPLETED, TIME_LIMIT
+from src.services.optimization.progress import ProgressReporter
+from src.services.optimization.time_windows import TimeWindows
 
 class SimulatedAnnealing:
     def __init__(self, initial_state: List[int], fitness_fn: Callable[[List[int]], float],
-                 initial_temp: float = 1000.0, cooling_rate: float = 0.95, min_temp: float = 1e-3, max_iter: int = 1000):
+                 initial_temp: float = 1000.0, cooling_rate: float = 0.95, min_temp: float = 1e-3, max_iter: int = 1000,
+                 candidates: int = 1, executor: Optional[Executor] = None,
+                 distance_matrix: Optional[np.ndarray] = None, closed: bool = False,
+                 moves: Sequence[str] = MOVE_TYPES, batch_size: int = 16, max_batch_size: int = 1024,
+                 time_windows: Optional[TimeWindows] = None, neighbor_lists: Optional[np.ndarray] = None,
+                 tour_matrix: Optional[np.ndarray] = None):
         """
         Initialize the Simulated Annealing algorithm.
         
@@ -29,17 +52,60 @@ class SimulatedAnnealing:
             cooling_rate (float): Rate at which the temperature decreases.
             min_temp (float): Minimum temperature to stop the algorithm.
             max_iter (int): Maximum iterations to perform at each temperature level.
+            candidates (int): Neighbors generated and evaluated per iteration; the best one is proposed.
+            executor (Executor, optional): Pool used to evaluate candidate neighbors in parallel.
+            distance_matrix (np.ndarray, optional): If given, the state is a route through this matrix and is
+                optimized for route length with O(1) move deltas instead of calling fitness_fn per neighbor.
+            closed (bool): Whether routes through `distance_matrix` are closed tours.
+            moves (Sequence[str]): Move types used with `distance_matrix` ("swap", "two_opt", "or_opt").
+            batch_size (int): Smallest number of moves proposed and scored together with `distance_matrix`;
+                the batch grows towards `max_batch_size` as the acceptance rate falls.
+            max_batch_size (int): Largest move batch.
+            time_windows (TimeWindows, optional): Time windows enforced in move mode (open routes only); moves
+                are limited to single-stop relocations. If the initial state is infeasible, the general mode
+                runs instead, so fitness_fn should penalize lateness (see `TimeWindowFitness`).
+            neighbor_lists (np.ndarray, optional): Candidate neighbors per node, shape (N, k), that
+                neighbors and moves are restricted to.
+            tour_matrix (np.ndarray, optional): `prepare_tour_matrix(distance_matrix, closed)`, for callers that
+                run many annealers over the same matrix (e.g. parallel tempering rounds).
         """
+        if time_windows is not None and distance_matrix is not None:
+            if closed:
+                raise ValueError("Time windows in move mode require open routes (closed=False).")
+            if not time_windows.schedule(initial_state).feasible:
+                distance_matrix = None
         self.state = initial_state
         self.fitness_fn = fitness_fn
         self.temp = initial_temp
         self.cooling_rate = cooling_rate
         self.min_temp = min_temp
         self.max_iter = max_iter
+        self.candidates = max(1, candidates)
+        self.executor = executor
+        self.distance_matrix = distance_matrix
+        self.closed = closed
+        self.moves = moves
+        self.batch_size = batch_size
+        self.max_batch_size = max(batch_size, max_batch_size)
+        self.time_windows = time_windows
+        self.neighbor_lists = None if neighbor_lists is None else np.asarray(neighbor_lists, dtype=np.intp)
+        self.tour_matrix = tour_matrix
+        # Position of every node in `_positions_of` (the current state), so that candidate-restricted
+        # neighbors find a stop in O(1); updated in place when a neighbor is accepted.
+        self._positions = None
+        self._positions_of = None
+        self._last_swap = None
+        self.evaluated_moves = 0
+        self.final_state = None
+        self.final_fitness = None
+        self.last_run_stats = None
 
     def get_neighbor(self, state: List[int]) -> List[int]:
         """
         Generate a neighbor solution by swapping two random elements.
+
+        With candidate lists, the second element is the one beside a random candidate neighbor of
+        the first, so the first element moves next to a nearby stop.
         
         Args:
             state (List[int]): Current solution.
@@ -49,9 +115,41 @@ class SimulatedAnnealing:
         """
         neighbor = state.copy()
         idx1, idx2 = random.sample(range(len(state)), 2)
+        if self.neighbor_lists is not None and self.neighbor_lists.shape[1] > 0:
+            candidates = self.neighbor_lists[state[idx1]]
+            target = int(candidates[random.randrange(len(candidates))])
+            position = self._position_map(state)[target]
+            if position >= 0:
+                beside = position + 1 if position + 1 < len(state) and position + 1 != idx1 else position - 1
+                if 0 <= beside != idx1:
+                    idx2 = beside
         neighbor[idx1], neighbor[idx2] = neighbor[idx2], neighbor[idx1]
+        self._last_swap = (state, neighbor, idx1, idx2)
         return neighbor
 
+    def _position_map(self, state: List[int]) -> List[int]:
+        """
+        Position of every node in `state` (-1 when absent), rebuilt only when `state` is not the
+        state the map was last built or updated for.
+        """
+        if self._positions_of is not state:
+            positions = [-1] * max(len(self.neighbor_lists), max(state) + 1)
+            for index, node in enumerate(state):
+                positions[node] = index
+            self._positions, self._positions_of = positions, state
+        return self._positions
+
+    def _accepted(self, neighbor: List[int]):
+        """
+        Move the position map to an accepted neighbor in O(1) when it came from the last swap.
+        """
+        if self._last_swap is None:
+            return
+        state, swapped, idx1, idx2 = self._last_swap
+        if swapped is neighbor and self._positions_of is state:
+            self._positions[neighbor[idx1]], self._positions[neighbor[idx2]] = idx1, idx2
+            self._positions_of = neighbor
+
     def acceptance_probability(self, current_fitness: float, neighbor_fitness: float) -> float:
         """
         Calculate the acceptance probability for a (possibly worse) solution.
@@ -67,30 +165,166 @@ class SimulatedAnnealing:
             return 1.0
         return math.exp((neighbor_fitness - current_fitness) / self.temp)
 
-    def run(self) -> Tuple[List[int], float]:
+    def _run_moves(self, max_levels: Optional[int], stopping: StoppingCriteria,
+                   progress: Optional[ProgressReporter]) -> Tuple[List[int], float]:
+        """
+        Anneal using batched move proposals scored by O(1) deltas against the distance matrix.
+
+        Each batch is scored in one vectorized step; the first accepted move is applied and the rest of
+        the batch is discarded, so every proposal is still judged against the current route.
+        Fitness is the negative route length.
+
+        Args:
+            max_levels (int, optional): Maximum number of temperature levels.
+            stopping (StoppingCriteria): Started deadline and stagnation criteria.
+            progress (ProgressReporter, optional): Receives sampled per-level progress events.
+
+        Returns:
+            Tuple[List[int], float]: The best route found and its fitness.
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        if self.time_windows is None:
+            neighborhood = TourNeighborhood(self.distance_matrix, self.state, self.closed, self.moves, rng=rng,
+                                            neighbor_lists=self.neighbor_lists, tour_matrix=self.tour_matrix)
+            schedule = None
+        else:
+            neighborhood = TourNeighborhood(self.distance_matrix, self.state, self.closed, ("or_opt",),
+                                            max_segment=1, rng=rng, neighbor_lists=self.neighbor_lists,
+                                            tour_matrix=self.tour_matrix)
+            schedule = self.time_windows.schedule(neighborhood.route())
+        best_tour = neighborhood.tour.copy()
+        best_length = neighborhood.length
+        evaluated_before = self.evaluated_moves
+        stop_reason = COMPLETED
+
+        batch_size = self.batch_size
+        levels = 0
+        while self.temp > self.min_temp and (max_levels is None or levels < max_levels):
+            remaining = self.max_iter
+            while remaining > 0 and neighborhood.valid:
+                if stopping.out_of_time():
+                    stop_reason = TIME_LIMIT
+                    break
+                move, params, deltas = neighborhood.propose(min(batch_size, remaining))
+                if schedule is not None:
+                    # Tour positions match schedule positions: the open tour's dummy node is the depot.
+                    i, _, p = params
+                    deltas = np.where(schedule.relocation_feasible(i, p + 1), deltas, np.inf)
+                # Improvements are always accepted; worse moves with probability exp(-delta / T).
+                accepted = np.flatnonzero(np.exp(-np.maximum(deltas, 0.0) / self.temp) > rng.random(len(deltas)))
+                if accepted.size == 0:
+                    remaining -= len(deltas)
+                    self.evaluated_moves += len(deltas)
+                    # Rejections dominate at low temperature, so larger batches waste less.
+                    batch_size = min(batch_size * 2, self.max_batch_size)
+                    continue
+                k = int(accepted[0])
+                batch_size = max(self.batch_size, min(2 * (k + 1), self.max_batch_size))
+                remaining -= k + 1
+                self.evaluated_moves += k + 1
+                neighborhood.apply(move, params, k, deltas[k])
+                if schedule is not None:
+                    schedule = self.time_windows.schedule(neighborhood.route())
+                if neighborhood.length < best_length:
+                    best_tour = neighborhood.tour.copy()
+                    best_length = neighborhood.length
+            if stop_reason != COMPLETED:
+                break
+            levels += 1
+            self.temp *= self.cooling_rate
+            if progress is not None:
+                progress.report(levels, -best_length, self.evaluated_moves - evaluated_before, stopping.elapsed())
+            reason = stopping.update(-best_length)
+            if reason is not None:
+                stop_reason = reason
+                break
+
+        self.final_state = neighborhood.route()
+        self.final_fitness = -neighborhood.length
+        neighborhood.tour = best_tour
+        best_state = neighborhood.route()
+        best_fitness = -route_length(self.distance_matrix, best_state, self.closed)
+        self.last_run_stats = RunStats("simulated_annealing", levels, self.evaluated_moves - evaluated_before,
+                                       stopping.elapsed(), best_fitness, stop_reason)
+        self._report_final(progress)
+        return best_state, best_fitness
+
+    def _report_final(self, progress: Optional[ProgressReporter]):
+        if progress is not None:
+            stats = self.last_run_stats
+            progress.report(stats.iterations, stats.best_fitness, stats.evaluations, stats.elapsed, final=True)
+
+    def run(self, max_levels: Optional[int] = None, stopping: Optional[StoppingCriteria] = None,
+            progress: Optional[ProgressReporter] = None) -> Tuple[List[int], float]:
         """
         Execute the simulated annealing algorithm.
+
+        The run stops early, returning the best-so-far solution, when the stopping criteria's deadline
+        passes (checked within temperature levels) or the best fitness stagnates for `patience` levels.
+        Details are recorded in `last_run_stats`. After the run, `final_state` and `final_fitness` hold
+        the chain's current (not best) state, which lets callers such as parallel tempering continue it.
+        
+        Args:
+            max_levels (int, optional): Stop after this many temperature levels even if `min_temp`
+                has not been reached.
+            stopping (StoppingCriteria, optional): Deadline and stagnation criteria.
+            progress (ProgressReporter, optional): Receives sampled per-level progress events.
         
         Returns:
             Tuple[List[int], float]: The best solution found and its corresponding fitness.
         """
+        stopping = stopping or StoppingCriteria()
+        if stopping.started_at is None:
+            stopping.start()
+        if self.distance_matrix is not None:
+            return self._run_moves(max_levels, stopping, progress)
+
         current_state = self.state.copy()
         best_state = current_state.copy()
-        current_fitness = self.fitness_fn(current_state)
+        current_fitness = float(self.fitness_fn(current_state))
         best_fitness = current_fitness
+        evaluations = 1
+        stop_reason = COMPLETED
 
-        while self.temp > self.min_temp:
-            for _ in range(self.max_iter):
-                neighbor = self.get_neighbor(current_state)
-                neighbor_fitness = self.fitness_fn(neighbor)
+        levels = 0
+        while self.temp > self.min_temp and (max_levels is None or levels < max_levels):
+            for iteration in range(self.max_iter):
+                # Checking the clock every 64 iterations keeps its cost out of the hot loop.
+                if iteration % 64 == 0 and stopping.out_of_time():
+                    stop_reason = TIME_LIMIT
+                    break
+                if self.candidates == 1:
+                    neighbor = self.get_neighbor(current_state)
+                    neighbor_fitness = float(self.fitness_fn(neighbor))
+                else:
+                    neighbors = [self.get_neighbor(current_state) for _ in range(self.candidates)]
+                    scores = parallel_map(self.executor, self.fitness_fn, neighbors)
+                    best_index = max(range(len(scores)), key=scores.__getitem__)
+                    neighbor, neighbor_fitness = neighbors[best_index], float(scores[best_index])
+                evaluations += self.candidates
                 if self.acceptance_probability(current_fitness, neighbor_fitness) > random.random():
+                    if self.neighbor_lists is not None:
+                        self._accepted(neighbor)
                     current_state = neighbor
                     current_fitness = neighbor_fitness
                     if current_fitness > best_fitness:
                         best_state = current_state.copy()
                         best_fitness = current_fitness
+            if stop_reason != COMPLETED:
+                break
+            levels += 1
             self.temp *= self.cooling_rate
-            print(f"Temperature: {self.temp:.4f}, Best Fitness: {best_fitness:.4f}")
+            if progress is not None:
+                progress.report(levels, best_fitness, evaluations, stopping.elapsed())
+            reason = stopping.update(best_fitness)
+            if reason is not None:
+                stop_reason = reason
+                break
+        self.final_state = current_state
+        self.final_fitness = current_fitness
+        self.last_run_stats = RunStats("simulated_annealing", levels, evaluations, stopping.elapsed(),
+                                       best_fitness, stop_reason)
+        self._report_final(progress)
         return best_state, best_fitness
 
 # Example usage:
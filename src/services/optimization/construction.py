@@ -0,0 +1,340 @@
+"""
+Construction heuristics that build good routes in milliseconds, to seed GA and SA runs.
+
+This module provides:
+- nearest_neighbor: repeatedly visits the closest unvisited stop. With k-nearest candidate lists
+  (from `GridIndex.candidate_lists`, see `src/core/spatial_index.py`) it only compares the current
+  stop's candidates, and scans the whole matrix row only once all of them have been visited.
+- savings: Clarke-Wright savings; starts with one route per stop and merges route ends in order of
+  decreasing savings d(i, depot) + d(depot, j) - d(i, j), optionally respecting a vehicle capacity.
+- cheapest_insertion: repeatedly inserts the stop whose cheapest insertion into the current route
+  adds the least length; insertion costs are updated incrementally after each insertion.
+- construct / initial_solutions: dispatch by name, and a diverse set of seeds for a GA population.
+
+Every heuristic returns a permutation of the given nodes. With a depot, the route is built as if
+it leaves from the depot (and returns to it for closed routes); the depot itself is not included.
+Capacitated savings returns its routes concatenated as one giant tour (see `cvrp.py`).
+
+Assumptions:
+- Nodes are integer indices into the distance matrix.
+- Without a depot, savings uses the medoid stop (smallest total distance to the others) as hub.
+"""
+
+import random
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+CONSTRUCTION_METHODS = ("nearest_neighbor", "savings", "cheapest_insertion")
+
+def nearest_neighbor(matrix: np.ndarray, nodes: Sequence[int], start: Optional[int] = None,
+                     depot: Optional[int] = None, neighbor_lists: Optional[np.ndarray] = None) -> List[int]:
+    """
+    Nearest-neighbor route.
+
+    Args:
+        matrix (np.ndarray): Distance matrix.
+        nodes (Sequence[int]): Nodes to visit.
+        start (int, optional): First node of the route (one of `nodes`); defaults to the node closest to
+            the depot, or to nodes[0] without a depot.
+        depot (int, optional): Node the route leaves from (not part of the route).
+        neighbor_lists (np.ndarray, optional): Candidate neighbors per node, shape (N, k), nearest first.
+            The closest unvisited candidate is the closest unvisited stop, so the full row is only
+            scanned when every candidate has been visited (or is not one of `nodes`).
+
+    Returns:
+        List[int]: Route visiting every node once.
+    """
+    matrix = np.asarray(matrix)
+    nodes = np.asarray(nodes, dtype=np.intp)
+    unvisited = np.ones(len(nodes), dtype=bool)
+    local = None
+    if neighbor_lists is not None and np.asarray(neighbor_lists).shape[1] > 0:
+        neighbor_lists = np.asarray(neighbor_lists, dtype=np.intp)
+        # Position of each node in `nodes` (-1 for nodes not to be visited).
+        local = np.full(max(matrix.shape[0], len(neighbor_lists)), -1, dtype=np.intp)
+        local[nodes] = np.arange(len(nodes))
+    if start is not None:
+        current = int(np.flatnonzero(nodes == start)[0])
+    elif depot is not None:
+        current = int(np.argmin(matrix[depot, nodes]))
+    else:
+        current = 0
+    order = [current]
+    unvisited[current] = False
+    for _ in range(len(nodes) - 1):
+        node = nodes[current]
+        following = -1
+        if local is not None:
+            candidates = local[neighbor_lists[node]]
+            candidates = candidates[candidates >= 0]
+            candidates = candidates[unvisited[candidates]]
+            if len(candidates):
+                following = int(candidates[np.argmin(matrix[node, nodes[candidates]])])
+        if following < 0:
+            following = int(np.argmin(np.where(unvisited, matrix[node, nodes], np.inf)))
+        current = following
+        order.append(current)
+        unvisited[current] = False
+    return nodes[order].tolist()
+
+def _extended_matrix(matrix: np.ndarray, nodes: np.ndarray, depot: Optional[int], closed: bool) -> np.ndarray:
+    """
+    Matrix over the nodes plus an anchor at index n: the depot, or for open routes without a depot
+    a dummy node at zero distance. Open routes may end anywhere, so returning to the anchor is free.
+    """
+    n = len(nodes)
+    matrix = np.asarray(matrix, dtype=np.float64)
+    extended = np.zeros((n + 1, n + 1))
+    extended[:n, :n] = matrix[np.ix_(nodes, nodes)]
+    if depot is not None:
+        extended[n, :n] = matrix[depot, nodes]
+        if closed:
+            extended[:n, n] = matrix[nodes, depot]
+    return extended
+
+def cheapest_insertion(matrix: np.ndarray, nodes: Sequence[int], depot: Optional[int] = None,
+                       closed: bool = False) -> List[int]:
+    """
+    Cheapest-insertion route, in O(n^2) time.
+
+    Each stop keeps its cheapest insertion edge. After an insertion splits edge (a, b) into (a, u)
+    and (u, b), only the two new edges are compared against every stop's best cost, and stops whose
+    best edge was (a, b) are re-scored against the whole route.
+
+    Args:
+        matrix (np.ndarray): Distance matrix.
+        nodes (Sequence[int]): Nodes to visit.
+        depot (int, optional): Node the route leaves from (not part of the route).
+        closed (bool): Whether the route returns to its start (or to the depot).
+
+    Returns:
+        List[int]: Route visiting every node once.
+    """
+    nodes = np.asarray(nodes, dtype=np.intp)
+    n = len(nodes)
+    if closed and depot is None:
+        # A closed tour has no start; anchor it at the first node.
+        extended = np.asarray(matrix, dtype=np.float64)[np.ix_(nodes, nodes)]
+        anchor = 0
+    else:
+        extended = _extended_matrix(matrix, nodes, depot, closed)
+        anchor = n
+    size = extended.shape[0]
+
+    following = np.full(size, -1, dtype=np.intp)
+    following[anchor] = anchor
+    routed = [anchor]
+    pending = np.ones(size, dtype=bool)
+    pending[anchor] = False
+    best_cost = np.where(pending, extended[anchor] + extended[:, anchor] - extended[anchor, anchor], np.inf)
+    best_edge = np.full(size, anchor, dtype=np.intp)
+
+    for _ in range(int(pending.sum())):
+        u = int(np.argmin(best_cost))
+        a = int(best_edge[u])
+        b = int(following[a])
+        following[a], following[u] = u, b
+        routed.append(u)
+        pending[u] = False
+        best_cost[u] = np.inf
+        if not pending.any():
+            break
+
+        candidates = np.flatnonzero(pending)
+        via_a = extended[a, candidates] + extended[candidates, u] - extended[a, u]
+        via_u = extended[u, candidates] + extended[candidates, b] - extended[u, b]
+        stale = best_edge[candidates] == a
+        cost = best_cost[candidates]
+        edge = best_edge[candidates]
+        better_a = via_a < cost
+        cost, edge = np.where(better_a, via_a, cost), np.where(better_a, a, edge)
+        better_u = via_u < cost
+        cost, edge = np.where(better_u, via_u, cost), np.where(better_u, u, edge)
+
+        # Stops whose best edge (a, b) no longer exists are re-scored against every edge.
+        if stale.any():
+            starts = np.asarray(routed, dtype=np.intp)
+            ends = following[starts]
+            stale_nodes = candidates[stale]
+            costs = (extended[starts][:, stale_nodes] + extended[stale_nodes][:, ends].T
+                     - extended[starts, ends][:, np.newaxis])
+            cheapest = np.argmin(costs, axis=0)
+            cost[stale] = costs[cheapest, np.arange(len(stale_nodes))]
+            edge[stale] = starts[cheapest]
+        best_cost[candidates], best_edge[candidates] = cost, edge
+
+    order = []
+    current = int(following[anchor]) if anchor == n else anchor
+    while len(order) < n:
+        order.append(current)
+        current = int(following[current])
+    return nodes[order].tolist()
+
+def savings(matrix: np.ndarray, nodes: Sequence[int], depot: Optional[int] = None,
+            demands: Optional[Sequence[float]] = None, capacity: Optional[float] = None,
+            candidates: int = 100) -> List[int]:
+    """
+    Clarke-Wright savings route (or giant tour of capacity-feasible routes).
+
+    Only each stop's `candidates` best merge partners are considered, so the merge loop is
+    O(n * candidates log(n * candidates)). Route ends are joined in either direction (the savings use
+    the symmetric part of the matrix). Routes left unmerged are chained greedily by connecting each
+    route's end to the nearest remaining route, entered at whichever end is closer.
+
+    Args:
+        matrix (np.ndarray): Distance matrix.
+        nodes (Sequence[int]): Nodes to visit.
+        depot (int, optional): Depot node; defaults to the medoid of `nodes`, which then starts the route.
+        demands (Sequence[float], optional): Demand per node (indexed by node), to cap route loads.
+        capacity (float, optional): Vehicle capacity; routes are not merged beyond it.
+        candidates (int): Merge partners considered per stop.
+
+    Returns:
+        List[int]: Route (or concatenated routes) visiting every node once.
+    """
+    nodes = np.asarray(nodes, dtype=np.intp)
+    matrix = np.asarray(matrix, dtype=np.float64)
+    hub = None
+    if depot is None:
+        sub = matrix[np.ix_(nodes, nodes)]
+        hub = int(nodes[int(np.argmin(sub.sum(axis=1)))])
+        depot, nodes = hub, nodes[nodes != hub]
+    n = len(nodes)
+    if n <= 1:
+        return ([hub] if hub is not None else []) + nodes.tolist()
+
+    # Merges may reverse a route, so savings use the symmetric part of the matrix.
+    sub = matrix[np.ix_(nodes, nodes)]
+    sub = (sub + sub.T) / 2.0
+    to_depot = (matrix[nodes, depot] + matrix[depot, nodes]) / 2.0
+    gain = to_depot[:, np.newaxis] + to_depot[np.newaxis, :] - sub
+    np.fill_diagonal(gain, -np.inf)
+    k = min(candidates, n - 1)
+    partners = np.argpartition(-gain, k - 1, axis=1)[:, :k]
+    firsts = np.repeat(np.arange(n), k)
+    seconds = partners.ravel()
+    unique = firsts < seconds
+    firsts, seconds = firsts[unique], seconds[unique]
+    order = np.argsort(-gain[firsts, seconds], kind="stable")
+
+    # Routes are paths in an undirected adjacency list; a stop can be merged while it is an end.
+    parent = list(range(n))
+    adjacent = [[] for _ in range(n)]
+    load = [0.0] * n if demands is None else np.asarray(demands, dtype=np.float64)[nodes].tolist()
+    limit = np.inf if capacity is None else capacity
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j in zip(firsts[order].tolist(), seconds[order].tolist()):
+        if len(adjacent[i]) > 1 or len(adjacent[j]) > 1:
+            continue
+        ri, rj = find(i), find(j)
+        if ri == rj or load[ri] + load[rj] > limit:
+            continue
+        adjacent[i].append(j)
+        adjacent[j].append(i)
+        parent[rj] = ri
+        load[ri] += load[rj]
+
+    routes = []
+    seen = [False] * n
+    for end in range(n):
+        if seen[end] or len(adjacent[end]) > 1:
+            continue
+        route, previous, current = [], -1, end
+        while current != -1:
+            route.append(current)
+            seen[current] = True
+            following = [x for x in adjacent[current] if x != previous]
+            previous, current = current, (following[0] if following else -1)
+        routes.append(route)
+
+    # Chain the routes: start at the route end closest to the depot, then repeatedly enter the
+    # nearest remaining route at whichever of its ends is closer.
+    def nearest(origin: int) -> Tuple[int, bool]:
+        distances = [(matrix[origin, nodes[route[0]]], r, False) for r, route in remaining.items()]
+        distances += [(matrix[origin, nodes[route[-1]]], r, True) for r, route in remaining.items()]
+        _, r, reverse = min(distances)
+        return r, reverse
+
+    remaining = dict(enumerate(routes))
+    chained = []
+    current, reverse = nearest(depot)
+    while True:
+        route = remaining.pop(current)
+        chained.extend(route[::-1] if reverse else route)
+        if not remaining:
+            break
+        current, reverse = nearest(int(nodes[chained[-1]]))
+    return ([hub] if hub is not None else []) + nodes[chained].tolist()
+
+def construct(method: str, matrix: np.ndarray, nodes: Sequence[int], depot: Optional[int] = None,
+              closed: bool = False, start: Optional[int] = None,
+              neighbor_lists: Optional[np.ndarray] = None) -> List[int]:
+    """
+    Build a route with the named heuristic ("nearest_neighbor", "savings", "cheapest_insertion").
+
+    `neighbor_lists` (candidate neighbors per node) speeds up nearest_neighbor; the others ignore it.
+    """
+    if method == "nearest_neighbor":
+        return nearest_neighbor(matrix, nodes, start=start, depot=depot, neighbor_lists=neighbor_lists)
+    if method == "savings":
+        return savings(matrix, nodes, depot=depot)
+    if method == "cheapest_insertion":
+        return cheapest_insertion(matrix, nodes, depot=depot, closed=closed)
+    raise ValueError(f"Unknown construction method {method!r}; expected one of {CONSTRUCTION_METHODS}.")
+
+def initial_solutions(matrix: np.ndarray, nodes: Sequence[int], count: int, depot: Optional[int] = None,
+                      closed: bool = False, neighbor_lists: Optional[np.ndarray] = None) -> List[List[int]]:
+    """
+    A diverse set of constructed routes to seed a GA population.
+
+    Returns the savings and cheapest-insertion routes followed by nearest-neighbor routes from
+    distinct random start nodes (drawn with `random`, so `random.seed` keeps it reproducible).
+
+    Args:
+        matrix (np.ndarray): Distance matrix.
+        nodes (Sequence[int]): Nodes to visit.
+        count (int): Number of routes to return.
+        depot (int, optional): Node the routes leave from (not part of the routes).
+        closed (bool): Whether routes return to their start (or to the depot).
+        neighbor_lists (np.ndarray, optional): Candidate neighbors per node, used by nearest_neighbor.
+
+    Returns:
+        List[List[int]]: Up to `count` routes (at most two plus one per node).
+    """
+    solutions = []
+    for method in ("savings", "cheapest_insertion"):
+        if len(solutions) < count:
+            solutions.append(construct(method, matrix, nodes, depot=depot, closed=closed))
+    starts = random.sample(list(nodes), min(max(count - len(solutions), 0), len(nodes)))
+    solutions.extend(nearest_neighbor(matrix, nodes, start=start, depot=depot, neighbor_lists=neighbor_lists)
+                     for start in starts)
+    return solutions
+
+# Example usage:
+if __name__ == "__main__":
+    import time
+    from src.core.distance_matrix import haversine_matrix, route_length
+
+    rng = np.random.default_rng(0)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 500), rng.uniform(54.0, 55.0, 500)])
+    matrix = haversine_matrix(coordinates)
+    stops = list(range(500))
+    random_route = rng.permutation(500).tolist()
+    print(f"{'random':>18}: {route_length(matrix, random_route):9.1f} km")
+    for method in CONSTRUCTION_METHODS:
+        start = time.perf_counter()
+        route = construct(method, matrix, stops)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{method:>18}: {route_length(matrix, route):9.1f} km in {elapsed:.1f} ms")
+    from src.core.spatial_index import candidate_lists
+    lists = candidate_lists(coordinates, 10)
+    start = time.perf_counter()
+    route = nearest_neighbor(matrix, stops, neighbor_lists=lists)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{'nearest (grid)':>18}: {route_length(matrix, route):9.1f} km in {elapsed:.1f} ms")
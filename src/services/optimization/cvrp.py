@@ -0,0 +1,182 @@
+"""
+Capacitated multi-vehicle routing (CVRP) through giant-tour splitting.
+
+This module lets the single-permutation optimizers (GA, SA, ...) solve multi-vehicle problems:
+- A solution is a "giant tour": one permutation of all stops without depot visits.
+- split_giant_tour optimally cuts a giant tour into consecutive per-vehicle routes that start
+  and end at the depot and respect each vehicle's capacity, with a dynamic program over the
+  vehicles. Each vehicle layer is computed with a sliding-window minimum (monotone deque), so a
+  split takes O(n * K) time for n stops and K vehicles.
+- GiantTourSplitFitness scores a giant tour by its optimal split, so the existing crossover and
+  mutation operators apply unchanged.
+
+Heterogeneous fleets are supported: vehicles are used in order of decreasing capacity, i.e. the
+r-th route of the giant tour is served by the r-th largest vehicle.
+
+Assumptions:
+- The distance matrix includes the depot (node `depot`, 0 by default) and every stop.
+- Demands are indexed by node; the depot's demand is ignored.
+- Higher fitness is better (fitness is the negative total distance).
+"""
+
+import bisect
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+def _vehicle_order(capacities: Sequence[float]) -> List[int]:
+    """
+    Vehicle indices by decreasing capacity (stable, so equal vehicles keep their order).
+    """
+    return sorted(range(len(capacities)), key=lambda v: -capacities[v])
+
+def split_giant_tour(tour: Sequence[int], matrix: np.ndarray, demands: Sequence[float],
+                     capacities: Sequence[float], depot: int = 0) -> Tuple[float, List[List[int]]]:
+    """
+    Optimally split a giant tour into capacity-feasible routes, one per vehicle at most.
+
+    Route costs include the legs from and back to the depot. Layer k of the dynamic program holds
+    the cheapest cost of serving the first j stops of the tour with the k largest vehicles; only
+    the band of j that can still lead to a complete, capacity-feasible split is computed.
+
+    Args:
+        tour (Sequence[int]): Giant tour (stop node indices, depot excluded).
+        matrix (np.ndarray): Distance matrix over the depot and all stops.
+        demands (Sequence[float]): Demand per node.
+        capacities (Sequence[float]): Capacity per vehicle.
+        depot (int): Depot node index.
+
+    Returns:
+        Tuple[float, List[List[int]]]: Total distance and the route of each vehicle (in the order of
+        `capacities`, empty for unused vehicles); (inf, []) if no split fits the fleet.
+    """
+    n = len(tour)
+    order = _vehicle_order(capacities)
+    if n == 0:
+        return 0.0, [[] for _ in capacities]
+    t = np.asarray(tour, dtype=np.intp)
+    legs = np.concatenate([[0.0], np.cumsum(matrix[t[:-1], t[1:]])]).tolist()  # legs[i]: t[0] -> t[i].
+    out = matrix[depot, t].tolist()
+    back = matrix[t, depot].tolist()
+    load = np.concatenate([[0.0], np.cumsum(np.asarray(demands, dtype=np.float64)[t])]).tolist()
+    sorted_caps = [float(capacities[v]) for v in order]
+    total_load = load[n]
+    suffix_capacity = np.concatenate([np.cumsum(sorted_caps[::-1])[::-1], [0.0]]).tolist()
+
+    inf = float("inf")
+    previous = [inf] * (n + 1)
+    previous[0] = 0.0
+    prev_lo, prev_hi = 0, 0  # Band of j where the previous layer is finite.
+    predecessors = []
+    best_cost, best_layers = inf, 0
+    for k, capacity in enumerate(sorted_caps, start=1):
+        # j must fit in the first k vehicles and leave a load the remaining vehicles can carry.
+        lo = bisect.bisect_left(load, total_load - suffix_capacity[k] - 1e-9, prev_lo + 1)
+        hi = min(n, bisect.bisect_right(load, load[prev_hi] + capacity + 1e-9) - 1)
+        current = [inf] * (n + 1)
+        pred = [-1] * (n + 1)
+        window = deque()
+        next_i = prev_lo
+        first = prev_lo
+        for j in range(lo, hi + 1):
+            # Push route starts i < j (route serves tour positions i..j-1).
+            while next_i < j and next_i <= prev_hi:
+                if previous[next_i] < inf:
+                    value = previous[next_i] + out[next_i] - legs[next_i]
+                    while window and window[-1][0] >= value:
+                        window.pop()
+                    window.append((value, next_i))
+                next_i += 1
+            # Drop route starts whose route would exceed this vehicle's capacity.
+            while load[j] - load[first] > capacity + 1e-9:
+                first += 1
+            while window and window[0][1] < first:
+                window.popleft()
+            if window:
+                value, i = window[0]
+                current[j] = value + legs[j - 1] + back[j - 1]
+                pred[j] = i
+        predecessors.append(pred)
+        if current[n] < best_cost:
+            best_cost, best_layers = current[n], k
+        finite = [j for j in range(lo, hi + 1) if current[j] < inf]
+        if not finite:
+            break
+        previous, prev_lo, prev_hi = current, finite[0], finite[-1]
+
+    if best_cost == inf:
+        return inf, []
+    routes = [[] for _ in capacities]
+    j = n
+    for k in range(best_layers, 0, -1):
+        i = predecessors[k - 1][j]
+        routes[order[k - 1]] = [int(node) for node in t[i:j]]
+        j = i
+    return float(best_cost), routes
+
+class GiantTourSplitFitness:
+    def __init__(self, matrix: np.ndarray, demands: Sequence[float], capacities: Sequence[float], depot: int = 0,
+                 excess_vehicle_penalty: Optional[float] = None):
+        """
+        Fitness of a giant tour: the negative total distance of its optimal split.
+
+        Giant tours that cannot be split within the fleet are scored below every feasible tour:
+        by the split with unlimited vehicles of the largest capacity, plus a penalty per extra vehicle.
+
+        Args:
+            matrix (np.ndarray): Distance matrix over the depot and all stops.
+            demands (Sequence[float]): Demand per node.
+            capacities (Sequence[float]): Capacity per vehicle.
+            depot (int): Depot node index.
+            excess_vehicle_penalty (float, optional): Penalty per vehicle beyond the fleet; defaults to
+                the cost of serving every stop with its own round trip (an upper bound on feasible costs).
+        """
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+        self.demands = np.asarray(demands, dtype=np.float64)
+        self.capacities = [float(capacity) for capacity in capacities]
+        self.depot = depot
+        stops = [node for node in range(self.matrix.shape[0]) if node != depot]
+        if stops and self.demands[stops].max() > max(self.capacities, default=0.0):
+            raise ValueError("A stop's demand exceeds the largest vehicle capacity.")
+        if excess_vehicle_penalty is None:
+            excess_vehicle_penalty = float((self.matrix[depot, stops] + self.matrix[stops, depot]).sum())
+        self.excess_vehicle_penalty = excess_vehicle_penalty
+
+    @property
+    def stops(self) -> List[int]:
+        """
+        Stop node indices (every node except the depot).
+        """
+        return [node for node in range(self.matrix.shape[0]) if node != self.depot]
+
+    def split(self, tour: Sequence[int]) -> Tuple[float, List[List[int]]]:
+        """
+        Optimal split of a giant tour within the fleet (see `split_giant_tour`).
+        """
+        return split_giant_tour(tour, self.matrix, self.demands, self.capacities, self.depot)
+
+    def __call__(self, tour: Sequence[int]) -> float:
+        cost, _ = self.split(tour)
+        if cost < float("inf"):
+            return -cost
+        # Unlimited fleet of the largest vehicle: always feasible, and tells how many vehicles are missing.
+        unlimited = [max(self.capacities)] * len(tour)
+        cost, routes = split_giant_tour(tour, self.matrix, self.demands, unlimited, self.depot)
+        excess = sum(1 for route in routes if route) - len(self.capacities)
+        return -(cost + self.excess_vehicle_penalty * max(excess, 1))
+
+# Example usage:
+if __name__ == "__main__":
+    import random
+    from src.core.distance_matrix import haversine_matrix
+
+    rng = np.random.default_rng(0)
+    depot_and_stops = np.column_stack([rng.uniform(24.0, 25.0, 41), rng.uniform(54.0, 55.0, 41)])
+    matrix = haversine_matrix(depot_and_stops)
+    demands = np.concatenate([[0.0], rng.integers(1, 10, 40)])
+    fitness = GiantTourSplitFitness(matrix, demands, capacities=[60, 60, 50, 50, 40])
+    tour = random.sample(fitness.stops, len(fitness.stops))
+    cost, routes = fitness.split(tour)
+    print(f"Total distance: {cost:.1f} km")
+    for vehicle, route in enumerate(routes):
+        print(f"Vehicle {vehicle}: load={demands[route].sum():.0f} stops={route}")
@@ -2,25 +2,88 @@
 Core orchestration to select and run the appropriate optimization algorithm.
 
 This module integrates multiple optimization strategies:
-- Genetic Algorithm (via genetic.py)
-- Simulated Annealing (via simulated_annealing.py)
-- Reinforcement Learning (via reinforcement_learning.py)
+- Genetic Algorithm (via genetic.py), optionally as an island model across processes (via island.py)
+- Simulated Annealing (via simulated_annealing.py), with parallel tempering and multi-start
+  modes across processes (via parallel_tempering.py)
+- Reinforcement Learning (via reinforcement_learning.py), trained on batched rollouts of a
+  vectorized route-adjustment environment (via route_environment.py), with TensorFlow-free
+  action selection from exported policies (via numpy_policy.py)
+- Time-window-aware routing (via time_windows.py): a lateness-penalized fitness, and feasibility-
+  preserving simulated annealing moves checked in O(1) from precomputed slack
+- Capacitated multi-vehicle routing (via cvrp.py), which runs any of the permutation algorithms
+  on a giant tour that is split optimally into per-vehicle routes
+- Construction heuristics (via construction.py) that seed part of the GA population and the
+  simulated annealing / parallel tempering start state with good routes instead of random ones
+- k-nearest candidate lists (via src/core/spatial_index.py) that focus GA mutation and simulated
+  annealing moves on nearby stops
 
 The Optimizer class provides methods to select an optimization method based on configuration,
 execute the chosen method, and compare results. Fallback strategies are in place to ensure robust performance.
+Every method accepts a wall-clock `time_limit` and a stagnation `patience`, returns the best-so-far
+solution when either triggers, and records why the run stopped in `last_run_stats`. Convergence
+progress is delivered to an optional callback as sampled `ProgressEvent`s.
+
+Algorithm modules are loaded lazily through the ALGORITHMS registry on first use, so importing
+this module (and running the GA or SA) never imports TensorFlow; only the reinforcement learning
+run loads it.
 """
 
-from typing import List, Callable, Tuple
+from typing import Any, Dict, List, Callable, Tuple, Optional, Sequence, Union
 import random
+import importlib
 import numpy as np
 
-# Import the algorithms.
-from src.services.optimization.algorithms.genetic import GeneticAlgorithm
-from src.services.optimization.algorithms.simulated_annealing import SimulatedAnnealing
-from src.services.optimization.algorithms.reinforcement_learning import RLAgent
+from src.core.distance_matrix import haversine_matrix, RouteDistanceFitness, Coordinates
+from src.core.distance_cache import DistanceMatrixCache
+from src.core.spatial_index import candidate_lists
+from src.services.optimization.parallel import get_executor
+from src.services.optimization.stopping import StoppingCriteria, RunStats, COMPLETED, TIME_LIMIT
+from src.services.optimization.progress import ProgressCallback, ProgressReporter, make_reporter
+from src.services.optimization.cvrp import GiantTourSplitFitness
+from src.services.optimization.time_windows import TimeWindows, TimeWindowFitness
+from src.services.optimization.construction import CONSTRUCTION_METHODS, construct, initial_solutions
+from src.services.optimization.route_environment import RouteAdjustmentEnv
+
+from src.services.optimization.algorithms.neighborhoods import MOVE_TYPES
+from src.services.optimization.algorithms.numpy_policy import NumpyPolicy
+
+# Algorithm classes by name, as (module, class); a module is imported when its algorithm is first used.
+ALGORITHMS: Dict[str, Tuple[str, str]] = {
+    "genetic": ("src.services.optimization.algorithms.genetic", "GeneticAlgorithm"),
+    "island_genetic": ("src.services.optimization.algorithms.island", "IslandModel"),
+    "simulated_annealing": ("src.services.optimization.algorithms.simulated_annealing", "SimulatedAnnealing"),
+    "parallel_tempering": ("src.services.optimization.algorithms.parallel_tempering", "ParallelTempering"),
+    "multistart_annealing": ("src.services.optimization.algorithms.parallel_tempering", "MultiStartAnnealing"),
+    "reinforcement_learning": ("src.services.optimization.algorithms.reinforcement_learning", "RLAgent"),
+}
+_loaded_algorithms: Dict[str, type] = {}
+
+def load_algorithm(name: str) -> type:
+    """
+    Return an algorithm class from the registry, importing its module on first use.
+
+    Args:
+        name (str): Registry name (see ALGORITHMS).
+
+    Returns:
+        type: The algorithm class.
+    """
+    algorithm = _loaded_algorithms.get(name)
+    if algorithm is None:
+        if name not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {name!r}; expected one of {sorted(ALGORITHMS)}.")
+        module, attribute = ALGORITHMS[name]
+        algorithm = _loaded_algorithms[name] = getattr(importlib.import_module(module), attribute)
+    return algorithm
 
 class Optimizer:
-    def __init__(self, fitness_fn: Callable[[List[int]], float], gene_pool: List[int], chromosome_length: int):
+    def __init__(self, fitness_fn: Callable[[List[int]], float], gene_pool: List[int], chromosome_length: int,
+                 distance_matrix: Optional[np.ndarray] = None,
+                 batch_fitness_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                 executor: Optional[str] = None, max_workers: Optional[int] = None, closed: bool = False,
+                 progress_callback: Optional[ProgressCallback] = None, progress_every: int = 1,
+                 progress_min_interval: float = 0.0, time_windows: Optional[TimeWindows] = None,
+                 neighbor_lists: Optional[np.ndarray] = None):
         """
         Initialize the Optimizer with a fitness function, gene pool, and chromosome length.
         
@@ -28,53 +91,364 @@ class Optimizer:
             fitness_fn (Callable[[List[int]], float]): Function to evaluate a chromosome.
             gene_pool (List[int]): List of available genes.
             chromosome_length (int): Length of each chromosome.
+            distance_matrix (np.ndarray, optional): Precomputed distance matrix indexed by gene. When set,
+                simulated annealing optimizes route length through it with O(1) move deltas.
+            batch_fitness_fn (Callable[[np.ndarray], np.ndarray], optional): Vectorized fitness over a
+                population array; when set, the genetic algorithm runs in batch mode.
+            executor (str, optional): "process" or "thread" to evaluate fitness in parallel using a shared
+                pool that is reused across runs; None evaluates serially.
+            max_workers (int, optional): Pool size; defaults to the number of CPUs.
+            closed (bool): Whether routes through `distance_matrix` are closed tours.
+            progress_callback (ProgressCallback, optional): Receives sampled progress events of every run
+                (e.g. `progress.logging_callback(logger)`); nothing is reported when None.
+            progress_every (int): Report every N-th generation, temperature level, round, or step.
+            progress_min_interval (float): Minimum seconds between reported events.
+            time_windows (TimeWindows, optional): Time windows that simulated annealing keeps routes feasible
+                for in move mode (see `from_coordinates`).
+            neighbor_lists (np.ndarray, optional): k-nearest candidate neighbors per gene, shape (N, k); GA
+                mutation and simulated annealing neighbors are restricted to them.
         """
         self.fitness_fn = fitness_fn
         self.gene_pool = gene_pool
         self.chromosome_length = chromosome_length
+        self.distance_matrix = distance_matrix
+        self.batch_fitness_fn = batch_fitness_fn
+        self.executor = executor
+        self.max_workers = max_workers
+        self.closed = closed
+        self.progress_callback = progress_callback
+        self.progress_every = progress_every
+        self.progress_min_interval = progress_min_interval
+        self.time_windows = time_windows
+        self.neighbor_lists = neighbor_lists
+        self.last_run_stats = None
+
+    @staticmethod
+    def _stopping(time_limit: Optional[float], patience: Optional[int]) -> StoppingCriteria:
+        """
+        Start the stopping criteria for a run, so that setup time counts against the budget.
+        """
+        return StoppingCriteria(time_limit=time_limit, patience=patience).start()
+
+    def _progress(self, algorithm: str) -> Optional[ProgressReporter]:
+        return make_reporter(algorithm, self.progress_callback, self.progress_every, self.progress_min_interval)
+
+    def _check_construction(self):
+        if self.distance_matrix is None:
+            raise ValueError("Construction heuristics require a distance matrix; build the optimizer with "
+                             "from_coordinates.")
+        if self.chromosome_length != len(self.gene_pool):
+            raise ValueError("Construction heuristics build routes through the whole gene pool.")
+
+    def construct_solution(self, method: str = "best") -> List[int]:
+        """
+        Build a route through the gene pool with a construction heuristic.
+
+        With time windows, routes are built as leaving from the depot.
+
+        Args:
+            method (str): "nearest_neighbor", "savings", "cheapest_insertion", or "best" (the fittest of the three).
+
+        Returns:
+            List[int]: The constructed route.
+        """
+        self._check_construction()
+        depot = None if self.time_windows is None else self.time_windows.depot
+        if method == "best":
+            routes = [construct(name, self.distance_matrix, self.gene_pool, depot, self.closed,
+                                neighbor_lists=self.neighbor_lists)
+                      for name in CONSTRUCTION_METHODS]
+            return max(routes, key=self.fitness_fn)
+        return construct(method, self.distance_matrix, self.gene_pool, depot, self.closed,
+                         neighbor_lists=self.neighbor_lists)
+
+    def construct_solutions(self, count: int) -> List[List[int]]:
+        """
+        Build up to `count` diverse routes through the gene pool (see `construction.initial_solutions`).
+        """
+        self._check_construction()
+        depot = None if self.time_windows is None else self.time_windows.depot
+        return initial_solutions(self.distance_matrix, self.gene_pool, count, depot, self.closed,
+                                 neighbor_lists=self.neighbor_lists)
+
+    def _initial_solution(self, initial_solution: Optional[List[int]], construction: Optional[str]) -> List[int]:
+        if initial_solution is not None:
+            return initial_solution
+        if construction is not None:
+            return self.construct_solution(construction)
+        return random.sample(self.gene_pool, self.chromosome_length)
+
+    def _get_executor(self):
+        """
+        Return the shared pool configured for this optimizer, or None for serial evaluation.
+        """
+        if self.executor is None:
+            return None
+        return get_executor(self.executor, self.max_workers)
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Coordinates, closed: bool = False, dtype: np.dtype = np.float64,
+                         cache: Optional[DistanceMatrixCache] = None, time_windows: Optional[TimeWindows] = None,
+                         lateness_penalty: float = 1.0, neighbors: Optional[int] = None) -> "Optimizer":
+        """
+        Build an Optimizer that minimizes route length over a set of stop coordinates.
+        
+        The distance matrix is computed once in bulk and shared by every algorithm run. With time
+        windows, routes leave from the depot (which is excluded from the gene pool) and are scored
+        with a lateness penalty; simulated annealing started from a feasible route keeps it feasible.
+        
+        Args:
+            coordinates (Coordinates): Stop coordinates of shape (N, 2) as (lat, lon).
+            closed (bool): If True, routes are scored as closed tours.
+            dtype (np.dtype): Distance matrix dtype (np.float32 halves memory); ignored when `cache` is set.
+            cache (DistanceMatrixCache, optional): On-disk matrix cache shared across runs and processes.
+            time_windows (TimeWindows, optional): Delivery windows over the same nodes (e.g. built with
+                `parse_delivery_windows` and `travel_time_matrix`).
+            lateness_penalty (float): Penalty per unit of lateness, in distance units, with time windows.
+            neighbors (int, optional): Build k-nearest candidate lists with a spatial grid index and focus
+                GA mutation and simulated annealing moves on them (10 is a good default for large problems).
+        
+        Returns:
+            Optimizer: Optimizer over genes 0..N-1 with a route-length fitness function.
+        """
+        if cache is not None:
+            matrix = cache.get_matrix(coordinates)
+        else:
+            matrix = haversine_matrix(coordinates, dtype=dtype)
+        gene_pool = list(range(matrix.shape[0]))
+        neighbor_lists = None if neighbors is None else candidate_lists(coordinates, neighbors)
+        if time_windows is not None:
+            gene_pool.remove(time_windows.depot)
+            fitness = TimeWindowFitness(matrix, time_windows, lateness_penalty, closed)
+            return cls(fitness, gene_pool, len(gene_pool), distance_matrix=matrix, closed=closed,
+                       time_windows=time_windows, neighbor_lists=neighbor_lists)
+        fitness = RouteDistanceFitness(matrix, closed)
+        return cls(fitness, gene_pool, len(gene_pool), distance_matrix=matrix,
+                   batch_fitness_fn=fitness.evaluate_batch, closed=closed, neighbor_lists=neighbor_lists)
 
     def run_genetic(self, generations: int = 50, population_size: int = 50,
-                    mutation_rate: float = 0.05, crossover_rate: float = 0.7) -> Tuple[List[int], float]:
+                    mutation_rate: float = 0.05, crossover_rate: float = 0.7,
+                    fitness_cache_size: int = 0, time_limit: Optional[float] = None,
+                    patience: Optional[int] = None, crossover_method: str = "ox",
+                    seed_fraction: float = 0.0) -> Tuple[List[int], float]:
         """
         Run the Genetic Algorithm optimization.
         
         Args:
-            generations (int): Number of generations.
+            generations (int): Maximum number of generations.
             population_size (int): Population size.
             mutation_rate (float): Mutation rate.
             crossover_rate (float): Crossover rate.
+            fitness_cache_size (int): Size of the cross-generation fitness cache (0 disables it).
+            time_limit (float, optional): Wall-clock budget in seconds.
+            patience (int, optional): Stop after this many generations without improvement.
+            crossover_method (str): "ox" (ordered), "pmx" (partially mapped), or "erx" (edge recombination).
+            seed_fraction (float): Fraction of the initial population built by construction heuristics
+                (requires a distance matrix); the rest is random.
         
         Returns:
             Tuple[List[int], float]: Best solution and its fitness.
         """
-        ga = GeneticAlgorithm(population_size, mutation_rate, crossover_rate, self.fitness_fn)
-        population = ga.initialize_population(self.gene_pool, self.chromosome_length)
-        best_solution, best_fitness = ga.run(self.gene_pool, self.chromosome_length, generations)
+        stopping = self._stopping(time_limit, patience)
+        seeds = None
+        if seed_fraction > 0.0:
+            seeds = self.construct_solutions(max(1, int(round(seed_fraction * population_size))))
+        GeneticAlgorithm = load_algorithm("genetic")
+        ga = GeneticAlgorithm(population_size, mutation_rate, crossover_rate, self.fitness_fn,
+                              fitness_cache_size=fitness_cache_size, batch_fitness_fn=self.batch_fitness_fn,
+                              executor=self._get_executor(), crossover_method=crossover_method,
+                              seed_solutions=seeds, neighbor_lists=self.neighbor_lists)
+        best_solution, best_fitness = ga.run(self.gene_pool, self.chromosome_length, generations, stopping,
+                                            self._progress("genetic"))
+        self.last_run_stats = ga.last_run_stats
         return best_solution, best_fitness
 
+    def run_island_genetic(self, num_islands: int = 4, generations: int = 50, population_size: int = 50,
+                           mutation_rate: float = 0.05, crossover_rate: float = 0.7, migration_interval: int = 10,
+                           migrants: int = 2, time_limit: Optional[float] = None,
+                           patience: Optional[int] = None, crossover_method: str = "ox") -> Tuple[List[int], float]:
+        """
+        Run the island-model Genetic Algorithm, one process per island.
+        
+        Args:
+            num_islands (int): Number of sub-populations evolved in parallel.
+            generations (int): Maximum number of generations per island.
+            population_size (int): Population size per island.
+            mutation_rate (float): Mutation rate.
+            crossover_rate (float): Crossover rate.
+            migration_interval (int): Generations between elite migrations.
+            migrants (int): Elites migrated from each island to the next.
+            time_limit (float, optional): Wall-clock budget in seconds, shared by all islands.
+            patience (int, optional): Stop once any island goes this many generations without improvement.
+            crossover_method (str): "ox" (ordered), "pmx" (partially mapped), or "erx" (edge recombination).
+        
+        Returns:
+            Tuple[List[int], float]: Best solution and its fitness.
+        """
+        stopping = self._stopping(time_limit, patience)
+        IslandModel = load_algorithm("island_genetic")
+        islands = IslandModel(num_islands, population_size, mutation_rate, crossover_rate, self.fitness_fn,
+                              migration_interval=migration_interval, migrants=migrants,
+                              batch_fitness_fn=self.batch_fitness_fn, crossover_method=crossover_method,
+                              neighbor_lists=self.neighbor_lists)
+        result = islands.run(self.gene_pool, self.chromosome_length, generations, stopping,
+                             self._progress("island_genetic"))
+        self.last_run_stats = islands.last_run_stats
+        return result
+
     def run_simulated_annealing(self, initial_solution: List[int] = None, initial_temp: float = 1000,
-                                cooling_rate: float = 0.95, min_temp: float = 1e-3, max_iter: int = 1000) -> Tuple[List[int], float]:
+                                cooling_rate: float = 0.95, min_temp: float = 1e-3, max_iter: int = 1000,
+                                candidates: int = 1, moves: Sequence[str] = MOVE_TYPES,
+                                time_limit: Optional[float] = None, patience: Optional[int] = None,
+                                construction: Optional[str] = None) -> Tuple[List[int], float]:
         """
         Run the Simulated Annealing optimization.
         
         Args:
-            initial_solution (List[int]): Starting solution; if None, generate randomly.
+            initial_solution (List[int]): Starting solution; if None, constructed or generated randomly.
             initial_temp (float): Starting temperature.
             cooling_rate (float): Cooling rate.
             min_temp (float): Minimum temperature threshold.
             max_iter (int): Maximum iterations per temperature level.
+            candidates (int): Neighbors evaluated per iteration (in parallel when an executor is configured).
+            moves (Sequence[str]): Move types used when a distance matrix is available.
+            time_limit (float, optional): Wall-clock budget in seconds.
+            patience (int, optional): Stop after this many temperature levels without improvement.
+            construction (str, optional): Construction heuristic for the starting solution (see
+                `construct_solution`); random when None.
         
         Returns:
             Tuple[List[int], float]: Best solution and its fitness.
         """
-        if initial_solution is None:
-            initial_solution = random.sample(self.gene_pool, self.chromosome_length)
-        sa = SimulatedAnnealing(initial_solution, self.fitness_fn, initial_temp, cooling_rate, min_temp, max_iter)
-        best_solution, best_fitness = sa.run()
+        stopping = self._stopping(time_limit, patience)
+        initial_solution = self._initial_solution(initial_solution, construction)
+        SimulatedAnnealing = load_algorithm("simulated_annealing")
+        sa = SimulatedAnnealing(initial_solution, self.fitness_fn, initial_temp, cooling_rate, min_temp, max_iter,
+                                candidates=candidates, executor=self._get_executor(),
+                                distance_matrix=self.distance_matrix, closed=self.closed, moves=moves,
+                                time_windows=self.time_windows, neighbor_lists=self.neighbor_lists)
+        best_solution, best_fitness = sa.run(stopping=stopping, progress=self._progress("simulated_annealing"))
+        self.last_run_stats = sa.last_run_stats
         return best_solution, best_fitness
 
+    def _annealing_kwargs(self, moves: Sequence[str]) -> dict:
+        """
+        SimulatedAnnealing arguments shared by the multi-chain modes.
+        """
+        return {"distance_matrix": self.distance_matrix, "closed": self.closed, "moves": moves,
+                "time_windows": self.time_windows, "neighbor_lists": self.neighbor_lists}
+
+    def run_parallel_tempering(self, initial_solution: List[int] = None, num_chains: int = 4, min_temp: float = 1.0,
+                               max_temp: float = 100.0, sweep_iterations: int = 1000, rounds: int = 20,
+                               moves: Sequence[str] = MOVE_TYPES, time_limit: Optional[float] = None,
+                               patience: Optional[int] = None,
+                               construction: Optional[str] = None) -> Tuple[List[int], float]:
+        """
+        Run parallel tempering: SA chains at fixed temperatures that periodically swap states.
+        
+        Chains run on a shared process pool (sized by `max_workers`), whatever `executor` is set to.
+        
+        Args:
+            initial_solution (List[int]): Starting solution; if None, constructed or generated randomly.
+            num_chains (int): Number of chains on the temperature ladder.
+            min_temp (float): Coldest temperature.
+            max_temp (float): Hottest temperature.
+            sweep_iterations (int): Iterations per chain between swap attempts.
+            rounds (int): Maximum number of sweep-then-swap rounds.
+            moves (Sequence[str]): Move types used when a distance matrix is available.
+            time_limit (float, optional): Wall-clock budget in seconds, shared by all chains.
+            patience (int, optional): Stop after this many rounds without improvement.
+            construction (str, optional): Construction heuristic for the starting solution (see
+                `construct_solution`); random when None.
+        
+        Returns:
+            Tuple[List[int], float]: Best solution and its fitness.
+        """
+        stopping = self._stopping(time_limit, patience)
+        initial_solution = self._initial_solution(initial_solution, construction)
+        ParallelTempering = load_algorithm("parallel_tempering")
+        tempering = ParallelTempering(initial_solution, self.fitness_fn, num_chains, min_temp, max_temp,
+                                      sweep_iterations, rounds, executor=get_executor("process", self.max_workers),
+                                      sa_kwargs=self._annealing_kwargs(moves))
+        result = tempering.run(stopping, self._progress("parallel_tempering"))
+        self.last_run_stats = tempering.last_run_stats
+        return result
+
+    def run_multistart_annealing(self, num_starts: int = 4, initial_temp: float = 1000, cooling_rate: float = 0.95,
+                                 min_temp: float = 1e-3, max_iter: int = 1000,
+                                 moves: Sequence[str] = MOVE_TYPES, time_limit: Optional[float] = None,
+                                 patience: Optional[int] = None) -> Tuple[List[int], float]:
+        """
+        Run independent SA chains from random starting solutions with different seeds in parallel.
+        
+        Args:
+            num_starts (int): Number of independent chains.
+            initial_temp (float): Starting temperature.
+            cooling_rate (float): Cooling rate.
+            min_temp (float): Minimum temperature threshold.
+            max_iter (int): Maximum iterations per temperature level.
+            moves (Sequence[str]): Move types used when a distance matrix is available.
+            time_limit (float, optional): Wall-clock budget in seconds, shared by all chains.
+            patience (int, optional): Stop each chain after this many temperature levels without improvement.
+        
+        Returns:
+            Tuple[List[int], float]: Best solution and its fitness.
+        """
+        stopping = self._stopping(time_limit, patience)
+        starts = [random.sample(self.gene_pool, self.chromosome_length) for _ in range(num_starts)]
+        sa_kwargs = dict(self._annealing_kwargs(moves), initial_temp=initial_temp, cooling_rate=cooling_rate,
+                         min_temp=min_temp, max_iter=max_iter)
+        MultiStartAnnealing = load_algorithm("multistart_annealing")
+        multi = MultiStartAnnealing(starts, self.fitness_fn, executor=get_executor("process", self.max_workers),
+                                    sa_kwargs=sa_kwargs)
+        result = multi.run(stopping, self._progress("multistart_annealing"))
+        self.last_run_stats = multi.last_run_stats
+        return result
+
+    def run_cvrp(self, demands: Sequence[float], capacities: Sequence[float], depot: int = 0,
+                 algorithm: str = "genetic", **algorithm_kwargs: Any) -> Tuple[List[List[int]], float]:
+        """
+        Solve a capacitated multi-vehicle routing problem over this optimizer's distance matrix.
+        
+        The chosen algorithm optimizes a giant tour through all stops; each candidate is scored by
+        its optimal capacity-feasible split into per-vehicle depot-to-depot routes.
+        
+        Args:
+            demands (Sequence[float]): Demand per node of the distance matrix (the depot's is ignored).
+            capacities (Sequence[float]): Capacity per vehicle; a heterogeneous fleet is allowed.
+            depot (int): Depot node index in the distance matrix.
+            algorithm (str): "genetic", "island_genetic", "simulated_annealing", "parallel_tempering",
+                or "multistart_annealing".
+            **algorithm_kwargs: Arguments of the matching `run_*` method (e.g. generations, time_limit).
+        
+        Returns:
+            Tuple[List[List[int]], float]: Route per vehicle (in the order of `capacities`, empty for unused
+            vehicles; no routes if no capacity-feasible split was found) and the fitness (negative total distance).
+        """
+        if self.distance_matrix is None:
+            raise ValueError("run_cvrp requires a distance matrix; build the optimizer with from_coordinates.")
+        fitness = GiantTourSplitFitness(self.distance_matrix, demands, capacities, depot)
+        stops = fitness.stops
+        solver = Optimizer(fitness, stops, len(stops), executor=self.executor, max_workers=self.max_workers,
+                           progress_callback=self.progress_callback, progress_every=self.progress_every,
+                           progress_min_interval=self.progress_min_interval, neighbor_lists=self.neighbor_lists)
+        runs = {
+            "genetic": solver.run_genetic,
+            "island_genetic": solver.run_island_genetic,
+            "simulated_annealing": solver.run_simulated_annealing,
+            "parallel_tempering": solver.run_parallel_tempering,
+            "multistart_annealing": solver.run_multistart_annealing,
+        }
+        if algorithm not in runs:
+            raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {sorted(runs)}.")
+        giant_tour, best_fitness = runs[algorithm](**algorithm_kwargs)
+        self.last_run_stats = solver.last_run_stats
+        _, routes = fitness.split(giant_tour)
+        return routes, best_fitness
+
     def run_reinforcement_learning(self, state: np.ndarray, state_size: int, action_size: int,
-                                   training_steps: int = 100) -> int:
+                                   training_steps: int = 100, time_limit: Optional[float] = None,
+                                   patience: Optional[int] = None) -> int:
         """
         Run a simplified RL model to decide on a route adjustment action.
         
@@ -82,24 +456,135 @@ class Optimizer:
             state (np.ndarray): Current state.
             state_size (int): Dimensionality of the state.
             action_size (int): Number of possible actions.
-            training_steps (int): Number of training iterations (for demo purposes).
+            training_steps (int): Maximum number of training iterations (for demo purposes).
+            time_limit (float, optional): Wall-clock budget in seconds for training.
+            patience (int, optional): Stop training after this many steps without a better reward.
         
         Returns:
             int: Selected action based on the RL model.
         """
+        stopping = self._stopping(time_limit, patience)
+        stop_reason = COMPLETED
+        steps = 0
+        best_reward = float("-inf")
+        progress = self._progress("reinforcement_learning")
+        RLAgent = load_algorithm("reinforcement_learning")
         agent = RLAgent(state_size, action_size)
         # Dummy training loop for demonstration purposes.
         for _ in range(training_steps):
+            if stopping.out_of_time():
+                stop_reason = TIME_LIMIT
+                break
             action = agent.act(state)
             # In a real system, environment feedback would be incorporated.
             reward = self.fitness_fn(list(state[:self.chromosome_length]))  # Dummy reward based on partial state.
             next_state = state  # No change in state for demo.
             done = False
             agent.train(state, action, reward, next_state, done)
+            steps += 1
+            best_reward = max(best_reward, float(reward))
+            if progress is not None:
+                progress.report(steps, best_reward, steps, stopping.elapsed())
+            reason = stopping.update(best_reward)
+            if reason is not None and steps < training_steps:
+                stop_reason = reason
+                break
+        self.last_run_stats = RunStats("reinforcement_learning", steps, steps, stopping.elapsed(), best_reward,
+                                       stop_reason)
+        if progress is not None:
+            progress.report(steps, best_reward, steps, self.last_run_stats.elapsed, final=True)
         return agent.act(state)
 
+    def train_route_policy(self, num_envs: int = 64, stops: Optional[int] = None, window: int = 5,
+                           training_steps: int = 500, epsilon: float = 0.1, updates_per_step: int = 1,
+                           time_limit: Optional[float] = None, patience: Optional[int] = None,
+                           seed: Optional[int] = None, **agent_kwargs: Any) -> Any:
+        """
+        Train a DQN route-adjustment policy on batched rollouts over this optimizer's distance matrix.
+
+        Each step chooses epsilon-greedy actions for all `num_envs` parallel episodes in one forward
+        pass, steps every episode at once, stores the whole batch of transitions in the replay buffer,
+        and runs `updates_per_step` minibatch updates.
+
+        Args:
+            num_envs (int): Parallel episodes of the RouteAdjustmentEnv.
+            stops (int, optional): Stops per episode tour; defaults to all nodes.
+            window (int): Tour positions the agent sees and rearranges per step.
+            training_steps (int): Maximum number of batched environment steps.
+            epsilon (float): Exploration rate of the rollouts.
+            updates_per_step (int): Replayed minibatch updates per environment step.
+            time_limit (float, optional): Wall-clock budget in seconds for training.
+            patience (int, optional): Stop after this many steps without a better average reward.
+            seed (int, optional): Seed of the environment, exploration, and replay sampling.
+            **agent_kwargs: Extra RLAgent arguments (e.g. learning_rate, batch_size).
+
+        Returns:
+            RLAgent: The trained agent (see `RLAgent.export_policy` for TensorFlow-free serving).
+        """
+        if self.distance_matrix is None:
+            raise ValueError("train_route_policy requires a distance matrix; build the optimizer with "
+                             "from_coordinates.")
+        stopping = self._stopping(time_limit, patience)
+        progress = self._progress("route_policy")
+        env = RouteAdjustmentEnv(self.distance_matrix, num_envs, stops, window, seed=seed)
+        RLAgent = load_algorithm("reinforcement_learning")
+        agent = RLAgent(env.state_size, env.action_size, seed=seed, **agent_kwargs)
+        rng = np.random.default_rng(seed)
+        states = env.states()
+        stop_reason = COMPLETED
+        steps = 0
+        average_reward = best_reward = None
+        while steps < training_steps:
+            if stopping.out_of_time():
+                stop_reason = TIME_LIMIT
+                break
+            actions = agent.act_batch(states, epsilon, rng)
+            next_states, rewards, dones = env.step(actions)
+            agent.buffer.add_batch(states, actions, rewards, next_states, dones)
+            for _ in range(updates_per_step):
+                agent.replay()
+            states = next_states
+            steps += 1
+            # Smoothed mean reward per episode step, so that one lucky batch does not count as progress.
+            batch_reward = float(rewards.mean())
+            average_reward = batch_reward if average_reward is None else 0.9 * average_reward + 0.1 * batch_reward
+            best_reward = average_reward if best_reward is None else max(best_reward, average_reward)
+            if progress is not None:
+                progress.report(steps, best_reward, steps * num_envs, stopping.elapsed())
+            reason = stopping.update(best_reward)
+            if reason is not None and steps < training_steps:
+                stop_reason = reason
+                break
+        best_reward = float("-inf") if best_reward is None else best_reward
+        self.last_run_stats = RunStats("route_policy", steps, steps * num_envs, stopping.elapsed(), best_reward,
+                                       stop_reason)
+        if progress is not None:
+            progress.report(steps, best_reward, steps * num_envs, self.last_run_stats.elapsed, final=True)
+        return agent
+
+    @staticmethod
+    def select_actions(states: np.ndarray, policy: Union[NumpyPolicy, str]) -> np.ndarray:
+        """
+        Choose route adjustments for many vehicles with a trained policy, in one NumPy forward pass.
+
+        Args:
+            states (np.ndarray): One state per vehicle, shape (B, state_size).
+            policy (Union[NumpyPolicy, str]): Exported policy (`RLAgent.export_policy`), or the path of
+                one saved with `RLAgent.save_policy`.
+
+        Returns:
+            np.ndarray: Action index per vehicle, shape (B,).
+        """
+        if not isinstance(policy, NumpyPolicy):
+            policy = NumpyPolicy.load(policy)
+        return policy.act_batch(states)
+
 # Example usage:
 if __name__ == "__main__":
+    import logging
+    from src.core.logger import setup_logger
+    from src.services.optimization.progress import logging_callback
+
     # Dummy fitness function: Lower sum indicates better solution.
     def fitness(chromosome: List[int]) -> float:
         return -sum(chromosome)
@@ -107,13 +592,20 @@ if __name__ == "__main__":
     gene_pool = list(range(1, 21))
     chromosome_length = 10
 
-    optimizer = Optimizer(fitness, gene_pool, chromosome_length)
+    # Log convergence every 10th generation / temperature level.
+    optimizer = Optimizer(fitness, gene_pool, chromosome_length,
+                          progress_callback=logging_callback(setup_logger("optimizer"), logging.INFO),
+                          progress_every=10)
     
     best_genetic, fitness_genetic = optimizer.run_genetic(generations=50)
     print("Genetic Algorithm Best Solution:", best_genetic, "Fitness:", fitness_genetic)
     
     best_sa, fitness_sa = optimizer.run_simulated_annealing()
     print("Simulated Annealing Best Solution:", best_sa, "Fitness:", fitness_sa)
+
+    # Size the work to a latency budget instead of an iteration count.
+    best_budget, fitness_budget = optimizer.run_genetic(generations=10_000, time_limit=2.0, patience=50)
+    print("Budgeted Genetic Algorithm Fitness:", fitness_budget, optimizer.last_run_stats)
     
     # Create a dummy state for RL demonstration (using first chromosome_length elements as state).
     state = np.array(gene_pool[:chromosome_length], dtype=float)
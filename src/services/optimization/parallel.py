@@ -0,0 +1,125 @@
+"""
+Shared executors for parallel fitness evaluation.
+
+This module lets the optimization algorithms spread fitness evaluation over multiple cores:
+- Process pools for pure-Python fitness functions (the function must be picklable, e.g. a
+  module-level function or a `RouteDistanceFitness` instance).
+- Thread pools for fitness functions that release the GIL (e.g. NumPy batch fitness).
+
+Pools are created once per (kind, max_workers) and reused across optimization runs, so pool
+startup is not paid per request. They are shut down automatically at interpreter exit.
+
+Assumptions:
+- Fitness functions are pure: evaluating them in another process or thread has no side effects
+  the caller relies on.
+"""
+
+import os
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+_EXECUTORS: Dict[Tuple[str, int], Executor] = {}
+_LOCK = threading.Lock()
+
+def get_executor(kind: str = "process", max_workers: Optional[int] = None,
+                 mp_context: Optional[str] = None) -> Executor:
+    """
+    Return a shared executor, creating it on first use.
+
+    Args:
+        kind (str): "process" for a process pool or "thread" for a thread pool.
+        max_workers (int, optional): Number of workers; defaults to the number of CPUs.
+        mp_context (str, optional): Multiprocessing start method for process pools (e.g. "spawn").
+
+    Returns:
+        Executor: A pool that is reused by later calls with the same arguments.
+    """
+    if kind not in ("process", "thread"):
+        raise ValueError(f"Unknown executor kind '{kind}'; expected 'process' or 'thread'.")
+    workers = max_workers or os.cpu_count() or 1
+    key = (f"{kind}:{mp_context or ''}", workers)
+    with _LOCK:
+        executor = _EXECUTORS.get(key)
+        if executor is None:
+            if kind == "process":
+                context = multiprocessing.get_context(mp_context) if mp_context else None
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fitness")
+            _EXECUTORS[key] = executor
+        return executor
+
+@atexit.register
+def shutdown_executors():
+    """
+    Shut down every shared executor. Safe to call more than once.
+    """
+    with _LOCK:
+        executors = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
+
+def _apply_chunk(fn: Callable[[Any], Any], chunk: Sequence[Any]) -> List[Any]:
+    # Module-level so that it can be pickled for process pools.
+    return [fn(item) for item in chunk]
+
+def _worker_count(executor: Executor) -> int:
+    return getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+
+def parallel_map(executor: Optional[Executor], fn: Callable[[Any], Any], items: Sequence[Any],
+                 chunks_per_worker: int = 4) -> List[Any]:
+    """
+    Apply `fn` to every item, in order, using the executor when one is given.
+
+    Items are grouped into a few chunks per worker so that per-task overhead (pickling the
+    function and results) is amortized over many evaluations.
+
+    Args:
+        executor (Executor, optional): Pool to use; if None, items are evaluated serially.
+        fn (Callable[[Any], Any]): Function to apply.
+        items (Sequence[Any]): Inputs.
+        chunks_per_worker (int): Number of chunks submitted per worker.
+
+    Returns:
+        List[Any]: Results aligned with `items`.
+    """
+    if executor is None or len(items) <= 1:
+        return [fn(item) for item in items]
+    num_chunks = min(len(items), _worker_count(executor) * chunks_per_worker)
+    size = -(-len(items) // num_chunks)
+    futures = [executor.submit(_apply_chunk, fn, items[i:i + size]) for i in range(0, len(items), size)]
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+def parallel_map_batches(executor: Optional[Executor], fn: Callable[[Any], Any], batch: Any) -> List[Any]:
+    """
+    Split an array-like batch (e.g. a population array) into one slice per worker and apply `fn` to each.
+
+    Args:
+        executor (Executor, optional): Pool to use; if None, `fn` is applied to the whole batch.
+        fn (Callable[[Any], Any]): Function taking a slice of the batch.
+        batch (Any): Sliceable batch such as a 2-D NumPy array.
+
+    Returns:
+        List[Any]: Per-slice results in order.
+    """
+    if executor is None or len(batch) <= 1:
+        return [fn(batch)]
+    num_slices = min(len(batch), _worker_count(executor))
+    size = -(-len(batch) // num_slices)
+    futures = [executor.submit(fn, batch[i:i + size]) for i in range(0, len(batch), size)]
+    return [future.result() for future in futures]
+
+# Example usage:
+if __name__ == "__main__":
+    import math
+
+    executor = get_executor("process", max_workers=2)
+    print("Square roots:", parallel_map(executor, math.sqrt, list(range(10))))
+    print("Same pool reused:", get_executor("process", max_workers=2) is executor)
@@ -0,0 +1,126 @@
+"""
+Structured progress reporting for optimization runs.
+
+This module replaces per-iteration printing in the algorithm loops with an optional callback:
+- ProgressEvent: one convergence sample (iteration, best fitness, evaluations, elapsed time).
+- ProgressReporter: samples events (every N iterations and/or at most once per M seconds) and
+  forwards them to a callback; the final event of a run is always delivered.
+- logging_callback: adapter that writes events to a logger, for container logs.
+
+Algorithms take an optional reporter and skip reporting entirely when it is None, so a run with
+no listener attached pays nothing in its hot loop.
+
+Assumptions:
+- Callbacks are cheap and do not raise; they run inline in the optimization loop.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+class ProgressEvent:
+    def __init__(self, algorithm: str, iteration: int, best_fitness: float, evaluations: int, elapsed: float,
+                 final: bool = False):
+        """
+        A convergence sample.
+
+        Args:
+            algorithm (str): Algorithm name (e.g. "genetic").
+            iteration (int): Generations, temperature levels, rounds, or steps completed.
+            best_fitness (float): Best fitness found so far.
+            evaluations (int): Fitness evaluations or evaluated moves so far.
+            elapsed (float): Wall-clock seconds since the run started.
+            final (bool): Whether this is the last event of the run.
+        """
+        self.algorithm = algorithm
+        self.iteration = iteration
+        self.best_fitness = best_fitness
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+        self.final = final
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.__dict__.items())
+        return f"ProgressEvent({fields})"
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+class ProgressReporter:
+    def __init__(self, algorithm: str, callback: ProgressCallback, every: int = 1, min_interval: float = 0.0):
+        """
+        Initialize the reporter.
+
+        Args:
+            algorithm (str): Algorithm name stamped on every event.
+            callback (ProgressCallback): Receives sampled events.
+            every (int): Deliver every N-th iteration.
+            min_interval (float): Minimum seconds between delivered events (0 disables time sampling).
+        """
+        self.algorithm = algorithm
+        self.callback = callback
+        self.every = max(1, every)
+        self.min_interval = min_interval
+        self._last_sent = float("-inf")
+        self.events_sent = 0
+
+    def report(self, iteration: int, best_fitness: float, evaluations: int, elapsed: float, final: bool = False):
+        """
+        Offer an iteration's progress; it is delivered if it passes sampling or is final.
+
+        Args:
+            iteration (int): Iterations completed.
+            best_fitness (float): Best fitness found so far.
+            evaluations (int): Fitness evaluations or evaluated moves so far.
+            elapsed (float): Wall-clock seconds since the run started.
+            final (bool): Whether the run has finished; final events bypass sampling.
+        """
+        if not final:
+            if iteration % self.every:
+                return
+            if self.min_interval > 0.0:
+                now = time.monotonic()
+                if now - self._last_sent < self.min_interval:
+                    return
+                self._last_sent = now
+        self.events_sent += 1
+        self.callback(ProgressEvent(self.algorithm, iteration, float(best_fitness), evaluations, elapsed, final))
+
+def make_reporter(algorithm: str, callback: Optional[ProgressCallback], every: int = 1,
+                  min_interval: float = 0.0) -> Optional[ProgressReporter]:
+    """
+    Build a reporter, or None when there is no callback so that algorithms skip reporting.
+    """
+    if callback is None:
+        return None
+    return ProgressReporter(algorithm, callback, every, min_interval)
+
+def logging_callback(logger: logging.Logger, level: int = logging.DEBUG) -> ProgressCallback:
+    """
+    Create a callback that logs each event as one structured line.
+
+    Args:
+        logger (logging.Logger): Destination logger (e.g. from `src.core.logger.setup_logger`).
+        level (int): Log level for progress lines.
+
+    Returns:
+        ProgressCallback: The logging callback.
+    """
+    def callback(event: ProgressEvent):
+        if logger.isEnabledFor(level):
+            logger.log(level, "%s iteration=%d best_fitness=%.4f evaluations=%d elapsed=%.3fs%s",
+                       event.algorithm, event.iteration, event.best_fitness, event.evaluations, event.elapsed,
+                       " final" if event.final else "")
+    return callback
+
+# Example usage:
+if __name__ == "__main__":
+    events = []
+    reporter = ProgressReporter("demo", events.append, every=10)
+    for iteration in range(1, 36):
+        reporter.report(iteration, -100.0 / iteration, iteration * 50, iteration * 0.01)
+    reporter.report(35, -100.0 / 35, 1750, 0.35, final=True)
+    for event in events:
+        print(event)
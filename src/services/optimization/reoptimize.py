@@ -0,0 +1,279 @@
+"""
+Incremental re-optimization of an existing route when stops change.
+
+When an order arrives or is cancelled, most of the current plan is still good, so re-running the
+optimizers from scratch wastes their whole budget. This module provides an IncrementalReoptimizer
+class that:
+- Keeps the stop coordinates and their distance matrix, growing the matrix in place (with spare
+  capacity) and recomputing only the rows of added or moved stops.
+- Applies a delta to the previous route: removed stops are cut out, and added or moved stops are
+  put back at their cheapest insertion position (vectorized over all edges).
+- Repairs the route with a short best-improvement local search (2-opt and Or-opt relocation of
+  segments up to three stops), where each pass scores every move at once in a vectorized delta
+  matrix, under a wall-clock budget.
+
+Stops keep their integer ids (indices into the coordinates) for the reoptimizer's lifetime; new
+stops get the next free ids, and removed ids are not reused.
+
+Assumptions:
+- Coordinates are (latitude, longitude) pairs; distances are haversine kilometres (symmetric).
+- The depot, if any, is a stop id that is never part of the route; routes leave from it.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from src.core.distance_matrix import haversine_matrix, Coordinates
+from src.services.optimization.stopping import StoppingCriteria, RunStats, COMPLETED, TIME_LIMIT
+
+def two_opt_deltas(ordered: np.ndarray) -> np.ndarray:
+    """
+    Length change of every 2-opt move on a closed tour whose position 0 is fixed.
+
+    Entry [i - 1, j - 1] is the change from reversing positions i..j (1 <= i < j < m); other entries
+    are inf. Only slices of `ordered` are read, so a full pass costs a few O(m^2) array operations.
+
+    Args:
+        ordered (np.ndarray): Distances between tour positions, i.e. sub[np.ix_(tour, tour)].
+
+    Returns:
+        np.ndarray: Deltas of shape (m - 1, m - 1).
+    """
+    m = len(ordered)
+    following = np.roll(ordered, -1, axis=1)  # following[a, b] = distance from position a to b + 1.
+    edges = np.diagonal(following)  # Edge leaving each position.
+    deltas = ordered[:-1, 1:] + following[1:, 1:] - edges[:-1, np.newaxis] - edges[np.newaxis, 1:]
+    deltas[np.tri(m - 1, dtype=bool)] = np.inf
+    return deltas
+
+def relocation_deltas(ordered: np.ndarray, length: int) -> np.ndarray:
+    """
+    Length change of moving every segment of `length` positions to every other edge of a closed tour.
+
+    Entry [i - 1, p] is the change from moving positions i..i + length - 1 (1 <= i, i + length <= m)
+    between positions p and p + 1; edges touching the segment are inf.
+
+    Args:
+        ordered (np.ndarray): Distances between tour positions, i.e. sub[np.ix_(tour, tour)].
+        length (int): Segment length.
+
+    Returns:
+        np.ndarray: Deltas of shape (m - length, m).
+    """
+    m = len(ordered)
+    following = np.roll(ordered, -1, axis=1)
+    edges = np.diagonal(following)
+    starts = np.arange(1, m - length + 1)
+    ends = starts + length - 1
+    gain = edges[starts - 1] + edges[ends] - following[starts - 1, ends]
+    cost = ordered[:, 1:m - length + 1].T + following[length:m, :] - edges[np.newaxis, :]
+    deltas = cost - gain[:, np.newaxis]
+    positions = np.arange(m)[np.newaxis, :]
+    deltas[(positions >= starts[:, np.newaxis] - 1) & (positions <= ends[:, np.newaxis])] = np.inf
+    return deltas
+
+class IncrementalReoptimizer:
+    def __init__(self, coordinates: Coordinates, route: Sequence[int], closed: bool = False,
+                 depot: Optional[int] = None, matrix: Optional[np.ndarray] = None):
+        """
+        Initialize from the current plan.
+
+        Args:
+            coordinates (Coordinates): Coordinates of every stop id (and the depot) as (lat, lon).
+            route (Sequence[int]): Current route (stop ids).
+            closed (bool): Whether the route returns to its start (or to the depot).
+            depot (int, optional): Stop id the route leaves from (not part of the route).
+            matrix (np.ndarray, optional): Precomputed distance matrix over `coordinates`.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        n = len(coordinates)
+        capacity = max(2 * n, 16)
+        self._coordinates = np.zeros((capacity, 2))
+        self._coordinates[:n] = coordinates
+        self._matrix = np.zeros((capacity, capacity))
+        self._matrix[:n, :n] = haversine_matrix(coordinates) if matrix is None else matrix
+        self.size = n
+        self.route = [int(stop) for stop in route]
+        self.closed = closed
+        self.depot = depot
+        self.removed = set()
+        self.last_run_stats = None
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        return self._coordinates[:self.size]
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        Distance matrix over all stop ids (a view of the growable buffer).
+        """
+        return self._matrix[:self.size, :self.size]
+
+    def _grow(self, count: int):
+        if self.size + count <= len(self._matrix):
+            return
+        capacity = max(2 * len(self._matrix), self.size + count)
+        coordinates = np.zeros((capacity, 2))
+        coordinates[:self.size] = self.coordinates
+        matrix = np.zeros((capacity, capacity))
+        matrix[:self.size, :self.size] = self.matrix
+        self._coordinates, self._matrix = coordinates, matrix
+
+    def _refresh_rows(self, stops: np.ndarray):
+        """
+        Recompute the distance rows (and columns) of the given stops.
+        """
+        rows = haversine_matrix(self._coordinates[stops], self.coordinates)
+        self._matrix[stops, :self.size] = rows
+        self._matrix[:self.size, stops] = rows.T
+        self._matrix[stops, stops] = 0.0
+
+    def _local(self, stops: List[int]) -> Tuple[np.ndarray, np.ndarray, bool]:
+        """
+        Local distance matrix over the given stops, with an anchor at local index 0 for open routes
+        or routes with a depot (returning to the anchor is free on open routes).
+        """
+        stops = np.asarray(stops, dtype=np.intp)
+        anchored = self.depot is not None or not self.closed
+        offset = 1 if anchored else 0
+        sub = np.zeros((len(stops) + offset, len(stops) + offset))
+        sub[offset:, offset:] = self._matrix[np.ix_(stops, stops)]
+        if self.depot is not None:
+            sub[0, 1:] = self._matrix[self.depot, stops]
+            if self.closed:
+                sub[1:, 0] = self._matrix[stops, self.depot]
+        return sub, stops, anchored
+
+    def length(self, route: Optional[Sequence[int]] = None) -> float:
+        """
+        Length of a route (the current one by default), including depot legs.
+        """
+        route = self.route if route is None else list(route)
+        if not route:
+            return 0.0
+        sub, _, _ = self._local(route)
+        tour = np.arange(len(sub))
+        return float(sub[tour, np.roll(tour, -1)].sum())
+
+    def update(self, added: Optional[Coordinates] = None, removed: Optional[Sequence[int]] = None,
+               moved: Optional[Dict[int, Tuple[float, float]]] = None, time_limit: Optional[float] = 0.05,
+               max_moves: int = 10000) -> Tuple[List[int], List[int]]:
+        """
+        Apply a change to the plan and repair the route.
+
+        Args:
+            added (Coordinates, optional): Coordinates of new stops, shape (K, 2).
+            removed (Sequence[int], optional): Stop ids to drop from the route.
+            moved (Dict[int, Tuple[float, float]], optional): New coordinates of existing stops.
+            time_limit (float, optional): Wall-clock budget for the local search, in seconds.
+            max_moves (int): Maximum improving moves applied by the local search.
+
+        Returns:
+            Tuple[List[int], List[int]]: The repaired route and the ids assigned to the added stops.
+        """
+        stopping = StoppingCriteria(time_limit=time_limit).start()
+        removed = {int(stop) for stop in removed or []}
+        moved = {int(stop): location for stop, location in (moved or {}).items()}
+        on_route = set(self.route)
+        unknown = (removed | set(moved)) - on_route
+        if unknown:
+            raise ValueError(f"Stops {sorted(unknown)} are not on the route.")
+
+        if moved:
+            stops = np.fromiter(moved, dtype=np.intp)
+            self._coordinates[stops] = np.asarray(list(moved.values()), dtype=np.float64)
+            self._refresh_rows(stops)
+        new_ids = []
+        if added is not None and len(added):
+            added = np.asarray(added, dtype=np.float64).reshape(-1, 2)
+            self._grow(len(added))
+            new_ids = list(range(self.size, self.size + len(added)))
+            self._coordinates[self.size:self.size + len(added)] = added
+            self.size += len(added)
+            self._refresh_rows(np.asarray(new_ids, dtype=np.intp))
+        self.removed |= removed
+
+        kept = [stop for stop in self.route if stop not in removed and stop not in moved]
+        pending = list(moved) + new_ids
+        sub, stops, anchored = self._local(kept + pending)
+        offset = 1 if anchored else 0
+        tour = np.arange(offset + len(kept))
+        for local in range(offset + len(kept), len(sub)):
+            tour = self._insert(sub, tour, local)
+
+        tour, moves, evaluated, reason = self._local_search(sub, tour, stopping, max_moves)
+        self.route = stops[tour[offset:] - offset].tolist() if anchored else stops[tour].tolist()
+        self.last_run_stats = RunStats("reoptimize", moves, evaluated, stopping.elapsed(), -self.length(), reason)
+        return self.route, new_ids
+
+    @staticmethod
+    def _insert(sub: np.ndarray, tour: np.ndarray, node: int) -> np.ndarray:
+        """
+        Insert a local node at its cheapest position of a closed tour.
+        """
+        if len(tour) == 0:
+            return np.array([node])
+        following = np.roll(tour, -1)
+        costs = sub[tour, node] + sub[node, following] - sub[tour, following]
+        return np.insert(tour, int(np.argmin(costs)) + 1, node)
+
+    def _local_search(self, sub: np.ndarray, tour: np.ndarray, stopping: StoppingCriteria,
+                      max_moves: int) -> Tuple[np.ndarray, int, int, str]:
+        """
+        Best-improvement 2-opt and Or-opt on a closed tour with position 0 fixed, until no move
+        improves the tour, `max_moves` moves were applied, or the time budget runs out.
+        """
+        moves = evaluated = 0
+        reason = COMPLETED
+        m = len(tour)
+        while moves < max_moves and m >= 4:
+            if stopping.out_of_time():
+                reason = TIME_LIMIT
+                break
+            best, apply = -1e-9, None
+            ordered = sub[np.ix_(tour, tour)]
+            deltas = two_opt_deltas(ordered)
+            evaluated += deltas.size
+            k = int(np.argmin(deltas))
+            if deltas.flat[k] < best:
+                i, j = divmod(k, m - 1)
+                best, apply = deltas.flat[k], ("two_opt", i + 1, j + 1)
+            for length in range(1, min(3, m - 3) + 1):
+                deltas = relocation_deltas(ordered, length)
+                evaluated += deltas.size
+                k = int(np.argmin(deltas))
+                if deltas.flat[k] < best:
+                    i, p = divmod(k, m)
+                    best, apply = deltas.flat[k], ("or_opt", i + 1, p, length)
+            if apply is None:
+                break
+            if apply[0] == "two_opt":
+                _, i, j = apply
+                tour[i:j + 1] = tour[i:j + 1][::-1].copy()
+            else:
+                _, i, p, length = apply
+                segment = tour[i:i + length].copy()
+                rest = np.delete(tour, np.arange(i, i + length))
+                tour = np.insert(rest, p + 1 if p < i else p + 1 - length, segment)
+            moves += 1
+        return tour, moves, evaluated, reason
+
+# Example usage:
+if __name__ == "__main__":
+    import time
+    from src.services.optimization.construction import cheapest_insertion
+
+    rng = np.random.default_rng(0)
+    stops = np.column_stack([rng.uniform(24.0, 25.0, 301), rng.uniform(54.0, 55.0, 301)])
+    route = cheapest_insertion(haversine_matrix(stops), range(1, 301), depot=0, closed=True)
+    reoptimizer = IncrementalReoptimizer(stops, route, closed=True, depot=0)
+    reoptimizer.update(time_limit=1.0)
+    print(f"Initial plan: {reoptimizer.length():.1f} km")
+
+    start = time.perf_counter()
+    _, (new_stop,) = reoptimizer.update(added=[[24.5, 54.5]])
+    print(f"Added stop {new_stop} in {(time.perf_counter() - start) * 1000:.1f} ms: {reoptimizer.length():.1f} km")
+    start = time.perf_counter()
+    reoptimizer.update(removed=[route[10]])
+    print(f"Removed stop {route[10]} in {(time.perf_counter() - start) * 1000:.1f} ms: {reoptimizer.length():.1f} km")
@@ -0,0 +1,162 @@
+"""
+Vectorized reinforcement-learning environment for route adjustment.
+
+The RL agent learns local route adjustments: a cursor walks along a tour, and at each position
+the agent may reorder the next few stops. This module provides RouteAdjustmentEnv, which runs
+many episodes in parallel with all state in NumPy arrays:
+- routes (E, m): one closed tour per episode through a random subset of the matrix's nodes.
+- A window of `window` consecutive tour positions starts at each episode's cursor; its first and
+  last stops stay fixed and the action is a permutation of the stops in between (action 0 keeps
+  the order), so every action keeps a valid tour.
+- State: the pairwise distances between the window's stops, scaled by the episode's mean edge
+  length, so that one policy applies to any region or distance unit.
+- Reward: the decrease of the tour length caused by the action, in the same scaled units.
+- `step` applies one action per episode with a handful of array operations (no Python loop over
+  episodes), advances every cursor by one position, and resets finished episodes in place.
+
+Assumptions:
+- Tours are closed (the cursor wraps around), and the distance matrix is symmetric or nearly so.
+- Every episode visits `stops` nodes, with `stops >= window`.
+"""
+
+import itertools
+from typing import Optional, Tuple
+import numpy as np
+
+class RouteAdjustmentEnv:
+    def __init__(self, distance_matrix: np.ndarray, num_envs: int = 64, stops: Optional[int] = None,
+                 window: int = 5, episode_steps: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Initialize the environment and reset every episode.
+
+        Args:
+            distance_matrix (np.ndarray): Distance matrix the episodes' tours are drawn from.
+            num_envs (int): Number of parallel episodes.
+            stops (int, optional): Stops per episode tour; defaults to all nodes of the matrix.
+            window (int): Tour positions seen and rearranged per step (its two end stops stay fixed).
+            episode_steps (int, optional): Steps per episode; defaults to two passes over the tour.
+            seed (int, optional): Seed of the episode generator.
+        """
+        self.matrix = np.asarray(distance_matrix, dtype=np.float64)
+        self.num_envs = num_envs
+        self.stops = stops or self.matrix.shape[0]
+        if not 3 <= window <= self.stops <= self.matrix.shape[0]:
+            raise ValueError("Expected 3 <= window <= stops <= number of nodes.")
+        self.window = window
+        self.episode_steps = episode_steps or 2 * self.stops
+        self.rng = np.random.default_rng(seed)
+
+        inner = list(itertools.permutations(range(1, window - 1)))
+        # After action a, window position j holds the stop that was at position permutations[a, j].
+        self.permutations = np.array([(0,) + order + (window - 1,) for order in inner], dtype=np.intp)
+        self.action_size = len(self.permutations)
+        self._upper = np.triu_indices(window, k=1)
+        self.state_size = len(self._upper[0])
+        self._offsets = np.arange(window)
+        self._rows = np.arange(num_envs)[:, np.newaxis]
+
+        self.routes = np.zeros((num_envs, self.stops), dtype=np.intp)
+        self.cursors = np.zeros(num_envs, dtype=np.intp)
+        self.steps = np.zeros(num_envs, dtype=np.intp)
+        self.scales = np.ones(num_envs)
+        self.initial_lengths = np.zeros(num_envs)
+        self.reset()
+
+    def _new_routes(self, count: int) -> np.ndarray:
+        # Random subsets in random order: argsort of random keys gives `count` independent permutations.
+        keys = self.rng.random((count, self.matrix.shape[0]))
+        return np.argsort(keys, axis=1)[:, :self.stops]
+
+    def tour_lengths(self, routes: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Closed-tour length of every episode's route (or of the given routes).
+        """
+        routes = self.routes if routes is None else routes
+        return self.matrix[routes, np.roll(routes, -1, axis=1)].sum(axis=1)
+
+    def reset(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Start new episodes (all of them, or those selected by `mask`).
+
+        Args:
+            mask (np.ndarray, optional): Boolean array of shape (num_envs,).
+
+        Returns:
+            np.ndarray: States of all episodes, shape (num_envs, state_size).
+        """
+        selected = np.arange(self.num_envs) if mask is None else np.flatnonzero(mask)
+        if len(selected):
+            self.routes[selected] = self._new_routes(len(selected))
+            lengths = self.tour_lengths(self.routes[selected])
+            self.initial_lengths[selected] = lengths
+            self.scales[selected] = np.maximum(lengths / self.stops, 1e-12)
+            self.cursors[selected] = self.rng.integers(0, self.stops, len(selected))
+            self.steps[selected] = 0
+        return self.states()
+
+    def _window(self) -> Tuple[np.ndarray, np.ndarray]:
+        positions = (self.cursors[:, np.newaxis] + self._offsets) % self.stops
+        return positions, self.routes[self._rows, positions]
+
+    def states(self) -> np.ndarray:
+        """
+        Scaled pairwise distances between the stops of every episode's window.
+
+        Returns:
+            np.ndarray: States of shape (num_envs, state_size), float32.
+        """
+        _, stops = self._window()
+        first, second = self._upper
+        distances = self.matrix[stops[:, first], stops[:, second]]
+        return (distances / self.scales[:, np.newaxis]).astype(np.float32)
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Apply one action per episode, advance the cursors, and reset finished episodes.
+
+        Args:
+            actions (np.ndarray): Action index per episode, shape (num_envs,).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Next states (of the new episode where one
+            finished), rewards, and done flags, each with a leading num_envs dimension.
+        """
+        positions, stops = self._window()
+        reordered = np.take_along_axis(stops, self.permutations[np.asarray(actions, dtype=np.intp)], axis=1)
+        before = self.matrix[stops[:, :-1], stops[:, 1:]].sum(axis=1)
+        after = self.matrix[reordered[:, :-1], reordered[:, 1:]].sum(axis=1)
+        self.routes[self._rows, positions] = reordered
+        rewards = ((before - after) / self.scales).astype(np.float32)
+
+        self.cursors = (self.cursors + 1) % self.stops
+        self.steps += 1
+        dones = self.steps >= self.episode_steps
+        if dones.any():
+            self.reset(dones)
+        return self.states(), rewards, dones
+
+    def best_actions(self) -> np.ndarray:
+        """
+        Greedy one-step actions (largest immediate reward) of every episode, for baselines and tests.
+        """
+        _, stops = self._window()
+        candidates = stops[:, self.permutations]  # (num_envs, actions, window)
+        lengths = self.matrix[candidates[..., :-1], candidates[..., 1:]].sum(axis=2)
+        return np.argmin(lengths, axis=1)
+
+# Example usage:
+if __name__ == "__main__":
+    import time
+    from src.core.distance_matrix import haversine_matrix
+
+    rng = np.random.default_rng(0)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 200), rng.uniform(54.0, 55.0, 200)])
+    env = RouteAdjustmentEnv(haversine_matrix(coordinates), num_envs=256, stops=50, seed=0)
+    print(f"{env.action_size} actions, state size {env.state_size}")
+    start_lengths = env.tour_lengths()
+    start = time.perf_counter()
+    for _ in range(99):
+        env.step(env.best_actions())
+    elapsed = time.perf_counter() - start
+    print(f"{99 * env.num_envs / elapsed:.0f} env steps/s; greedy adjustments shortened tours by "
+          f"{(1 - env.tour_lengths() / start_lengths).mean():.1%}")
@@ -0,0 +1,136 @@
+"""
+Stopping criteria and run statistics for anytime optimization.
+
+This module lets every optimization algorithm be sized to a latency budget (e.g. the FR-002
+"route within 2 seconds" contract) instead of a guessed iteration count:
+- StoppingCriteria: wall-clock deadline plus stagnation-based early stopping (no improvement
+  of the best fitness for N iterations, where an iteration is a generation, a temperature
+  level, or a tempering round depending on the algorithm).
+- RunStats: why and when a run stopped, returned alongside the best-so-far solution.
+
+Assumptions:
+- Higher fitness is better.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+COMPLETED = "completed"
+TIME_LIMIT = "time_limit"
+STAGNATION = "stagnation"
+
+class StoppingCriteria:
+    def __init__(self, time_limit: Optional[float] = None, patience: Optional[int] = None,
+                 min_improvement: float = 0.0):
+        """
+        Initialize the stopping criteria.
+
+        Args:
+            time_limit (float, optional): Wall-clock budget in seconds, measured from `start()`.
+            patience (int, optional): Stop after this many consecutive iterations without improvement.
+            min_improvement (float): Smallest fitness gain that counts as an improvement.
+        """
+        self.time_limit = time_limit
+        self.patience = patience
+        self.min_improvement = min_improvement
+        self.started_at = None
+        self.deadline = None
+        self.best_fitness = float("-inf")
+        self.stagnant_iterations = 0
+
+    def start(self, deadline: Optional[float] = None) -> "StoppingCriteria":
+        """
+        Start the clock.
+
+        Args:
+            deadline (float, optional): Absolute `time.time()` deadline, e.g. shared by several
+                processes; overrides `time_limit` when earlier.
+
+        Returns:
+            StoppingCriteria: self, for chaining.
+        """
+        self.started_at = time.time()
+        self.deadline = None if self.time_limit is None else self.started_at + self.time_limit
+        if deadline is not None:
+            self.deadline = deadline if self.deadline is None else min(self.deadline, deadline)
+        self.best_fitness = float("-inf")
+        self.stagnant_iterations = 0
+        return self
+
+    def out_of_time(self) -> bool:
+        """
+        Whether the wall-clock deadline has passed.
+        """
+        return self.deadline is not None and time.time() >= self.deadline
+
+    def remaining(self) -> Optional[float]:
+        """
+        Seconds left before the deadline, or None when there is no deadline.
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
+    def update(self, best_fitness: float) -> Optional[str]:
+        """
+        Record the best fitness after an iteration and decide whether to stop.
+
+        Args:
+            best_fitness (float): Best fitness found so far.
+
+        Returns:
+            Optional[str]: TIME_LIMIT or STAGNATION if the run should stop, otherwise None.
+        """
+        if best_fitness > self.best_fitness + self.min_improvement:
+            self.best_fitness = best_fitness
+            self.stagnant_iterations = 0
+        else:
+            self.stagnant_iterations += 1
+        if self.out_of_time():
+            return TIME_LIMIT
+        if self.patience is not None and self.stagnant_iterations >= self.patience:
+            return STAGNATION
+        return None
+
+    def elapsed(self) -> float:
+        """
+        Seconds since `start()`.
+        """
+        return 0.0 if self.started_at is None else time.time() - self.started_at
+
+class RunStats:
+    def __init__(self, algorithm: str, iterations: int = 0, evaluations: int = 0, elapsed: float = 0.0,
+                 best_fitness: float = float("-inf"), stop_reason: str = COMPLETED):
+        """
+        Summary of a finished optimization run.
+
+        Args:
+            algorithm (str): Algorithm name (e.g. "genetic").
+            iterations (int): Generations, temperature levels, or rounds completed.
+            evaluations (int): Fitness evaluations or evaluated moves.
+            elapsed (float): Wall-clock seconds.
+            best_fitness (float): Fitness of the returned solution.
+            stop_reason (str): COMPLETED, TIME_LIMIT, or STAGNATION.
+        """
+        self.algorithm = algorithm
+        self.iterations = iterations
+        self.evaluations = evaluations
+        self.elapsed = elapsed
+        self.best_fitness = best_fitness
+        self.stop_reason = stop_reason
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.__dict__.items())
+        return f"RunStats({fields})"
+
+# Example usage:
+if __name__ == "__main__":
+    criteria = StoppingCriteria(time_limit=0.05, patience=3).start()
+    for iteration, fitness in enumerate([-10.0, -8.0, -8.0, -8.0, -8.0]):
+        reason = criteria.update(fitness)
+        if reason:
+            print(f"Stopped after iteration {iteration + 1}: {reason}")
+            break
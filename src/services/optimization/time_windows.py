@@ -0,0 +1,220 @@
+"""
+Time-window feasibility for route optimization with precomputed slack.
+
+This module makes the optimizers respect the `delivery_windows` accepted by `validate_route_data`:
+- parse_delivery_windows: converts ISO 8601 windows to numeric offsets (seconds).
+- TimeWindows: problem data (travel times, per-node windows and service times, depot shift).
+- RouteSchedule: for one route, the forward earliest service start times and the backward latest
+  feasible service start times (the slack). With these arrays, inserting a stop or relocating one
+  within the route is checked in O(1) per candidate, and whole batches of candidates are checked
+  in one vectorized step, instead of re-simulating the route.
+- TimeWindowFitness: route-length fitness with a penalty per unit of lateness, for the GA and
+  the general SA mode.
+
+A route starts at the depot at `start_time`, visits its stops in order (waiting is allowed when
+arriving before a window opens), and optionally returns to the depot before its window closes.
+
+Assumptions:
+- Travel times satisfy the triangle inequality and service times are non-negative (true for
+  distance-derived travel times); relocation checks rely on this and are conservative.
+- Route nodes are integer indices into the travel-time matrix; the depot is not part of a route.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+from src.core.distance_matrix import route_length
+
+def _parse_timestamp(value: str) -> datetime:
+    # datetime.fromisoformat only accepts a trailing "Z" from Python 3.11 on.
+    return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+def parse_delivery_windows(windows: Sequence[Dict[str, str]],
+                           reference: Optional[datetime] = None) -> Tuple[np.ndarray, np.ndarray, datetime]:
+    """
+    Convert delivery windows ({"start": ISO 8601, "end": ISO 8601}) to offsets in seconds.
+
+    Args:
+        windows (Sequence[Dict[str, str]]): Windows as accepted by `validate_route_data`.
+        reference (datetime, optional): Time zero; defaults to the earliest window start.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, datetime]: Earliest and latest service start per window, and
+        the reference time.
+    """
+    starts = [_parse_timestamp(window["start"]) for window in windows]
+    ends = [_parse_timestamp(window["end"]) for window in windows]
+    if reference is None:
+        reference = min(starts)
+    earliest = np.array([(start - reference).total_seconds() for start in starts])
+    latest = np.array([(end - reference).total_seconds() for end in ends])
+    return earliest, latest, reference
+
+def travel_time_matrix(distance_matrix: np.ndarray, speed_kmh: float = 40.0) -> np.ndarray:
+    """
+    Travel times in seconds from a distance matrix in kilometres at a constant speed.
+    """
+    return np.asarray(distance_matrix, dtype=np.float64) * (3600.0 / speed_kmh)
+
+class TimeWindows:
+    def __init__(self, travel_times: np.ndarray, earliest: Sequence[float], latest: Sequence[float],
+                 service_times: Optional[Sequence[float]] = None, depot: int = 0,
+                 start_time: Optional[float] = None, return_to_depot: bool = True):
+        """
+        Initialize the time-window data.
+
+        Args:
+            travel_times (np.ndarray): Travel time between nodes (e.g. seconds).
+            earliest (Sequence[float]): Earliest service start per node; the depot's is its opening time.
+            latest (Sequence[float]): Latest service start per node; the depot's is the latest return.
+            service_times (Sequence[float], optional): Time spent at each node; zero if None.
+            depot (int): Depot node index.
+            start_time (float, optional): Departure time from the depot; defaults to its opening time.
+            return_to_depot (bool): Whether routes must return to the depot before it closes.
+        """
+        self.travel_times = np.asarray(travel_times, dtype=np.float64)
+        self.earliest = np.asarray(earliest, dtype=np.float64)
+        self.latest = np.asarray(latest, dtype=np.float64)
+        n = self.travel_times.shape[0]
+        self.service_times = np.zeros(n) if service_times is None else np.asarray(service_times, dtype=np.float64)
+        if not (len(self.earliest) == len(self.latest) == len(self.service_times) == n):
+            raise ValueError("Windows and service times must have one entry per node of the travel-time matrix.")
+        self.depot = depot
+        self.start_time = float(self.earliest[depot] if start_time is None else start_time)
+        self.return_to_depot = return_to_depot
+
+    def schedule(self, route: Sequence[int]) -> "RouteSchedule":
+        """
+        Build the schedule (and slack arrays) of a route.
+        """
+        return RouteSchedule(self, route)
+
+class RouteSchedule:
+    def __init__(self, time_windows: TimeWindows, route: Sequence[int]):
+        """
+        Compute the forward and backward time arrays of a route in O(n).
+
+        Positions index the visited nodes including the depot: position 0 is the depot departure,
+        positions 1..n are the route's stops, and position n + 1 is the return to the depot when
+        `return_to_depot` is set.
+
+        Both passes are vectorized: with C[k] the cumulative service and travel time from the depot
+        to position k, begin[k] = C[k] + max_{j <= k}(earliest[j] - C[j]) and
+        latest[k] = C[k] + min_{j >= k}(window_end[j] - C[j]).
+
+        Args:
+            time_windows (TimeWindows): Problem data.
+            route (Sequence[int]): Stop node indices in visiting order.
+        """
+        tw = time_windows
+        self.time_windows = tw
+        nodes = [tw.depot, *route] + ([tw.depot] if tw.return_to_depot else [])
+        self.nodes = np.asarray(nodes, dtype=np.intp)
+        legs = tw.service_times[self.nodes[:-1]] + tw.travel_times[self.nodes[:-1], self.nodes[1:]]
+        self.cumulative = np.concatenate([[0.0], np.cumsum(legs)])
+
+        opens = tw.earliest[self.nodes]
+        opens[0] = tw.start_time
+        closes = tw.latest[self.nodes].copy()
+        closes[0] = tw.start_time
+        # Earliest service start at each position (waiting allowed, lateness propagates).
+        self.begin = self.cumulative + np.maximum.accumulate(opens - self.cumulative)
+        # Latest service start at each position that keeps every later position on time.
+        self.latest = self.cumulative + np.minimum.accumulate((closes - self.cumulative)[::-1])[::-1]
+        self.lateness = float(np.maximum(self.begin - closes, 0.0).sum())
+        self.feasible = bool(np.all(self.begin <= self.latest + 1e-9))
+
+    def _departure(self, positions: np.ndarray) -> np.ndarray:
+        tw = self.time_windows
+        return self.begin[positions] + tw.service_times[self.nodes[positions]]
+
+    def insertion_feasible(self, stops: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """
+        Vectorized exact check of inserting stops[k] so that it becomes position positions[k].
+
+        The stop is visited after the node currently at positions[k] - 1 and before the node
+        currently at positions[k] (if any). Each check is O(1).
+
+        Args:
+            stops (np.ndarray): Node indices to insert.
+            positions (np.ndarray): Insertion positions in 1..n + 1.
+
+        Returns:
+            np.ndarray: Boolean feasibility per candidate (all False if the route itself is infeasible).
+        """
+        stops = np.asarray(stops, dtype=np.intp)
+        positions = np.asarray(positions, dtype=np.intp)
+        if not self.feasible:
+            return np.zeros(stops.shape, dtype=bool)
+        tw = self.time_windows
+        before = positions - 1
+        begin = np.maximum(self._departure(before) + tw.travel_times[self.nodes[before], stops], tw.earliest[stops])
+        ok = begin <= tw.latest[stops] + 1e-9
+        has_next = positions < len(self.nodes)
+        after = np.where(has_next, positions, 0)
+        arrival_next = begin + tw.service_times[stops] + tw.travel_times[stops, self.nodes[after]]
+        return ok & (~has_next | (arrival_next <= self.latest[after] + 1e-9))
+
+    def can_insert(self, stop: int, position: int) -> bool:
+        """
+        Exact O(1) check of inserting `stop` so that it becomes position `position` (1..n + 1).
+        """
+        return bool(self.insertion_feasible(np.array([stop]), np.array([position]))[0])
+
+    def relocation_feasible(self, from_positions: np.ndarray, to_positions: np.ndarray) -> np.ndarray:
+        """
+        Vectorized O(1) check of moving the stop at from_positions[k] to just before the node
+        currently at to_positions[k].
+
+        The check reuses the current slack, ignoring the time saved by removing the stop from its
+        old position; with the triangle inequality this never accepts an infeasible move, but may
+        reject a few feasible ones.
+
+        Args:
+            from_positions (np.ndarray): Positions (1..n) of the stops to move.
+            to_positions (np.ndarray): Insertion positions (1..n + 1), not equal to from_positions[k]
+                or from_positions[k] + 1.
+
+        Returns:
+            np.ndarray: Boolean feasibility per candidate.
+        """
+        from_positions = np.asarray(from_positions, dtype=np.intp)
+        return self.insertion_feasible(self.nodes[from_positions], to_positions)
+
+class TimeWindowFitness:
+    def __init__(self, distance_matrix: np.ndarray, time_windows: TimeWindows, lateness_penalty: float = 1.0,
+                 closed: bool = False):
+        """
+        Fitness of a route: negative length plus a penalty for lateness against the time windows.
+
+        Args:
+            distance_matrix (np.ndarray): Distance matrix over the same nodes as the time windows.
+            time_windows (TimeWindows): Problem data.
+            lateness_penalty (float): Penalty (in distance units) per unit of lateness.
+            closed (bool): Whether the route length includes the leg back to the first stop.
+        """
+        self.distance_matrix = distance_matrix
+        self.time_windows = time_windows
+        self.lateness_penalty = lateness_penalty
+        self.closed = closed
+
+    def __call__(self, route: List[int]) -> float:
+        lateness = RouteSchedule(self.time_windows, route).lateness
+        return -(route_length(self.distance_matrix, route, self.closed) + self.lateness_penalty * lateness)
+
+# Example usage:
+if __name__ == "__main__":
+    travel = np.array([[0, 600, 900], [600, 0, 400], [900, 400, 0]], dtype=float)
+    windows = [
+        {"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T18:00:00Z"},  # Depot shift.
+        {"start": "2025-01-01T08:30:00Z", "end": "2025-01-01T09:00:00Z"},
+        {"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T08:20:00Z"},
+    ]
+    earliest, latest, reference = parse_delivery_windows(windows)
+    time_windows = TimeWindows(travel, earliest, latest, service_times=[0, 300, 300])
+    for route in ([1, 2], [2, 1]):
+        schedule = time_windows.schedule(route)
+        print(f"Route {route}: feasible={schedule.feasible} lateness={schedule.lateness:.0f}s")
+    schedule = time_windows.schedule([2])
+    print("Insert stop 1 after stop 2:", schedule.can_insert(1, 2))
@@ -4,52 +4,145 @@ Provides input validation and schema enforcement for route optimization data.
 This module uses jsonschema to validate that incoming data adheres to the expected schema.
 The schema can be extended to include additional fields as required.
 
+The schema is checked and compiled into a validator once at import, instead of on every call:
+- validate_route_data: a hand-written fast path accepts well-formed payloads (the common case)
+  without going through jsonschema; anything it does not accept is re-checked by the compiled
+  validator, which raises the same ValidationError that `jsonschema.validate` would.
+- route_data_errors: every schema violation of one payload, not just the first.
+- validate_route_data_bulk: validates a list of payloads and reports all errors of each item.
+
 Assumptions:
 - Data is provided as a dictionary with required fields such as 'route' and 'vehicle_capacity'.
+- The optional 'coordinates' list holds a (lat, lon) pair per stop id used in 'route'.
 - Additional properties are not allowed.
+- The fast path only ever accepts payloads that the schema accepts; when ROUTE_SCHEMA changes,
+  `_fast_path_accepts` must be updated with it (the unit tests compare the two).
 """
 
 import jsonschema
-from jsonschema import validate, ValidationError
-from typing import Dict, Any
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from typing import Dict, Any, List, Sequence
+
+ROUTE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "route": {
+            "type": "array",
+            "items": {"type": "number"},
+            "minItems": 2
+        },
+        "vehicle_capacity": {"type": "number"},
+        "coordinates": {
+            "type": "array",
+            "items": {
+                "type": "array",
+                "items": {"type": "number"},
+                "minItems": 2,
+                "maxItems": 2
+            }
+        },
+        "delivery_windows": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "start": {"type": "string", "format": "date-time"},
+                    "end": {"type": "string", "format": "date-time"}
+                },
+                "required": ["start", "end"]
+            }
+        }
+    },
+    "required": ["route", "vehicle_capacity"],
+    "additionalProperties": False
+}
+
+# Checked and compiled once; `jsonschema.validate` would redo both on every call.
+_validator_class = jsonschema.validators.validator_for(ROUTE_SCHEMA)
+_validator_class.check_schema(ROUTE_SCHEMA)
+ROUTE_VALIDATOR = _validator_class(ROUTE_SCHEMA)
+
+_PROPERTIES = frozenset(ROUTE_SCHEMA["properties"])
+
+def _is_number(value: Any) -> bool:
+    return type(value) is int or type(value) is float
+
+def _fast_path_accepts(route_data: Any) -> bool:
+    """
+    Cheap structural check of the schema for plain JSON-decoded payloads.
+
+    Returns False for anything unusual (including valid payloads with non-builtin number types),
+    which then goes through the full validator.
+    """
+    if type(route_data) is not dict or not _PROPERTIES.issuperset(route_data):
+        return False
+    route = route_data.get("route")
+    if type(route) is not list or len(route) < 2 or not all(map(_is_number, route)):
+        return False
+    if not _is_number(route_data.get("vehicle_capacity")):
+        return False
+    if "coordinates" in route_data:
+        coordinates = route_data["coordinates"]
+        if type(coordinates) is not list:
+            return False
+        for pair in coordinates:
+            if type(pair) is not list or len(pair) != 2 or not (_is_number(pair[0]) and _is_number(pair[1])):
+                return False
+    if "delivery_windows" in route_data:
+        windows = route_data["delivery_windows"]
+        if type(windows) is not list:
+            return False
+        for window in windows:
+            if type(window) is not dict or type(window.get("start")) is not str or type(window.get("end")) is not str:
+                return False
+    return True
 
 def validate_route_data(route_data: Dict[str, Any]) -> bool:
     """
     Validate the input route data against the predefined schema.
-    
+
     Args:
         route_data (Dict[str, Any]): Input data containing route and related parameters.
-    
+
     Returns:
         bool: True if validation passes; raises ValidationError if not.
     """
-    schema = {
-        "type": "object",
-        "properties": {
-            "route": {
-                "type": "array",
-                "items": {"type": "number"},
-                "minItems": 2
-            },
-            "vehicle_capacity": {"type": "number"},
-            "delivery_windows": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "start": {"type": "string", "format": "date-time"},
-                        "end": {"type": "string", "format": "date-time"}
-                    },
-                    "required": ["start", "end"]
-                }
-            }
-        },
-        "required": ["route", "vehicle_capacity"],
-        "additionalProperties": False
-    }
-    validate(instance=route_data, schema=schema)
+    if _fast_path_accepts(route_data):
+        return True
+    error = best_match(ROUTE_VALIDATOR.iter_errors(route_data))
+    if error is not None:
+        raise error
     return True
 
+def route_data_errors(route_data: Any) -> List[ValidationError]:
+    """
+    All schema violations of one payload, ordered by their location in it.
+
+    Args:
+        route_data (Any): Input data to check.
+
+    Returns:
+        List[ValidationError]: The errors; empty when the payload is valid.
+    """
+    if _fast_path_accepts(route_data):
+        return []
+    return sorted(ROUTE_VALIDATOR.iter_errors(route_data), key=lambda error: [str(part) for part in error.path])
+
+def validate_route_data_bulk(payloads: Sequence[Any]) -> List[List[Dict[str, str]]]:
+    """
+    Validate many payloads, reporting every error of every item.
+
+    Args:
+        payloads (Sequence[Any]): Input data items.
+
+    Returns:
+        List[List[Dict[str, str]]]: Per item, its errors as {"path": JSON pointer to the offending value
+        (e.g. "/route/1"), "message": description}; an empty list means the item is valid.
+    """
+    return [[{"path": "".join(f"/{part}" for part in error.path), "message": error.message}
+             for error in route_data_errors(payload)] for payload in payloads]
+
 # Example usage:
 if __name__ == "__main__":
     sample_data = {
@@ -65,3 +158,4 @@ if __name__ == "__main__":
             print("Route data is valid.")
     except ValidationError as ve:
         print("Validation Error:", ve)
+    print("Bulk errors:", validate_route_data_bulk([sample_data, {"route": [1, "a"], "fleet": 3}]))
@@ -3,8 +3,14 @@ End-to-end tests simulating real-world scenarios.
 Tests include:
 - Health endpoint check.
 - Data retrieval endpoint test.
+- Route optimization endpoint served from the result cache on repeated requests.
+- Delivery windows mixing timestamps with and without a timezone.
+- Optimization jobs submitted, polled, and streamed as server-sent events.
+- Batch optimization streamed as NDJSON, with invalid problems reported per item.
 """
 
+import time
+import json
 from fastapi.testclient import TestClient
 from src.services.api.routes import app
 
@@ -22,6 +28,87 @@ def test_sample_data_endpoint():
     json_data = response.json()
     assert "fleet_id" in json_data, "Response should contain fleet_id."
 
+def test_optimize_endpoint_caches_results():
+    payload = {
+        "route": [0, 1, 2, 3, 4],
+        "vehicle_capacity": 50,
+        "coordinates": [[24.0, 54.0], [24.1, 54.2], [24.3, 54.1], [24.2, 54.4], [24.05, 54.3]],
+    }
+    first = client.post("/api/optimize", json=payload)
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert sorted(first.json()["route"]) == [0, 1, 2, 3, 4]
+    # Same problem with reordered keys and float-typed numbers.
+    second = client.post("/api/optimize", json=dict(reversed(list(payload.items())), vehicle_capacity=50.0))
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+    metrics = client.get("/api/optimize/cache").json()
+    assert metrics["hits"] >= 1 and metrics["misses"] >= 1
+
+def test_optimize_endpoint_accepts_mixed_timezone_windows():
+    payload = {
+        "route": [0, 1, 2, 3],
+        "vehicle_capacity": 50,
+        "coordinates": [[24.0, 54.0], [24.1, 54.2], [24.3, 54.1], [24.2, 54.4]],
+        "delivery_windows": [
+            {"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T18:00:00Z"},
+            {"start": "2025-01-01T08:00:00", "end": "2025-01-01T18:00:00"},
+            {"start": "2025-01-01T12:00:00+04:00", "end": "2025-01-01T18:00:00"},
+            {"start": "2025-01-01T09:00:00", "end": "2025-01-01T22:00:00+04:00"},
+        ],
+    }
+    response = client.post("/api/optimize", json=payload)
+    assert response.status_code == 200
+    assert sorted(response.json()["route"]) == [0, 1, 2, 3]
+
+def test_optimize_endpoint_rejects_invalid_payload():
+    response = client.post("/api/optimize", json={"route": [0], "vehicle_capacity": 50})
+    assert response.status_code == 422
+
+def test_job_submit_poll_and_stream():
+    payload = {
+        "route": [0, 1, 2, 3],
+        "vehicle_capacity": 50,
+        "coordinates": [[24.0, 54.0], [24.1, 54.2], [24.3, 54.1], [24.2, 54.4]],
+    }
+    response = client.post("/api/jobs", json=payload)
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        job = client.get(f"/api/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed"):
+            break
+        time.sleep(0.05)
+    assert job["status"] == "succeeded"
+    assert sorted(job["result"]["route"]) == [0, 1, 2, 3]
+
+    stream = client.get(f"/api/jobs/{job_id}/events")
+    assert stream.headers["content-type"].startswith("text/event-stream")
+    assert stream.text.startswith("event: done")
+    data = json.loads(stream.text.split("data: ", 1)[1])
+    assert data["result"] == job["result"]
+    assert client.get("/api/jobs/unknown").status_code == 404
+
+def test_batch_endpoint_streams_ndjson():
+    coordinates = [[24.0, 54.0], [24.1, 54.2], [24.3, 54.1], [24.2, 54.4]]
+    problems = [
+        {"route": [0, 1, 2, 3], "vehicle_capacity": 50, "coordinates": coordinates},
+        {"route": [0], "vehicle_capacity": 50, "coordinates": coordinates},
+        {"route": [3, 2, 1], "vehicle_capacity": 20, "coordinates": coordinates},
+    ]
+    response = client.post("/api/batch", json={"problems": problems})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    by_index = {line["index"]: line for line in lines}
+    assert by_index[1]["status"] == "invalid"
+    assert sorted(by_index[0]["result"]["route"]) == [0, 1, 2, 3]
+    assert sorted(by_index[2]["result"]["route"]) == [1, 2, 3]
+    assert client.post("/api/batch", json={"problems": []}).status_code == 422
+
 if __name__ == "__main__":
     import pytest
     pytest.main()
@@ -0,0 +1,59 @@
+"""
+Benchmark for the batch optimization endpoint.
+Solves the same set of independent depot problems once as one POST /api/optimize call per
+problem (in sequence, as the nightly planner does today) and once as a single POST /api/batch
+request, and reports the wall time and the per-problem overhead on top of the optimizer budget.
+
+Run with:
+    python -m tests.performance.benchmark_batch --problems 200 --stops 30 --budget 0.05
+"""
+
+import time
+import json
+import argparse
+import numpy as np
+from fastapi.testclient import TestClient
+from src.services.api import routes
+
+def make_problems(count, stops, seed):
+    rng = np.random.default_rng(seed)
+    problems = []
+    for _ in range(count):
+        coordinates = np.column_stack([rng.uniform(24.0, 25.0, stops), rng.uniform(54.0, 55.0, stops)])
+        problems.append({"route": list(range(stops)), "vehicle_capacity": 50, "coordinates": coordinates.tolist()})
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--problems", type=int, default=200)
+    parser.add_argument("--stops", type=int, default=30)
+    parser.add_argument("--budget", type=float, default=0.05, help="Optimizer seconds per problem.")
+    args = parser.parse_args()
+
+    routes.job_manager.time_limit = args.budget
+    workers = routes.job_manager.max_workers
+    with TestClient(routes.app) as client:
+        # Warm up the process pool.
+        client.post("/api/optimize", json=make_problems(1, args.stops, seed=2)[0])
+
+        # Different seeds, so that neither run is served from the result cache.
+        start = time.perf_counter()
+        for problem in make_problems(args.problems, args.stops, seed=0):
+            assert client.post("/api/optimize", json=problem).status_code == 200
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        response = client.post("/api/batch", json={"problems": make_problems(args.problems, args.stops, seed=1)})
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        batch = time.perf_counter() - start
+        assert all(line["status"] == "succeeded" for line in lines) and len(lines) == args.problems
+
+    floor = args.problems * args.budget / workers
+    print(f"{args.problems} problems x {args.stops} stops, {args.budget:.3f}s budget, {workers} workers "
+          f"(optimizer floor {floor:.2f}s)")
+    print(f"{'mode':>10} {'total s':>9} {'ms/problem':>11}")
+    for mode, elapsed in (("single", single), ("batch", batch)):
+        print(f"{mode:>10} {elapsed:9.2f} {elapsed / args.problems * 1000:11.1f}")
+
+if __name__ == "__main__":
+    main()
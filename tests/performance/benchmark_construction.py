@@ -0,0 +1,48 @@
+"""
+Benchmark for the construction heuristics and warm-started optimization.
+Reports the time and route length of each heuristic, then the best route length a GA and SA
+reach within the same time budget when started from random routes versus constructed ones.
+
+Run with:
+    python -m tests.performance.benchmark_construction --stops 300 --budget 2
+"""
+
+import time
+import random
+import argparse
+import numpy as np
+from src.core.distance_matrix import route_length
+from src.services.optimization.construction import CONSTRUCTION_METHODS, construct
+from src.services.optimization.optimizer import Optimizer
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stops", type=int, default=300)
+    parser.add_argument("--budget", type=float, default=2.0, help="Seconds per optimization run.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, args.stops), rng.uniform(54.0, 55.0, args.stops)])
+    optimizer = Optimizer.from_coordinates(coordinates)
+    matrix = optimizer.distance_matrix
+
+    print(f"{'heuristic':>18} {'ms':>8} {'km':>10}")
+    for method in CONSTRUCTION_METHODS:
+        start = time.perf_counter()
+        route = construct(method, matrix, optimizer.gene_pool)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{method:>18} {elapsed:8.1f} {route_length(matrix, route):10.1f}")
+
+    print(f"\n{'run':>18} {'random km':>10} {'seeded km':>10}  ({args.budget:.1f}s each)")
+    random.seed(0)
+    _, cold = optimizer.run_genetic(generations=10**6, population_size=100, time_limit=args.budget)
+    _, warm = optimizer.run_genetic(generations=10**6, population_size=100, time_limit=args.budget,
+                                    seed_fraction=0.1)
+    print(f"{'genetic':>18} {-cold:10.1f} {-warm:10.1f}")
+    annealing = dict(max_iter=5000, initial_temp=1.0, min_temp=1e-4, time_limit=args.budget)
+    _, cold = optimizer.run_simulated_annealing(**annealing)
+    _, warm = optimizer.run_simulated_annealing(construction="best", **annealing)
+    print(f"{'simulated_annealing':>18} {-cold:10.1f} {-warm:10.1f}")
+
+if __name__ == "__main__":
+    main()
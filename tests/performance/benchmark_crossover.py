@@ -0,0 +1,76 @@
+"""
+Microbenchmark for the Genetic Algorithm crossover operators.
+Compares the previous list-membership ordered crossover (O(n^2) per child) with the linear-time
+OX, PMX, and ERX operators and the vectorized batch OX / PMX, at 50, 200, and 1000 genes.
+Reports microseconds per child.
+
+Run with:
+    python -m tests.performance.benchmark_crossover --pairs 200
+"""
+
+import time
+import random
+import argparse
+from typing import Callable, List
+import numpy as np
+from src.services.optimization.algorithms.crossover import (
+    ordered_crossover, pmx_crossover, edge_recombination, batch_ordered_crossover, batch_pmx_crossover,
+)
+
+def legacy_ordered_crossover(parent1: List[int], parent2: List[int], point1: int, point2: int) -> List[int]:
+    """
+    The ordered crossover GeneticAlgorithm used before, kept here as the baseline.
+    """
+    child = [None] * len(parent1)
+    child[point1:point2] = parent1[point1:point2]
+    current_index = point2
+    for gene in parent2:
+        if gene not in child:
+            if current_index >= len(parent1):
+                current_index = 0
+            child[current_index] = gene
+            current_index += 1
+    return child
+
+def time_scalar(operator: Callable, pairs: list, points: list) -> float:
+    start = time.perf_counter()
+    for (parent1, parent2), (point1, point2) in zip(pairs, points):
+        operator(parent1, parent2, point1, point2)
+    return (time.perf_counter() - start) / len(pairs) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--genes", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--pairs", type=int, default=200)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"{'genes':>6} {'legacy OX':>10} {'OX':>8} {'PMX':>8} {'ERX':>8} {'batch OX':>9} {'batch PMX':>10}  (us/child)")
+    for genes in args.genes:
+        pairs = [(random.sample(range(genes), genes), random.sample(range(genes), genes)) for _ in range(args.pairs)]
+        points = []
+        for _ in range(args.pairs):
+            point1 = random.randint(0, genes - 2)
+            points.append((point1, random.randint(point1 + 1, genes - 1)))
+        for (parent1, parent2), (point1, point2) in zip(pairs[:20], points[:20]):
+            assert ordered_crossover(parent1, parent2, point1, point2) == \
+                legacy_ordered_crossover(parent1, parent2, point1, point2), "OX must match the previous operator."
+
+        legacy = time_scalar(legacy_ordered_crossover, pairs, points)
+        ox = time_scalar(ordered_crossover, pairs, points)
+        pmx = time_scalar(pmx_crossover, pairs, points)
+        erx = time_scalar(lambda p1, p2, a, b: edge_recombination(p1, p2), pairs, points)
+
+        parents1 = np.array([pair[0] for pair in pairs])
+        parents2 = np.array([pair[1] for pair in pairs])
+        points1 = np.array([point[0] for point in points])
+        points2 = np.array([point[1] for point in points])
+        batch = {}
+        for name, operator in (("ox", batch_ordered_crossover), ("pmx", batch_pmx_crossover)):
+            start = time.perf_counter()
+            operator(parents1, parents2, points1, points2)
+            batch[name] = (time.perf_counter() - start) / args.pairs * 1e6
+        print(f"{genes:>6} {legacy:10.1f} {ox:8.1f} {pmx:8.1f} {erx:8.1f} {batch['ox']:9.1f} {batch['pmx']:10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark for optimization package import time (cold start).
+Runs `python -X importtime` in fresh interpreters for the given modules and reports the
+cumulative import time of each, its heaviest dependencies, and whether TensorFlow was loaded.
+
+Run with:
+    python -m tests.performance.benchmark_import --repeat 3
+"""
+
+import re
+import sys
+import argparse
+import subprocess
+
+MODULES = [
+    "src.services.optimization.optimizer",
+    "src.services.api.routes",
+    "src.services.optimization.algorithms.reinforcement_learning",
+]
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+def import_profile(module):
+    """
+    Import a module in a fresh interpreter; return {module: cumulative seconds} and whether TF loaded.
+    """
+    code = f"import sys, {module}; print('tensorflow' in sys.modules)"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                            check=True)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            cumulative[match.group(4)] = int(match.group(2)) / 1e6
+    return cumulative, result.stdout.strip() == "True"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per module (best is kept).")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest dependencies listed per module.")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        runs = [import_profile(module) for _ in range(args.repeat)]
+        cumulative, tensorflow = min(runs, key=lambda run: run[0].get(module, float("inf")))
+        print(f"{module}: {cumulative[module]:.3f}s (best of {args.repeat}), tensorflow loaded: {tensorflow}")
+        dependencies = sorted(((seconds, name) for name, seconds in cumulative.items()
+                               if name != module and "." not in name), reverse=True)
+        for seconds, name in dependencies[:args.top]:
+            print(f"    {name:<40} {seconds:.3f}s")
+
+if __name__ == "__main__":
+    main()
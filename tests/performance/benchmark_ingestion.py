@@ -0,0 +1,69 @@
+"""
+Benchmark for batched Kafka ingestion against an in-memory stand-in for the broker.
+Preloads GPS-style JSON messages into an InMemoryConsumer and measures records per second (and
+per minute, against the NFR-003 target of 1M+) for per-message processing (decode, clean, and
+handle one message at a time, with one handler call per message) versus the IngestionService
+(batched polls, batch decode and clean, a bounded worker pool, and manual offset commits).
+`--write-ms` simulates the latency of each durable handler call, such as a database write.
+
+Run with:
+    python -m tests.performance.benchmark_ingestion --messages 200000 --partitions 4 --write-ms 2
+"""
+
+import json
+import time
+import argparse
+import numpy as np
+from src.services.data_ingestion.data_cleaner import clean_data
+from src.services.data_ingestion.kafka_consumer import IngestionService
+from src.services.data_ingestion.memory_broker import InMemoryConsumer
+
+TARGET_PER_MINUTE = 1_000_000
+
+def _messages(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    lats, lons, speeds = rng.uniform(24.0, 25.0, count), rng.uniform(54.0, 55.0, count), rng.uniform(0, 90, count)
+    return [json.dumps({"vehicle_id": f"V{i % 500}", "timestamp": 1735718400 + i, "lat": round(lat, 6),
+                        "lon": round(lon, 6), "speed_kmh": round(speed, 1), "status": "En Route"}).encode()
+            for i, (lat, lon, speed) in enumerate(zip(lats, lons, speeds))]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200000)
+    parser.add_argument("--partitions", type=int, default=4)
+    parser.add_argument("--max-records", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--write-ms", type=float, default=2.0, help="Simulated latency of each handler call.")
+    parser.add_argument("--sample", type=int, default=2000, help="Messages timed with per-message processing.")
+    args = parser.parse_args()
+
+    messages = _messages(args.messages)
+    write = lambda records: time.sleep(args.write_ms / 1000.0)
+
+    consumer = InMemoryConsumer(partitions=args.partitions)
+    consumer.send_batch(messages[:args.sample])
+    start = time.perf_counter()
+    while True:
+        batches = consumer.poll(timeout_ms=0, max_records=1)
+        if not batches:
+            break
+        for records in batches.values():
+            for record in records:
+                write(clean_data([json.loads(record.value)]))
+    per_message = args.sample / (time.perf_counter() - start)
+    print(f"Per-message processing: {per_message:,.0f} records/s ({per_message * 60:,.0f}/min)")
+
+    consumer = InMemoryConsumer(partitions=args.partitions)
+    consumer.send_batch(messages)
+    service = IngestionService(consumer, write, max_records=args.max_records, max_workers=args.workers,
+                               poll_timeout_ms=10)
+    service.run(idle_timeout=0.05)
+    stats = service.stats()
+    assert all(consumer.committed(tp) == len(consumer._logs[tp]) for tp in consumer.partitions)
+    rate = stats["polled"] / stats["elapsed"]
+    print(f"IngestionService: {rate:,.0f} records/s ({rate * 60:,.0f}/min, {rate / per_message:.0f}x) in "
+          f"{stats['batches']} batches, {stats['commits']} commits; "
+          f"{'meets' if rate * 60 >= TARGET_PER_MINUTE else 'misses'} the {TARGET_PER_MINUTE:,}/min target")
+
+if __name__ == "__main__":
+    main()
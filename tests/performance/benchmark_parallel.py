@@ -0,0 +1,72 @@
+"""
+Scaling benchmark for parallel fitness evaluation.
+Runs the Genetic Algorithm with a pure-Python route-cost function on a process pool with
+1, 2, 4, 8, and 16 workers and reports wall-clock time and speedup over serial evaluation.
+
+Run with:
+    python -m tests.performance.benchmark_parallel --stops 150 --population 200 --generations 10
+"""
+
+import os
+import time
+import random
+import argparse
+from typing import List
+import numpy as np
+from src.core.utils import calculate_distance
+from src.services.optimization.algorithms.genetic import GeneticAlgorithm
+from src.services.optimization.parallel import get_executor, shutdown_executors
+
+class HaversineRouteCost:
+    """
+    Deliberately scalar route cost (one `calculate_distance` call per leg), standing in for
+    expensive real-world route-cost functions. Picklable so that it can run in a process pool.
+    """
+
+    def __init__(self, coordinates: List[List[float]], repeats: int):
+        self.coordinates = coordinates
+        self.repeats = repeats
+
+    def __call__(self, chromosome: List[int]) -> float:
+        total = 0.0
+        for _ in range(self.repeats):
+            total = 0.0
+            for a, b in zip(chromosome, chromosome[1:]):
+                lat1, lon1 = self.coordinates[a]
+                lat2, lon2 = self.coordinates[b]
+                total += calculate_distance(lat1, lon1, lat2, lon2)
+        return -total
+
+def time_run(fitness: HaversineRouteCost, stops: int, population: int, generations: int, executor) -> float:
+    random.seed(0)
+    ga = GeneticAlgorithm(population, 0.02, 0.8, fitness, executor=executor)
+    start = time.perf_counter()
+    ga.run(list(range(stops)), stops, generations)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stops", type=int, default=150)
+    parser.add_argument("--population", type=int, default=200)
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=5, help="Cost multiplier for the fitness function.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    coordinates = np.column_stack([rng.uniform(24.0, 26.0, args.stops), rng.uniform(54.0, 56.0, args.stops)]).tolist()
+    fitness = HaversineRouteCost(coordinates, args.repeats)
+
+    serial = time_run(fitness, args.stops, args.population, args.generations, None)
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    print(f"{'serial':>8} {serial:9.3f} {1.0:8.2f}")
+    for workers in args.workers:
+        executor = get_executor("process", workers)
+        time_run(fitness, args.stops, args.population, 1, executor)  # Warm up the pool.
+        elapsed = time_run(fitness, args.stops, args.population, args.generations, executor)
+        print(f"{workers:>8} {elapsed:9.3f} {serial / elapsed:8.2f}")
+    shutdown_executors()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark for incremental re-optimization of a plan after single-stop changes.
+Builds and locally optimizes a route, then applies random single-stop additions, removals, and
+moves, and reports the update latency (p50 / p95 / max) and the route length after each kind.
+
+Run with:
+    python -m tests.performance.benchmark_reoptimize --stops 300 --updates 100
+"""
+
+import time
+import argparse
+import numpy as np
+from src.core.distance_matrix import haversine_matrix
+from src.services.optimization.construction import cheapest_insertion
+from src.services.optimization.reoptimize import IncrementalReoptimizer
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stops", type=int, default=300)
+    parser.add_argument("--updates", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, args.stops + 1), rng.uniform(54.0, 55.0, args.stops + 1)])
+    route = cheapest_insertion(haversine_matrix(coordinates), range(1, args.stops + 1), depot=0, closed=True)
+    reoptimizer = IncrementalReoptimizer(coordinates, route, closed=True, depot=0)
+    reoptimizer.update(time_limit=None)
+    print(f"Initial plan: {len(reoptimizer.route)} stops, {reoptimizer.length():.1f} km")
+
+    latencies = {"add": [], "remove": [], "move": []}
+    for update in range(args.updates):
+        kind = ("add", "remove", "move")[update % 3]
+        location = [rng.uniform(24.0, 25.0), rng.uniform(54.0, 55.0)]
+        stop = reoptimizer.route[int(rng.integers(len(reoptimizer.route)))]
+        start = time.perf_counter()
+        if kind == "add":
+            reoptimizer.update(added=[location], time_limit=0.1)
+        elif kind == "remove":
+            reoptimizer.update(removed=[stop], time_limit=0.1)
+        else:
+            reoptimizer.update(moved={stop: location}, time_limit=0.1)
+        latencies[kind].append((time.perf_counter() - start) * 1000)
+
+    print(f"{'update':>8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for kind, values in latencies.items():
+        print(f"{kind:>8} {np.percentile(values, 50):8.1f} {np.percentile(values, 95):8.1f} {max(values):8.1f}")
+    print(f"Final plan: {len(reoptimizer.route)} stops, {reoptimizer.length():.1f} km")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark for DQN agent inference and training.
+Times choosing actions for a whole fleet with one `model.predict` call per vehicle (measured on
+a sample of vehicles and extrapolated, since it is slow) versus one batched `act_batch` forward
+pass (compiled TensorFlow, and the exported NumPy-only policy), and training steps per second on
+replayed minibatches.
+
+Run with:
+    python -m tests.performance.benchmark_rl --vehicles 500 --state-size 20
+"""
+
+import time
+import argparse
+import numpy as np
+from src.services.optimization.algorithms.reinforcement_learning import RLAgent
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vehicles", type=int, default=500)
+    parser.add_argument("--state-size", type=int, default=20)
+    parser.add_argument("--actions", type=int, default=8)
+    parser.add_argument("--train-steps", type=int, default=200)
+    parser.add_argument("--sample", type=int, default=20, help="Vehicles timed with per-vehicle predict.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    agent = RLAgent(args.state_size, args.actions, seed=0)
+    states = rng.random((args.vehicles, args.state_size)).astype(np.float32)
+    agent.act_batch(states)  # Trace the compiled graph once.
+
+    sample = states[:args.sample]
+    start = time.perf_counter()
+    per_vehicle = [int(np.argmax(agent.model.predict(state[np.newaxis], verbose=0)[0])) for state in sample]
+    looped = (time.perf_counter() - start) * len(states) / len(sample)
+    start = time.perf_counter()
+    batched = agent.act_batch(states)
+    single_call = time.perf_counter() - start
+    assert per_vehicle == batched[:args.sample].tolist()
+    policy = agent.export_policy()
+    start = time.perf_counter()
+    exported = policy.act_batch(states)
+    numpy_call = time.perf_counter() - start
+    assert (exported == batched).all()
+    print(f"Actions for {args.vehicles} vehicles: predict per vehicle {looped * 1000:.1f} ms, "
+          f"act_batch {single_call * 1000:.2f} ms ({looped / single_call:.0f}x), "
+          f"NumpyPolicy {numpy_call * 1000:.2f} ms")
+
+    actions = rng.integers(0, args.actions, args.vehicles)
+    agent.buffer.add_batch(states, actions, rng.random(args.vehicles), states, np.zeros(args.vehicles))
+    agent.replay()
+    start = time.perf_counter()
+    for _ in range(args.train_steps):
+        agent.replay()
+    elapsed = time.perf_counter() - start
+    print(f"Replay training: {args.train_steps / elapsed:.0f} minibatch steps/s "
+          f"({args.train_steps * agent.batch_size / elapsed:.0f} transitions/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark for rollout collection in the vectorized route-adjustment environment.
+Times environment steps per second for random actions, for greedy one-step actions, and for full
+rollouts with epsilon-greedy actions from the DQN agent (one batched forward pass per step) and
+batched insertion into its replay buffer.
+
+Run with:
+    python -m tests.performance.benchmark_rl_environment --envs 256 --stops 50 --steps 200
+"""
+
+import time
+import argparse
+import numpy as np
+from src.core.distance_matrix import haversine_matrix
+from src.services.optimization.route_environment import RouteAdjustmentEnv
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=200)
+    parser.add_argument("--envs", type=int, default=256)
+    parser.add_argument("--stops", type=int, default=50)
+    parser.add_argument("--window", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, args.nodes), rng.uniform(54.0, 55.0, args.nodes)])
+    env = RouteAdjustmentEnv(haversine_matrix(coordinates), args.envs, args.stops, args.window, seed=0)
+    print(f"{args.envs} parallel episodes, {args.stops} stops, {env.action_size} actions, "
+          f"state size {env.state_size}")
+
+    def rate(choose):
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            env.step(choose())
+        return args.steps * args.envs / (time.perf_counter() - start)
+
+    print(f"Random actions: {rate(lambda: rng.integers(0, env.action_size, args.envs)):,.0f} env steps/s")
+    print(f"Greedy actions: {rate(env.best_actions):,.0f} env steps/s")
+
+    from src.services.optimization.algorithms.reinforcement_learning import RLAgent
+    agent = RLAgent(env.state_size, env.action_size, buffer_size=args.steps * args.envs, seed=0)
+    states = env.reset()
+    agent.act_batch(states)  # Trace the compiled graph once.
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        actions = agent.act_batch(states, 0.1, rng)
+        next_states, rewards, dones = env.step(actions)
+        agent.buffer.add_batch(states, actions, rewards, next_states, dones)
+        states = next_states
+    elapsed = time.perf_counter() - start
+    print(f"Agent rollouts: {args.steps * args.envs / elapsed:,.0f} env steps/s "
+          f"({len(agent.buffer)} transitions collected)")
+
+if __name__ == "__main__":
+    main()
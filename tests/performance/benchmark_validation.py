@@ -0,0 +1,51 @@
+"""
+Benchmark for route payload validation.
+Times validating typical payloads with per-call jsonschema.validate (the previous behaviour),
+the compiled validator, and validate_route_data (fast path with compiled fallback), plus bulk
+validation of a list of payloads.
+
+Run with:
+    python -m tests.performance.benchmark_validation --payloads 2000 --stops 50
+"""
+
+import time
+import argparse
+import jsonschema
+import numpy as np
+from src.services.optimization.validators import ROUTE_SCHEMA, ROUTE_VALIDATOR, validate_route_data, \
+    validate_route_data_bulk
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--payloads", type=int, default=2000)
+    parser.add_argument("--stops", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    window = {"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T12:00:00Z"}
+    payloads = [{
+        "route": list(range(args.stops)),
+        "vehicle_capacity": 50,
+        "coordinates": np.column_stack([rng.uniform(24.0, 25.0, args.stops),
+                                        rng.uniform(54.0, 55.0, args.stops)]).tolist(),
+        "delivery_windows": [dict(window) for _ in range(args.stops)],
+    } for _ in range(args.payloads)]
+
+    modes = {
+        "jsonschema.validate": lambda payload: jsonschema.validate(instance=payload, schema=ROUTE_SCHEMA),
+        "compiled": ROUTE_VALIDATOR.validate,
+        "validate_route_data": validate_route_data,
+    }
+    print(f"{args.payloads} payloads x {args.stops} stops")
+    print(f"{'mode':>22} {'us/payload':>11}")
+    for name, validate in modes.items():
+        start = time.perf_counter()
+        for payload in payloads:
+            validate(payload)
+        print(f"{name:>22} {(time.perf_counter() - start) / args.payloads * 1e6:11.1f}")
+    start = time.perf_counter()
+    validate_route_data_bulk(payloads)
+    print(f"{'bulk':>22} {(time.perf_counter() - start) / args.payloads * 1e6:11.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Unit tests for construction heuristics.
+Tests include:
+- Every heuristic returns a permutation of the requested nodes, with and without a depot.
+- Constructed routes are much shorter than random ones.
+- Capacitated savings keeps route loads within the capacity.
+- Seeding the GA population and the SA start state through the Optimizer.
+"""
+
+import random
+import pytest
+import numpy as np
+from src.core.distance_matrix import route_length
+from src.services.optimization.construction import (
+    CONSTRUCTION_METHODS, construct, savings, cheapest_insertion, initial_solutions,
+)
+from src.services.optimization.cvrp import split_giant_tour
+from src.services.optimization.optimizer import Optimizer
+
+@pytest.fixture
+def points():
+    return np.random.default_rng(3).random((60, 2))
+
+@pytest.fixture
+def matrix(points):
+    return np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+
+@pytest.mark.parametrize("method", CONSTRUCTION_METHODS)
+@pytest.mark.parametrize("depot", [None, 0])
+@pytest.mark.parametrize("closed", [False, True])
+def test_construct_returns_permutation(matrix, method, depot, closed):
+    nodes = list(range(1, 60)) if depot == 0 else list(range(60))
+    route = construct(method, matrix, nodes, depot=depot, closed=closed)
+    assert sorted(route) == nodes
+
+@pytest.mark.parametrize("method", CONSTRUCTION_METHODS)
+def test_constructed_routes_beat_random(matrix, method):
+    nodes = list(range(60))
+    random_length = np.mean([route_length(matrix, np.random.default_rng(s).permutation(60).tolist())
+                             for s in range(10)])
+    assert route_length(matrix, construct(method, matrix, nodes)) < 0.5 * random_length
+
+def test_cheapest_insertion_small_closed_tour_is_optimal():
+    # Four corners of a unit square: the perimeter (length 4) is optimal.
+    points = np.array([[0, 0], [1, 1], [0, 1], [1, 0]], dtype=float)
+    matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+    route = cheapest_insertion(matrix, range(4), closed=True)
+    assert route_length(matrix, route, closed=True) == pytest.approx(4.0)
+
+def test_capacitated_savings_respects_capacity(matrix):
+    demands = np.concatenate([[0], np.random.default_rng(4).integers(1, 6, 59)])
+    tour = savings(matrix, range(1, 60), depot=0, demands=demands, capacity=20)
+    assert sorted(tour) == list(range(1, 60))
+    cost, routes = split_giant_tour(tour, matrix, demands, [20] * 59)
+    assert cost < float("inf")
+    assert all(demands[route].sum() <= 20 for route in routes)
+
+def test_initial_solutions_are_distinct(matrix):
+    random.seed(0)
+    solutions = initial_solutions(matrix, list(range(60)), 8)
+    assert len(solutions) == 8
+    assert len({tuple(solution) for solution in solutions}) > 1
+
+def test_seeded_genetic_and_annealing(points):
+    random.seed(0)
+    optimizer = Optimizer.from_coordinates(points)
+    constructed = optimizer.construct_solution("best")
+    best_constructed = optimizer.fitness_fn(constructed)
+    # Elitism keeps the best seed, so a seeded run can only improve on it.
+    _, fitness = optimizer.run_genetic(generations=3, population_size=20, seed_fraction=0.25)
+    assert fitness >= best_constructed
+    _, fitness = optimizer.run_simulated_annealing(max_iter=50, construction="best", initial_temp=1.0)
+    assert fitness >= best_constructed
+
+def test_construction_requires_distance_matrix():
+    optimizer = Optimizer(lambda route: -sum(route), list(range(10)), 5)
+    with pytest.raises(ValueError):
+        optimizer.run_genetic(generations=1, seed_fraction=0.5)
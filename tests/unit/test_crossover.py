@@ -0,0 +1,85 @@
+"""
+Unit tests for the permutation crossover operators.
+Tests include:
+- Ordered crossover (OX) on a worked example and on partial gene selections.
+- Partially mapped crossover (PMX), scalar and vectorized.
+- Edge recombination crossover (ERX).
+- Vectorized ordered crossover, matching the scalar operator.
+"""
+
+import random
+import pytest
+import numpy as np
+from src.services.optimization.algorithms.crossover import (
+    ordered_crossover, pmx_crossover, edge_recombination, batch_ordered_crossover, batch_pmx_crossover,
+)
+
+@pytest.fixture
+def pairs():
+    rng = np.random.default_rng(0)
+    parents1 = np.array([rng.permutation(12) for _ in range(50)])
+    parents2 = np.array([rng.permutation(12) for _ in range(50)])
+    points1 = rng.integers(0, 11, size=50)
+    points2 = rng.integers(points1 + 1, 12)
+    return parents1, parents2, points1, points2
+
+def test_ordered_crossover_example():
+    parent1 = [0, 1, 2, 3, 4, 5, 6, 7]
+    parent2 = [7, 6, 5, 4, 3, 2, 1, 0]
+    assert ordered_crossover(parent1, parent2, 2, 5) == [1, 0, 2, 3, 4, 7, 6, 5]
+
+def test_pmx_crossover_example():
+    parent1 = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    parent2 = [9, 3, 7, 8, 2, 6, 5, 1, 4]
+    assert pmx_crossover(parent1, parent2, 3, 7) == [9, 3, 2, 4, 5, 6, 7, 1, 8]
+
+@pytest.mark.parametrize("operator", [ordered_crossover, pmx_crossover])
+def test_segment_operators_on_partial_selections(operator):
+    # Parents are different 10-gene selections from a pool of 20, as in Optimizer.run_genetic.
+    random.seed(1)
+    for _ in range(200):
+        parent1, parent2 = random.sample(range(20), 10), random.sample(range(20), 10)
+        point1 = random.randint(0, 8)
+        point2 = random.randint(point1 + 1, 9)
+        child = operator(parent1, parent2, point1, point2)
+        assert len(child) == 10 and len(set(child)) == 10, "Child should not repeat genes."
+        assert set(child) <= set(parent1) | set(parent2)
+        assert child[point1:point2] == parent1[point1:point2], "Segment should be inherited from parent1."
+
+def test_edge_recombination_uses_parent_edges():
+    random.seed(2)
+    parent1 = random.sample(range(30), 30)
+    parent2 = random.sample(range(30), 30)
+    child = edge_recombination(parent1, parent2)
+    assert sorted(child) == list(range(30)), "Child should be a permutation."
+    assert child[0] == parent1[0]
+    edges = {frozenset(pair) for parent in (parent1, parent2) for pair in zip(parent, parent[1:])}
+    inherited = sum(frozenset(pair) in edges for pair in zip(child, child[1:]))
+    assert inherited >= 25, "Most child edges should come from the parents."
+
+def test_batch_ordered_crossover_produces_permutations(pairs):
+    parents1, parents2, points1, points2 = pairs
+    children = batch_ordered_crossover(parents1, parents2, points1, points2)
+    for child, parent, a, b in zip(children, parents1, points1, points2):
+        assert sorted(child) == list(range(12)), "Child should be a permutation."
+        assert list(child[a:b]) == list(parent[a:b]), "Segment should be inherited from parent1."
+
+def test_batch_ordered_crossover_matches_scalar(pairs):
+    parents1, parents2, points1, points2 = pairs
+    children = batch_ordered_crossover(parents1, parents2, points1, points2)
+    for child, p1, p2, a, b in zip(children, parents1, parents2, points1, points2):
+        assert child.tolist() == ordered_crossover(p1.tolist(), p2.tolist(), int(a), int(b))
+
+    # Parents holding different selections from a larger gene pool, as in Optimizer.run_genetic.
+    rng = np.random.default_rng(1)
+    parents1 = np.array([rng.choice(20, 10, replace=False) for _ in range(50)])
+    parents2 = np.array([rng.choice(20, 10, replace=False) for _ in range(50)])
+    children = batch_ordered_crossover(parents1, parents2, points1 % 9, points1 % 9 + 1)
+    for child, p1, p2, a in zip(children, parents1, parents2, points1 % 9):
+        assert child.tolist() == ordered_crossover(p1.tolist(), p2.tolist(), int(a), int(a) + 1)
+
+def test_batch_pmx_matches_scalar(pairs):
+    parents1, parents2, points1, points2 = pairs
+    children = batch_pmx_crossover(parents1, parents2, points1, points2)
+    for child, p1, p2, a, b in zip(children, parents1, parents2, points1, points2):
+        assert child.tolist() == pmx_crossover(p1.tolist(), p2.tolist(), int(a), int(b))
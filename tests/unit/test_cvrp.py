@@ -0,0 +1,68 @@
+"""
+Unit tests for capacitated multi-vehicle routing.
+Tests include:
+- Optimality of the giant-tour split against exhaustive enumeration.
+- Heterogeneous fleets and infeasible fleets.
+- End-to-end multi-vehicle optimization through the Optimizer.
+"""
+
+import itertools
+import pytest
+import numpy as np
+from src.services.optimization.cvrp import split_giant_tour, GiantTourSplitFitness
+from src.services.optimization.optimizer import Optimizer
+
+def brute_force_split(tour, matrix, demands, capacities):
+    order = sorted(range(len(capacities)), key=lambda v: -capacities[v])
+    best = float("inf")
+    for k in range(1, min(len(tour), len(capacities)) + 1):
+        for cuts in itertools.combinations(range(1, len(tour)), k - 1):
+            bounds = [0, *cuts, len(tour)]
+            routes = [tour[bounds[r]:bounds[r + 1]] for r in range(k)]
+            if any(sum(demands[s] for s in route) > capacities[order[r]] for r, route in enumerate(routes)):
+                continue
+            cost = sum(matrix[0, route[0]] + sum(matrix[a, b] for a, b in zip(route, route[1:])) + matrix[route[-1], 0]
+                       for route in routes)
+            best = min(best, cost)
+    return best
+
+def test_split_matches_brute_force():
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        n = int(rng.integers(1, 8))
+        points = rng.random((n + 1, 2))
+        matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+        demands = np.concatenate([[0], rng.integers(1, 6, n)])
+        capacities = rng.integers(5, 15, int(rng.integers(1, 5))).tolist()
+        tour = rng.permutation(np.arange(1, n + 1)).tolist()
+        cost, routes = split_giant_tour(tour, matrix, demands, capacities)
+        assert cost == pytest.approx(brute_force_split(tour, matrix, demands, capacities))
+        if cost < float("inf"):
+            for vehicle, route in enumerate(routes):
+                assert demands[route].sum() <= capacities[vehicle], "Routes must respect vehicle capacity."
+
+def test_split_heterogeneous_fleet_and_infeasible():
+    matrix = np.ones((5, 5)) - np.eye(5)
+    demands = [0, 4, 4, 4, 4]
+    cost, routes = split_giant_tour([1, 2, 3, 4], matrix, demands, capacities=[4, 12])
+    assert routes == [[4], [1, 2, 3]], "The first route goes to the largest vehicle."
+    assert cost == pytest.approx(6.0)
+    assert split_giant_tour([1, 2, 3, 4], matrix, demands, capacities=[4, 8]) == (float("inf"), [])
+    fitness = GiantTourSplitFitness(matrix, demands, capacities=[4, 8])
+    # Serving every stop with its own round trip (cost 8) bounds any feasible split.
+    assert fitness([1, 2, 3, 4]) < -8.0, "Infeasible tours should score below any feasible split."
+
+def test_run_cvrp():
+    rng = np.random.default_rng(3)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 31), rng.uniform(54.0, 55.0, 31)])
+    demands = np.concatenate([[0], rng.integers(1, 8, 30)])
+    capacities = [40, 40, 30, 30, 20]
+    optimizer = Optimizer.from_coordinates(coordinates)
+    routes, fitness = optimizer.run_cvrp(demands, capacities, generations=30, population_size=30,
+                                         crossover_method="pmx")
+    assert sorted(stop for route in routes for stop in route) == list(range(1, 31))
+    for vehicle, route in enumerate(routes):
+        assert demands[route].sum() <= capacities[vehicle]
+    assert optimizer.last_run_stats.algorithm == "genetic"
+    with pytest.raises(ValueError):
+        optimizer.run_cvrp(demands, capacities, algorithm="tabu")
@@ -0,0 +1,55 @@
+"""
+Unit tests for the memory-mapped distance-matrix cache.
+Tests include:
+- Exact, subset, and miss lookups.
+- Order-independent keys and reindexing to the caller's stop order.
+- LRU eviction by size.
+"""
+
+import time
+import pytest
+import numpy as np
+from src.core.distance_matrix import haversine_matrix
+from src.core.distance_cache import DistanceMatrixCache
+
+@pytest.fixture
+def stops():
+    rng = np.random.default_rng(1)
+    return np.column_stack([rng.uniform(24.0, 26.0, 40), rng.uniform(54.0, 56.0, 40)])
+
+def test_cache_miss_then_hit(tmp_path, stops):
+    cache = DistanceMatrixCache(str(tmp_path), dtype=np.float64)
+    first = cache.get_matrix(stops)
+    second = cache.get_matrix(stops[::-1])
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert np.allclose(first, haversine_matrix(stops), atol=1e-3)
+    assert np.allclose(second, haversine_matrix(stops[::-1]), atol=1e-3), "Hit should be reindexed to request order."
+
+def test_cache_subset_hit(tmp_path, stops):
+    cache = DistanceMatrixCache(str(tmp_path), dtype=np.float64)
+    cache.get_matrix(stops)
+    subset = stops[[3, 17, 5, 29]]
+    matrix = cache.get_matrix(subset)
+    assert cache.subset_hits == 1 and cache.misses == 1
+    assert np.allclose(matrix, haversine_matrix(subset), atol=1e-3)
+
+def test_cache_is_shared_on_disk(tmp_path, stops):
+    DistanceMatrixCache(str(tmp_path)).get_matrix(stops)
+    other_worker = DistanceMatrixCache(str(tmp_path))
+    matrix, index = other_worker.lookup(stops)
+    assert other_worker.hits == 1 and other_worker.misses == 0
+    assert isinstance(matrix, np.memmap), "Cached matrix should be memory-mapped."
+
+def test_cache_lru_eviction(tmp_path, stops):
+    entry_bytes = 40 * 40 * 4
+    cache = DistanceMatrixCache(str(tmp_path), max_bytes=int(entry_bytes * 2.5))
+    for offset in range(3):
+        cache.get_matrix(stops + offset)
+        time.sleep(0.01)  # Keep access times distinct.
+    cache.get_matrix(stops + 3)
+    assert cache.size_bytes() <= cache.max_bytes
+    cache.get_matrix(stops)
+    assert cache.misses == 5, "Oldest entry should have been evicted."
+
+if __name__ == "__main__":
+    pytest.main()
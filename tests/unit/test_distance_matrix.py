@@ -0,0 +1,56 @@
+"""
+Unit tests for the vectorized distance-matrix module.
+Tests include:
+- Agreement with the scalar Haversine implementation.
+- Rectangular and float32 matrices.
+- Route-length fitness used by the optimizers.
+"""
+
+import pytest
+import numpy as np
+from src.core.utils import calculate_distance
+from src.core.distance_matrix import haversine_matrix, route_length, RouteDistanceFitness
+from src.services.optimization.optimizer import Optimizer
+
+@pytest.fixture
+def stops():
+    rng = np.random.default_rng(0)
+    return np.column_stack([rng.uniform(-60, 60, 25), rng.uniform(-180, 180, 25)])
+
+def test_haversine_matrix_matches_scalar(stops):
+    matrix = haversine_matrix(stops)
+    assert matrix.shape == (25, 25)
+    for i in range(0, 25, 4):
+        for j in range(0, 25, 3):
+            expected = calculate_distance(stops[i, 0], stops[i, 1], stops[j, 0], stops[j, 1])
+            assert matrix[i, j] == pytest.approx(expected, rel=1e-9, abs=1e-9)
+    assert np.allclose(matrix, matrix.T), "Distance matrix should be symmetric."
+    assert np.all(np.diag(matrix) == 0), "Diagonal should be zero."
+
+def test_haversine_matrix_rectangular_and_float32(stops):
+    rect = haversine_matrix(stops[:3], stops, dtype=np.float32)
+    assert rect.shape == (3, 25)
+    assert rect.dtype == np.float32
+    assert np.allclose(rect, haversine_matrix(stops)[:3], rtol=1e-5)
+
+def test_haversine_matrix_rejects_bad_shape():
+    with pytest.raises(ValueError):
+        haversine_matrix([1.0, 2.0, 3.0])
+
+def test_route_distance_fitness(stops):
+    matrix = haversine_matrix(stops)
+    route = [0, 5, 2, 7]
+    open_length = matrix[0, 5] + matrix[5, 2] + matrix[2, 7]
+    assert route_length(matrix, route) == pytest.approx(open_length)
+    assert RouteDistanceFitness(matrix)(route) == pytest.approx(-open_length)
+    assert RouteDistanceFitness(matrix, closed=True)(route) == pytest.approx(-(open_length + matrix[7, 0]))
+
+def test_optimizer_from_coordinates(stops):
+    optimizer = Optimizer.from_coordinates(stops[:8], closed=True)
+    assert optimizer.distance_matrix.shape == (8, 8)
+    best_solution, best_fitness = optimizer.run_simulated_annealing(initial_temp=10, cooling_rate=0.5, min_temp=1, max_iter=50)
+    assert sorted(best_solution) == list(range(8)), "Solution should be a permutation of all stops."
+    assert best_fitness == pytest.approx(optimizer.fitness_fn(best_solution))
+
+if __name__ == "__main__":
+    pytest.main()
@@ -3,10 +3,22 @@ Unit tests for data ingestion and cleaning modules.
 Tests include:
 - Verifying that null and duplicate records are removed.
 - Checking proper error handling for invalid input types.
+- Batched ingestion decodes, cleans, and handles every message and commits all offsets.
+- Offsets are committed only up to the first unfinished or failed batch of each partition.
+- The number of batches in flight stays bounded.
+- Batches of one partition reach the handler one at a time, in offset order.
 """
 
+import json
+import time
+import threading
 import pytest
 from src.services.data_ingestion.data_cleaner import clean_data
+from src.services.data_ingestion.kafka_consumer import IngestionService, decode_batch
+from src.services.data_ingestion.memory_broker import InMemoryConsumer
+
+def _messages(start, stop):
+    return [json.dumps({"vehicle_id": i, "status": "En Route"}).encode() for i in range(start, stop)]
 
 def test_clean_data_removes_null_and_duplicates():
     sample_data = [
@@ -29,5 +41,115 @@ def test_clean_data_invalid_input():
     with pytest.raises(ValueError):
         clean_data("invalid input type")
 
+def test_clean_data_handles_unhashable_values():
+    cleaned = clean_data([{"id": 1, "position": [24.5, 54.3]}, {"id": 1, "position": [24.5, 54.3]}, [1, 2]])
+    assert cleaned == [{"id": 1, "position": [24.5, 54.3]}]
+
+def test_decode_batch_skips_malformed_messages():
+    decoded, malformed = decode_batch([b'{"id": 1}', b"not json", None, b"\xff", b'{"id": 2}'])
+    assert decoded == [{"id": 1}, {"id": 2}]
+    assert malformed == 3
+
+def test_ingestion_processes_and_commits_everything():
+    consumer = InMemoryConsumer(partitions=3)
+    consumer.send_batch(_messages(0, 1000) + [b"{broken", b"null"] + _messages(0, 10))
+    batches = []
+    service = IngestionService(consumer, batches.append, max_records=64, max_workers=3, poll_timeout_ms=10)
+    service.run(idle_timeout=0.05)
+    records = [record for batch in batches for record in batch]
+    # Duplicates are removed within a batch; the repeated ids 0-9 may land in another batch.
+    assert {record["vehicle_id"] for record in records} == set(range(1000))
+    assert 1000 <= len(records) <= 1010
+    assert all(record["status"] == "en route" for record in records)
+    stats = service.stats()
+    assert stats["polled"] == 1012
+    assert stats["malformed"] == 1
+    assert stats["processed"] + stats["dropped"] + stats["malformed"] == 1012
+    assert stats["records_per_second"] > 0
+    for tp in consumer.partitions:
+        assert consumer.committed(tp) == len(consumer._logs[tp])
+
+def test_offsets_wait_for_unfinished_batches():
+    consumer = InMemoryConsumer(partitions=2)
+    consumer.send_batch(_messages(0, 30), partition=0)
+    consumer.send_batch(_messages(100, 130), partition=1)
+    release, other_done = threading.Event(), threading.Event()
+
+    def handler(records):
+        if records[0]["vehicle_id"] == 0:
+            release.wait(5)
+        elif records[-1]["vehicle_id"] == 129:
+            other_done.set()
+
+    service = IngestionService(consumer, handler, max_records=10, max_workers=3, poll_timeout_ms=10)
+    runner = threading.Thread(target=service.run, kwargs={"idle_timeout": 0.05})
+    runner.start()
+    # The other partition is handled and committed while the first batch of partition 0 is stuck.
+    assert other_done.wait(5)
+    blocked, other = consumer.partitions
+    deadline = time.time() + 5
+    while consumer.committed(other) != 30 and time.time() < deadline:
+        time.sleep(0.01)
+    assert consumer.committed(other) == 30
+    assert consumer.committed(blocked) is None
+    release.set()
+    runner.join(5)
+    assert consumer.committed(blocked) == 30
+
+def test_failed_batch_stops_before_commit():
+    consumer = InMemoryConsumer(partitions=1)
+    consumer.send_batch(_messages(0, 30))
+    calls = []
+
+    def handler(records):
+        calls.append(records[0]["vehicle_id"])
+        if records[0]["vehicle_id"] == 10:
+            raise IOError("store unavailable")
+
+    service = IngestionService(consumer, handler, max_records=10, max_workers=1, retries=2, poll_timeout_ms=10)
+    with pytest.raises(IOError):
+        service.run(idle_timeout=0.05)
+    assert calls.count(10) == 3
+    assert consumer.committed(consumer.partitions[0]) == 10
+
+def test_in_flight_batches_are_bounded():
+    consumer = InMemoryConsumer(partitions=2)
+    consumer.send_batch(_messages(0, 400))
+    handled = []
+
+    def handler(records):
+        # Polled records not yet handled all belong to batches holding a slot.
+        handled.append(service.counters["polled"] - 10 * len(handled))
+        threading.Event().wait(0.002)
+
+    service = IngestionService(consumer, handler, max_records=10, max_workers=2, max_in_flight=3, poll_timeout_ms=10)
+    service.run(idle_timeout=0.05)
+    assert len(handled) == 40
+    assert max(handled) <= 3 * 10
+
+def test_partition_batches_are_handled_in_order():
+    consumer = InMemoryConsumer(partitions=2)
+    consumer.send_batch(_messages(0, 400))
+    seen = {0: [], 1: []}
+    active = {0: 0, 1: 0}
+    overlaps = []
+    lock = threading.Lock()
+
+    def handler(records):
+        partition = records[0]["vehicle_id"] % 2
+        with lock:
+            active[partition] += 1
+            overlaps.append(active[partition] > 1)
+        threading.Event().wait(0.001)
+        seen[partition].extend(record["vehicle_id"] for record in records)
+        with lock:
+            active[partition] -= 1
+
+    service = IngestionService(consumer, handler, max_records=10, max_workers=4, poll_timeout_ms=10)
+    service.run(idle_timeout=0.05)
+    assert not any(overlaps)
+    assert seen[0] == list(range(0, 400, 2))
+    assert seen[1] == list(range(1, 400, 2))
+
 if __name__ == "__main__":
     pytest.main()
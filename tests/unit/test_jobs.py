@@ -0,0 +1,111 @@
+"""
+Unit tests for the background optimization job manager.
+Tests include:
+- Jobs run in the process pool and report progress and their result.
+- Submissions beyond the queue depth are rejected.
+- Failed jobs record their error.
+- Batches yield every problem's result and hold queue slots while they run.
+- Batches that are closed or dropped before iterating still release their slots.
+- run awaits the job's result, and raises on failure.
+- A pool broken by a dead worker process is replaced on the next submission.
+"""
+
+import os
+import gc
+import time
+import asyncio
+import pytest
+import numpy as np
+from src.services.api.jobs import JobManager, JobQueueFullError, FINISHED, SUCCEEDED, FAILED
+from src.services.api.solver import normalize_route_request
+
+def make_request(n=30):
+    rng = np.random.default_rng(n)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, n), rng.uniform(54.0, 55.0, n)]).tolist()
+    return normalize_route_request({"route": list(range(n)), "vehicle_capacity": 50, "coordinates": coordinates})
+
+def wait(job, timeout=30.0):
+    deadline = time.time() + timeout
+    while job.status not in FINISHED and time.time() < deadline:
+        time.sleep(0.02)
+    return job
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1, max_queue=1, time_limit=0.5)
+    yield manager
+    manager.shutdown()
+
+def test_job_reports_progress_and_result(manager):
+    job = wait(manager.submit(make_request()))
+    assert job.status == SUCCEEDED
+    assert sorted(job.result["route"]) == list(range(30))
+    assert job.started_at is not None and job.finished_at >= job.started_at
+    assert job.result["stats"]["stop_reason"] == "time_limit"
+    assert manager.get(job.id) is job
+    assert manager.stats()["succeeded"] == 1
+
+def test_submissions_beyond_capacity_are_rejected(manager):
+    jobs = [manager.submit(make_request()) for _ in range(manager.capacity)]
+    with pytest.raises(JobQueueFullError):
+        manager.submit(make_request())
+    for job in jobs:
+        wait(job)
+    # Finished jobs free their slots.
+    assert wait(manager.submit(make_request())).status == SUCCEEDED
+
+def test_failed_job_records_error(manager):
+    job = wait(manager.submit({"route": [0, 5], "vehicle_capacity": 50, "coordinates": [[24.0, 54.0]]}))
+    assert job.status == FAILED
+    assert "IndexError" in job.error
+
+def test_batch_yields_every_result_and_reserves_slots(manager):
+    requests = [make_request(n) for n in (5, 6, 7)]
+    requests.insert(1, {"route": [0, 5], "vehicle_capacity": 50, "coordinates": [[24.0, 54.0]]})
+
+    async def collect():
+        results = manager.run_batch(requests)
+        assert manager.active() == 1
+        with pytest.raises(JobQueueFullError):
+            manager.run_batch(requests, window=2)
+        return [item async for item in results]
+
+    results = asyncio.run(collect())
+    assert sorted(index for index, _, _ in results) == [0, 1, 2, 3]
+    for index, result, error in results:
+        if index == 1:
+            assert result is None and "IndexError" in error
+        else:
+            assert error is None and sorted(result["route"]) == requests[index]["route"]
+    assert manager.active() == 0
+
+def test_unstarted_batch_releases_slots(manager):
+    requests = [make_request(5), make_request(6)]
+
+    async def close_without_iterating():
+        results = manager.run_batch(requests)
+        assert manager.active() == 1
+        await results.aclose()
+        await results.aclose()
+
+    asyncio.run(close_without_iterating())
+    assert manager.active() == 0
+    results = manager.run_batch(requests)
+    assert manager.active() == 1
+    del results
+    gc.collect()
+    assert manager.active() == 0
+
+def test_run_awaits_result(manager):
+    result = asyncio.run(manager.run(make_request(8)))
+    assert sorted(result["route"]) == list(range(8))
+    with pytest.raises(RuntimeError, match="IndexError"):
+        asyncio.run(manager.run({"route": [0, 5], "vehicle_capacity": 50, "coordinates": [[24.0, 54.0]]}))
+    assert manager.active() == 0
+
+def test_broken_pool_is_replaced(manager):
+    # A worker process that exits abruptly breaks the pool, like one killed for running out of memory.
+    with pytest.raises(Exception, match="terminated abruptly"):
+        manager._pool_submit(os._exit, 1).result(timeout=30)
+    assert wait(manager.submit(make_request())).status == SUCCEEDED
+    assert asyncio.run(manager.run(make_request(8)))["stats"]["stop_reason"] == "time_limit"
@@ -2,13 +2,34 @@
 Unit tests for optimization algorithms and the orchestrator.
 Tests include:
 - Genetic Algorithm execution.
+- Genetic Algorithm fitness memoization.
+- Genetic Algorithm batch (vectorized) mode.
+- Genetic Algorithm crossover method selection (OX, PMX, ERX).
+- Parallel fitness evaluation with shared executors.
+- Island-model Genetic Algorithm.
+- Move-based Simulated Annealing neighborhoods with O(1) deltas.
+- Parallel tempering and multi-start Simulated Annealing.
+- Parallel tempering tasks carry the distance matrix by shared memory reference, not by value.
+- Time-limit and stagnation early stopping, and runs that complete their full budget.
+- Sampled progress callbacks (no stdout output from the algorithm loops).
 - Simulated Annealing execution.
 - Reinforcement Learning action selection.
+- Lazy algorithm loading: GA and SA runs never import TensorFlow.
 """
 
+import sys
+import pickle
+import subprocess
 import pytest
 import random
-from src.services.optimization.optimizer import Optimizer
+import numpy as np
+from src.core.distance_matrix import RouteDistanceFitness
+from src.services.optimization.optimizer import Optimizer, ALGORITHMS, load_algorithm
+from src.services.optimization.algorithms.genetic import GeneticAlgorithm
+from src.services.optimization.parallel import get_executor, parallel_map
+from src.services.optimization.algorithms.neighborhoods import TourNeighborhood
+from src.services.optimization.algorithms.parallel_tempering import ChainContext, _anneal_chain
+from src.services.optimization.stopping import StoppingCriteria, COMPLETED, TIME_LIMIT, STAGNATION
 
 # Dummy fitness function: lower sum indicates a better solution.
 def dummy_fitness(chromosome):
@@ -31,6 +52,225 @@ def test_run_genetic(optimizer_instance):
     assert len(best_solution) == optimizer_instance.chromosome_length, "Chromosome length mismatch."
     assert isinstance(best_fitness, float), "Best fitness should be a float."
 
+def test_genetic_evaluates_each_individual_once_per_generation():
+    calls = []
+
+    def counting_fitness(chromosome):
+        calls.append(1)
+        return dummy_fitness(chromosome)
+
+    random.seed(3)
+    ga = GeneticAlgorithm(20, 0.1, 0.8, counting_fitness)
+    ga.run(list(range(1, 21)), 10, generations=5)
+    assert ga.evaluations == len(calls) == 20 * 6, "Each individual should be scored once per generation."
+
+def test_genetic_fitness_cache_preserves_results():
+    results = []
+    for cache_size in (0, 500):
+        random.seed(11)
+        ga = GeneticAlgorithm(20, 0.1, 0.8, dummy_fitness, fitness_cache_size=cache_size)
+        results.append((ga.run(list(range(1, 21)), 10, generations=8), ga))
+    (plain, plain_ga), (cached, cached_ga) = results
+    assert plain == cached, "Cached and uncached runs should be identical under a fixed seed."
+    assert cached_ga.cache_hits > 0
+    assert cached_ga.evaluations + cached_ga.cache_hits == plain_ga.evaluations
+
+def test_genetic_batch_mode():
+    matrix = np.abs(np.subtract.outer(np.arange(15.0), np.arange(15.0)))
+    fitness = RouteDistanceFitness(matrix)
+    random.seed(2)
+    ga = GeneticAlgorithm(40, 0.05, 0.8, fitness, batch_fitness_fn=fitness.evaluate_batch)
+    population = ga.initialize_population(list(range(15)), 15)
+    assert isinstance(population, np.ndarray) and population.shape == (40, 15)
+    best_solution, best_fitness = ga.run(list(range(15)), 15, generations=30)
+    assert sorted(best_solution) == list(range(15)), "Best solution should be a permutation."
+    assert best_fitness == pytest.approx(fitness(best_solution))
+    assert ga.evaluations == 40 * 31
+
+@pytest.mark.parametrize("method", ["pmx", "erx"])
+@pytest.mark.parametrize("batch", [False, True])
+def test_genetic_crossover_methods(method, batch):
+    matrix = np.abs(np.subtract.outer(np.arange(15.0), np.arange(15.0)))
+    fitness = RouteDistanceFitness(matrix)
+    random.seed(4)
+    ga = GeneticAlgorithm(30, 0.05, 0.8, fitness, batch_fitness_fn=fitness.evaluate_batch if batch else None,
+                          crossover_method=method)
+    best_solution, best_fitness = ga.run(list(range(15)), 15, generations=20)
+    assert sorted(best_solution) == list(range(15)), "Best solution should be a permutation."
+    assert best_fitness == pytest.approx(fitness(best_solution))
+
+def test_run_genetic_rejects_unknown_crossover(optimizer_instance):
+    with pytest.raises(ValueError):
+        optimizer_instance.run_genetic(generations=1, crossover_method="cx")
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_parallel_evaluation_matches_serial(kind):
+    executor = get_executor(kind, max_workers=2)
+    assert get_executor(kind, max_workers=2) is executor, "Pools should be reused across runs."
+    assert parallel_map(executor, dummy_fitness, [[i, i + 1] for i in range(25)]) == [-(2 * i + 1) for i in range(25)]
+
+    results = []
+    for pool in (None, executor):
+        random.seed(4)
+        ga = GeneticAlgorithm(20, 0.1, 0.8, dummy_fitness, executor=pool)
+        results.append(ga.run(list(range(1, 21)), 10, generations=5))
+    assert results[0] == results[1], "Parallel evaluation should not change results."
+
+def test_run_island_genetic(optimizer_instance):
+    best_solution, best_fitness = optimizer_instance.run_island_genetic(
+        num_islands=3, generations=6, population_size=10, migration_interval=2, migrants=2
+    )
+    assert len(best_solution) == optimizer_instance.chromosome_length
+    assert len(set(best_solution)) == len(best_solution), "Genes should not repeat."
+    assert best_fitness == dummy_fitness(best_solution)
+
+def test_simulated_annealing_multi_candidate(optimizer_instance):
+    optimizer_instance.executor = "thread"
+    best_solution, best_fitness = optimizer_instance.run_simulated_annealing(
+        initial_temp=10, cooling_rate=0.5, min_temp=1, max_iter=20, candidates=4
+    )
+    assert len(best_solution) == optimizer_instance.chromosome_length
+    assert best_fitness == dummy_fitness(best_solution)
+
+@pytest.mark.parametrize("closed", [True, False])
+@pytest.mark.parametrize("move", ["swap", "two_opt", "or_opt"])
+def test_neighborhood_deltas_match_route_length(closed, move):
+    rng = np.random.default_rng(5)
+    points = rng.random((9, 2))
+    matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+    fitness = RouteDistanceFitness(matrix, closed=closed)
+    neighborhood = TourNeighborhood(matrix, rng.permutation(9), closed=closed, rng=rng)
+    for _ in range(200):
+        before = neighborhood.route()
+        _, params, deltas = neighborhood.propose(4, move)
+        k = int(rng.integers(4))
+        neighborhood.apply(move, params, k, deltas[k])
+        after = neighborhood.route()
+        assert sorted(after) == list(range(9)), "Moves should keep the route a permutation."
+        assert fitness(before) - fitness(after) == pytest.approx(deltas[k], abs=1e-9)
+
+def test_simulated_annealing_move_mode():
+    rng = np.random.default_rng(6)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 40), rng.uniform(54.0, 55.0, 40)])
+    optimizer = Optimizer.from_coordinates(coordinates, closed=True)
+    initial_solution = list(range(40))
+    best_solution, best_fitness = optimizer.run_simulated_annealing(
+        initial_solution=initial_solution, initial_temp=5, cooling_rate=0.8, min_temp=0.01, max_iter=2000
+    )
+    assert sorted(best_solution) == initial_solution
+    assert best_fitness == pytest.approx(optimizer.fitness_fn(best_solution))
+    assert best_fitness > optimizer.fitness_fn(initial_solution), "Annealing should shorten the route."
+
+def test_run_parallel_tempering(optimizer_instance):
+    optimizer_instance.max_workers = 2
+    best_solution, best_fitness = optimizer_instance.run_parallel_tempering(
+        num_chains=3, min_temp=1, max_temp=50, sweep_iterations=50, rounds=4
+    )
+    assert len(best_solution) == optimizer_instance.chromosome_length
+    assert best_fitness == dummy_fitness(best_solution)
+
+def test_run_genetic_matches_direct_ga_run(optimizer_instance):
+    random.seed(7)
+    np.random.seed(7)
+    via_optimizer = optimizer_instance.run_genetic(generations=5, population_size=12, seed_fraction=0.0)
+    random.seed(7)
+    np.random.seed(7)
+    ga = GeneticAlgorithm(12, 0.05, 0.7, dummy_fitness)
+    direct = ga.run(optimizer_instance.gene_pool, optimizer_instance.chromosome_length, 5)
+    assert via_optimizer == direct
+
+def test_chain_context_is_shipped_by_reference():
+    rng = np.random.default_rng(0)
+    matrix = rng.random((300, 300))
+    context = ChainContext(RouteDistanceFitness(matrix), {"distance_matrix": matrix, "closed": False}, share=True)
+    try:
+        task = (1, list(range(300)), context, {"initial_temp": 1.0, "max_iter": 50}, 1, None, None)
+        assert len(pickle.dumps(task)) < 10_000 < matrix.nbytes
+        # What a worker process sees: the context is read from shared memory and cached.
+        shipped = pickle.loads(pickle.dumps(task))
+        fitness_fn, sa_kwargs = shipped[2].load()
+        np.testing.assert_array_equal(sa_kwargs["distance_matrix"], matrix)
+        assert sa_kwargs["tour_matrix"].shape == (301, 301)
+        assert pickle.loads(pickle.dumps(context)).load()[1] is sa_kwargs
+        _, _, best_state, best_fitness, _ = _anneal_chain(shipped)
+        assert best_fitness == pytest.approx(fitness_fn(best_state))
+    finally:
+        context.close()
+        context.close()
+
+def test_parallel_tempering_with_distance_matrix():
+    coordinates = np.random.default_rng(3).uniform([24.0, 54.0], [25.0, 55.0], size=(40, 2))
+    optimizer = Optimizer.from_coordinates(coordinates)
+    optimizer.max_workers = 2
+    best_solution, best_fitness = optimizer.run_parallel_tempering(num_chains=3, sweep_iterations=200, rounds=3)
+    assert sorted(best_solution) == list(range(40))
+    assert best_fitness == pytest.approx(optimizer.fitness_fn(best_solution))
+
+def test_run_multistart_annealing(optimizer_instance):
+    optimizer_instance.max_workers = 2
+    best_solution, best_fitness = optimizer_instance.run_multistart_annealing(
+        num_starts=3, initial_temp=50, cooling_rate=0.5, min_temp=1, max_iter=50
+    )
+    assert len(best_solution) == optimizer_instance.chromosome_length
+    assert best_fitness == dummy_fitness(best_solution)
+
+def test_stopping_criteria_stagnation():
+    criteria = StoppingCriteria(patience=2).start()
+    assert criteria.update(-5.0) is None
+    assert criteria.update(-4.0) is None
+    assert criteria.update(-4.0) is None
+    assert criteria.update(-4.0) == STAGNATION
+
+def test_unbounded_run_completes(optimizer_instance):
+    optimizer_instance.run_genetic(generations=5, population_size=10)
+    stats = optimizer_instance.last_run_stats
+    assert stats.stop_reason == COMPLETED
+    assert stats.iterations == 5
+
+def test_genetic_time_limit_returns_best_so_far(optimizer_instance):
+    best_solution, best_fitness = optimizer_instance.run_genetic(generations=1_000_000, population_size=20,
+                                                                 time_limit=0.2)
+    stats = optimizer_instance.last_run_stats
+    assert stats.stop_reason == TIME_LIMIT
+    assert stats.iterations < 1_000_000
+    assert stats.elapsed < 5.0
+    assert best_fitness == dummy_fitness(best_solution)
+
+def test_simulated_annealing_patience(optimizer_instance):
+    best_solution, best_fitness = optimizer_instance.run_simulated_annealing(
+        initial_temp=1e-6, cooling_rate=0.999, min_temp=1e-12, max_iter=5, patience=3
+    )
+    stats = optimizer_instance.last_run_stats
+    assert stats.stop_reason == STAGNATION
+    assert stats.best_fitness == best_fitness == dummy_fitness(best_solution)
+
+def test_run_island_genetic_patience(optimizer_instance):
+    optimizer_instance.run_island_genetic(num_islands=2, generations=10_000, population_size=10,
+                                          migration_interval=2, patience=5)
+    stats = optimizer_instance.last_run_stats
+    assert stats.stop_reason == STAGNATION
+    assert stats.iterations < 10_000
+
+def test_run_parallel_tempering_time_limit(optimizer_instance):
+    optimizer_instance.max_workers = 2
+    optimizer_instance.run_parallel_tempering(num_chains=2, sweep_iterations=10_000_000, rounds=5, time_limit=0.3)
+    stats = optimizer_instance.last_run_stats
+    assert stats.stop_reason == TIME_LIMIT
+    assert stats.iterations == 1
+
+def test_progress_callback_is_sampled(optimizer_instance, capsys):
+    events = []
+    optimizer_instance.progress_callback = events.append
+    optimizer_instance.progress_every = 5
+    optimizer_instance.run_genetic(generations=12, population_size=10)
+    assert [event.iteration for event in events] == [5, 10, 12]
+    assert events[-1].final and not events[0].final
+    assert events[-1].evaluations == optimizer_instance.last_run_stats.evaluations
+    assert all(a.best_fitness <= b.best_fitness for a, b in zip(events, events[1:]))
+    optimizer_instance.run_simulated_annealing(initial_temp=10, cooling_rate=0.5, min_temp=1, max_iter=10)
+    assert events[-1].algorithm == "simulated_annealing" and events[-1].final
+    assert capsys.readouterr().out == "", "Algorithm loops should not print."
+
 def test_run_simulated_annealing(optimizer_instance):
     initial_solution = random.sample(optimizer_instance.gene_pool, optimizer_instance.chromosome_length)
     best_solution, best_fitness = optimizer_instance.run_simulated_annealing(
@@ -56,5 +296,23 @@ def test_run_reinforcement_learning(optimizer_instance):
     )
     assert isinstance(action, int), "RL should return an integer action."
 
+def test_algorithms_load_lazily_without_tensorflow():
+    code = """
+import sys
+from src.services.optimization.optimizer import Optimizer
+assert "src.services.optimization.algorithms.genetic" not in sys.modules
+optimizer = Optimizer.from_coordinates([[24.0, 54.0], [24.1, 54.2], [24.3, 54.1], [24.2, 54.4]])
+optimizer.run_genetic(generations=2, population_size=6)
+optimizer.run_simulated_annealing(max_iter=10)
+sys.exit("tensorflow" in sys.modules)
+"""
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+def test_load_algorithm_registry():
+    assert load_algorithm("genetic") is GeneticAlgorithm
+    assert set(ALGORITHMS) >= {"genetic", "simulated_annealing", "reinforcement_learning"}
+    with pytest.raises(ValueError):
+        load_algorithm("tabu_search")
+
 if __name__ == "__main__":
     pytest.main()
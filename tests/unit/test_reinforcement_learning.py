@@ -0,0 +1,76 @@
+"""
+Unit tests for the DQN agent's replay buffer, batched inference, and minibatch training.
+Tests include:
+- The replay buffer wraps around and samples stored transitions.
+- Batched actions match the Keras model's per-state greedy actions.
+- Replayed minibatch training fits a fixed reward, and the target network syncs on schedule.
+- Exported NumPy policies reproduce the Q-network without importing TensorFlow.
+"""
+
+import sys
+import subprocess
+import numpy as np
+from src.services.optimization.algorithms.reinforcement_learning import RLAgent, ReplayBuffer
+from src.services.optimization.algorithms.numpy_policy import NumpyPolicy
+from src.services.optimization.optimizer import Optimizer
+
+def test_replay_buffer_wraps_and_samples():
+    buffer = ReplayBuffer(capacity=5, state_size=2, seed=0)
+    states = np.arange(14, dtype=float).reshape(7, 2)
+    buffer.add_batch(states[:4], np.arange(4), np.arange(4), states[:4] + 1, np.zeros(4))
+    buffer.add_batch(states[4:], np.arange(4, 7), np.arange(4, 7), states[4:] + 1, np.ones(3))
+    assert len(buffer) == 5 and buffer.position == 2
+    assert sorted(buffer.actions.tolist()) == [2, 3, 4, 5, 6]
+    batch_states, actions, rewards, next_states, dones = buffer.sample(32)
+    assert batch_states.shape == (32, 2)
+    np.testing.assert_array_equal(batch_states[:, 0], actions * 2)
+    np.testing.assert_array_equal(next_states, batch_states + 1)
+    np.testing.assert_array_equal(dones, actions >= 4)
+    buffer.add(states[0], 0, 0.0, states[0], True)
+    assert len(buffer) == 5 and buffer.actions[2] == 0
+
+def test_batched_act_matches_model():
+    agent = RLAgent(6, 4, seed=0)
+    states = np.random.default_rng(0).random((50, 6))
+    actions = agent.act_batch(states)
+    expected = np.argmax(agent.model.predict(states, verbose=0), axis=1)
+    np.testing.assert_array_equal(actions, expected)
+    assert isinstance(agent.act(states[0]), int)
+    assert agent.act(states[0]) == actions[0]
+    exploring = agent.act_batch(states, epsilon=1.0, rng=np.random.default_rng(1))
+    assert exploring.shape == (50,) and ((0 <= exploring) & (exploring < 4)).all()
+
+def test_replay_training_fits_rewards_and_syncs_target():
+    agent = RLAgent(3, 2, learning_rate=0.01, batch_size=32, target_update_interval=10, seed=0)
+    rng = np.random.default_rng(0)
+    states = rng.random((200, 3)).astype(np.float32)
+    actions = rng.integers(0, 2, 200)
+    # Terminal transitions whose reward is 1 for action 1 and 0 for action 0.
+    agent.buffer.add_batch(states, actions, actions.astype(float), states, np.ones(200))
+    losses = [agent.replay() for _ in range(150)]
+    assert np.mean(losses[-10:]) < np.mean(losses[:10])
+    np.testing.assert_array_equal(agent.act_batch(states), np.ones(200))
+    assert agent.train_steps == 150
+    for online, target in zip(agent.model.get_weights(), agent.target_model.get_weights()):
+        np.testing.assert_allclose(online, target)
+
+def test_numpy_policy_matches_q_network(tmp_path):
+    agent = RLAgent(5, 3, seed=0)
+    states = np.random.default_rng(2).random((40, 5))
+    agent.buffer.add_batch(states, np.zeros(40, dtype=int), np.ones(40), states, np.zeros(40))
+    for _ in range(5):
+        agent.replay()
+    policy = agent.export_policy()
+    np.testing.assert_allclose(policy.q_values(states), agent.q_values(states), rtol=1e-5, atol=1e-5)
+
+    path = str(tmp_path / "policy.npz")
+    agent.save_policy(path)
+    loaded = NumpyPolicy.load(path)
+    np.testing.assert_array_equal(loaded.act_batch(states), policy.act_batch(states))
+    np.testing.assert_array_equal(Optimizer.select_actions(states, path), agent.act_batch(states))
+    assert loaded.act(states[0]) == agent.act(states[0])
+
+def test_numpy_policy_does_not_import_tensorflow():
+    code = ("import sys; import src.services.optimization.algorithms.numpy_policy; "
+            "sys.exit('tensorflow' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,77 @@
+"""
+Unit tests for incremental re-optimization.
+Tests include:
+- Vectorized 2-opt and relocation deltas match recomputed tour lengths.
+- Adding, removing, and moving stops keeps the route consistent and the matrix exact.
+- The repaired route is 2-opt locally optimal.
+"""
+
+import pytest
+import numpy as np
+from src.core.distance_matrix import haversine_matrix
+from src.services.optimization.reoptimize import IncrementalReoptimizer, two_opt_deltas, relocation_deltas
+
+def tour_length(sub, tour):
+    return float(sub[tour, np.roll(tour, -1)].sum())
+
+def test_move_deltas_match_recomputed_lengths():
+    rng = np.random.default_rng(0)
+    points = rng.random((12, 2))
+    sub = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+    tour = rng.permutation(12)
+    base = tour_length(sub, tour)
+    ordered = sub[np.ix_(tour, tour)]
+    deltas = two_opt_deltas(ordered)
+    for i in range(1, 12):
+        for j in range(i + 1, 12):
+            moved = tour.copy()
+            moved[i:j + 1] = moved[i:j + 1][::-1]
+            assert deltas[i - 1, j - 1] == pytest.approx(tour_length(sub, moved) - base)
+    for length in (1, 2, 3):
+        deltas = relocation_deltas(ordered, length)
+        for i in range(1, 12 - length + 1):
+            for p in range(12):
+                if np.isinf(deltas[i - 1, p]):
+                    assert i - 1 <= p <= i + length - 1
+                    continue
+                segment = tour[i:i + length]
+                rest = np.delete(tour, np.arange(i, i + length))
+                moved = np.insert(rest, p + 1 if p < i else p + 1 - length, segment)
+                assert deltas[i - 1, p] == pytest.approx(tour_length(sub, moved) - base)
+
+@pytest.mark.parametrize("closed", [False, True])
+@pytest.mark.parametrize("depot", [None, 0])
+def test_updates_keep_route_consistent(closed, depot):
+    rng = np.random.default_rng(1)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 41), rng.uniform(54.0, 55.0, 41)])
+    route = list(range(1, 41)) if depot == 0 else list(range(41))
+    reoptimizer = IncrementalReoptimizer(coordinates, route, closed=closed, depot=depot)
+    initial_length = reoptimizer.length()
+    reoptimizer.update(time_limit=None)
+    assert reoptimizer.length() < initial_length
+
+    route, new_ids = reoptimizer.update(added=[[24.5, 54.5], [24.2, 54.9]], removed=[5, 7],
+                                        moved={10: (24.9, 54.1)}, time_limit=None)
+    assert new_ids == [41, 42]
+    expected = (set(range(1, 41)) if depot == 0 else set(range(41))) - {5, 7} | {41, 42}
+    assert sorted(route) == sorted(expected)
+    assert reoptimizer.last_run_stats.best_fitness == pytest.approx(-reoptimizer.length())
+    np.testing.assert_allclose(reoptimizer.matrix, haversine_matrix(reoptimizer.coordinates), atol=1e-9)
+
+    # No improving 2-opt move is left.
+    sub, _, _ = reoptimizer._local(route)
+    assert two_opt_deltas(sub).min() > -1e-9
+
+def test_matrix_grows_beyond_initial_capacity():
+    rng = np.random.default_rng(2)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 5), rng.uniform(54.0, 55.0, 5)])
+    reoptimizer = IncrementalReoptimizer(coordinates, list(range(5)))
+    for _ in range(30):
+        reoptimizer.update(added=[[rng.uniform(24.0, 25.0), rng.uniform(54.0, 55.0)]])
+    assert sorted(reoptimizer.route) == list(range(35))
+    np.testing.assert_allclose(reoptimizer.matrix, haversine_matrix(reoptimizer.coordinates), atol=1e-9)
+
+def test_update_rejects_unknown_stops():
+    reoptimizer = IncrementalReoptimizer([[24.0, 54.0], [24.1, 54.1], [24.2, 54.2]], [0, 1])
+    with pytest.raises(ValueError):
+        reoptimizer.update(removed=[2])
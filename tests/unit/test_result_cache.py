@@ -0,0 +1,110 @@
+"""
+Unit tests for the API result cache and request normalization.
+Tests include:
+- Fingerprints ignore key order, and equivalent payloads normalize to the same request.
+- TTL expiry and LRU eviction with hit/miss metrics.
+- Concurrent identical requests are coalesced onto one computation; failures are not cached.
+"""
+
+import asyncio
+import pytest
+from jsonschema import ValidationError
+from src.services.api.result_cache import ResultCache, fingerprint
+from src.services.api.solver import normalize_route_request, solve_route_request
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def payload(**overrides):
+    data = {
+        "route": [0, 1, 2, 3],
+        "vehicle_capacity": 50,
+        "coordinates": [[24.0, 54.0], [24.1, 54.2], [24.3, 54.1], [24.2, 54.4]],
+    }
+    data.update(overrides)
+    return data
+
+def test_equivalent_payloads_share_a_fingerprint():
+    windows = [{"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T12:00:00Z"}] * 4
+    first = normalize_route_request(payload(delivery_windows=windows))
+    second = normalize_route_request({
+        "delivery_windows": [{"end": "2025-01-01T16:00:00+04:00", "start": "2025-01-01T08:00:00+00:00"}] * 4,
+        "coordinates": [[24.0000000001, 54.0], [24.1, 54.2], [24.3, 54.1], [24.2, 54.4]],
+        "vehicle_capacity": 50.0,
+        "route": [0.0, 1, 2, 3],
+    })
+    assert fingerprint(first) == fingerprint(second)
+    assert fingerprint(first) != fingerprint(normalize_route_request(payload(vehicle_capacity=60)))
+    assert fingerprint(normalize_route_request(payload(delivery_windows=[]))) == \
+        fingerprint(normalize_route_request(payload()))
+    # Timestamps without a timezone are UTC.
+    naive = [{"start": "2025-01-01T08:00:00", "end": "2025-01-01T12:00:00"}] * 4
+    assert fingerprint(normalize_route_request(payload(delivery_windows=naive))) == fingerprint(first)
+
+def test_normalize_rejects_invalid_payloads():
+    with pytest.raises(ValidationError):
+        normalize_route_request(payload(route=[0]))
+    with pytest.raises(ValueError):
+        normalize_route_request({"route": [0, 1], "vehicle_capacity": 50})
+    with pytest.raises(ValueError):
+        normalize_route_request(payload(route=[0, 1, 7]))
+    with pytest.raises(ValueError):
+        normalize_route_request(payload(route=[0, 1.5]))
+
+def test_solve_returns_every_stop():
+    result = solve_route_request(normalize_route_request(payload(route=[3, 1, 0, 2])), time_limit=0.1)
+    assert sorted(result["route"]) == [0, 1, 2, 3]
+    assert result["distance_km"] > 0
+
+def test_ttl_expiry_and_lru_eviction():
+    clock = FakeClock()
+    cache = ResultCache(max_entries=2, ttl=10.0, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry.
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    clock.now = 11.0
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]) == (2, 2, 1, 1)
+    assert stats["size"] == 1
+
+def test_concurrent_requests_are_coalesced():
+    cache = ResultCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"route": [0, 1]}
+
+    async def main():
+        first = await asyncio.gather(*(cache.get_or_compute("key", compute) for _ in range(4)))
+        second = await cache.get_or_compute("key", compute)
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert len(calls) == 1
+    assert sorted(source for _, source in first) == ["coalesced"] * 3 + ["miss"]
+    assert second == ({"route": [0, 1]}, "hit")
+    assert cache.stats()["in_flight"] == 0
+
+def test_failures_are_not_cached():
+    cache = ResultCache()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("solver crashed")
+
+    async def main():
+        return await asyncio.gather(*(cache.get_or_compute("key", fail) for _ in range(2)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(cache) == 0 and cache.stats()["in_flight"] == 0
@@ -0,0 +1,76 @@
+"""
+Unit tests for the vectorized route-adjustment RL environment.
+Tests include:
+- Steps keep every episode's route a permutation of its stops.
+- Rewards equal the scaled decrease in tour length.
+- Finished episodes are reset in place.
+- Greedy one-step actions shorten tours.
+- The optimizer trains a policy on batched rollouts.
+"""
+
+import numpy as np
+import pytest
+from src.core.distance_matrix import haversine_matrix
+from src.services.optimization.optimizer import Optimizer
+from src.services.optimization.route_environment import RouteAdjustmentEnv
+
+def _coordinates(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(24.0, 25.0, count), rng.uniform(54.0, 55.0, count)])
+
+def _env(**kwargs):
+    return RouteAdjustmentEnv(haversine_matrix(_coordinates(30)), **kwargs)
+
+def test_spaces_and_state_shape():
+    env = _env(num_envs=8, stops=12, window=5, seed=0)
+    assert env.action_size == 6
+    assert env.state_size == 10
+    states = env.states()
+    assert states.shape == (8, 10) and states.dtype == np.float32
+    np.testing.assert_array_equal(env.permutations[0], np.arange(5))
+    with pytest.raises(ValueError):
+        _env(stops=4, window=5)
+
+def test_step_keeps_permutations_and_rewards_match_lengths():
+    env = _env(num_envs=16, stops=12, episode_steps=1000, seed=1)
+    stop_sets = np.sort(env.routes, axis=1)
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        lengths = env.tour_lengths()
+        states, rewards, dones = env.step(rng.integers(0, env.action_size, env.num_envs))
+        assert not dones.any()
+        np.testing.assert_array_equal(np.sort(env.routes, axis=1), stop_sets)
+        np.testing.assert_allclose(rewards, (lengths - env.tour_lengths()) / env.scales, rtol=1e-5, atol=1e-5)
+    np.testing.assert_array_equal(env.step(np.zeros(env.num_envs, dtype=int))[1], 0.0)
+
+def test_finished_episodes_reset():
+    env = _env(num_envs=4, stops=10, episode_steps=3, seed=2)
+    env.steps[1] = 1
+    old_routes = env.routes.copy()
+    _, _, dones = env.step(np.zeros(4, dtype=int))
+    np.testing.assert_array_equal(dones, [False, False, False, False])
+    _, _, dones = env.step(np.zeros(4, dtype=int))
+    np.testing.assert_array_equal(dones, [False, True, False, False])
+    assert env.steps.tolist() == [2, 0, 2, 2]
+    assert not np.array_equal(env.routes[1], old_routes[1])
+
+def test_greedy_actions_shorten_tours():
+    env = _env(num_envs=32, stops=20, episode_steps=1000, seed=3)
+    start = env.tour_lengths()
+    for _ in range(40):
+        _, rewards, _ = env.step(env.best_actions())
+        assert (rewards >= -1e-6).all()
+    assert (env.tour_lengths() < start).all()
+
+def test_optimizer_trains_route_policy():
+    optimizer = Optimizer.from_coordinates(_coordinates(20))
+    agent = optimizer.train_route_policy(num_envs=16, stops=10, training_steps=20, seed=0, batch_size=32)
+    assert len(agent.buffer) == 20 * 16
+    assert agent.train_steps == 20
+    stats = optimizer.last_run_stats
+    assert stats.algorithm == "route_policy"
+    assert stats.evaluations == 20 * 16
+    policy = agent.export_policy()
+    assert policy.state_size == 10 and policy.action_size == 6
+    with pytest.raises(ValueError):
+        Optimizer(lambda route: 0.0, list(range(5)), 5).train_route_policy()
@@ -0,0 +1,130 @@
+"""
+Unit tests for the spatial index and candidate-list focused moves.
+Tests include:
+- Grid k-nearest candidate lists and queries match brute force on uniform and clustered stops.
+- Candidate lists from a distance matrix.
+- Focused neighborhood moves keep exact deltas and bring stops next to their candidates.
+- GA mutation and SA runs restricted to candidate lists through the Optimizer.
+- Nearest-neighbor construction from candidate lists matches the full row scan.
+- List-mode SA keeps its stop position map in sync with the current state.
+"""
+
+import random
+import pytest
+import numpy as np
+from src.core.spatial_index import GridIndex, candidate_lists, candidate_lists_from_matrix
+from src.core.distance_matrix import RouteDistanceFitness, haversine_matrix
+from src.services.optimization.algorithms.genetic import GeneticAlgorithm
+from src.services.optimization.algorithms.neighborhoods import TourNeighborhood
+from src.services.optimization.algorithms.simulated_annealing import SimulatedAnnealing
+from src.services.optimization.construction import nearest_neighbor
+from src.services.optimization.optimizer import Optimizer
+
+def planar_distances(index, queries=None):
+    queries = index.points if queries is None else queries
+    return np.sqrt(((queries[:, np.newaxis] - index.points[np.newaxis]) ** 2).sum(axis=-1))
+
+@pytest.mark.parametrize("layout", ["uniform", "clustered"])
+@pytest.mark.parametrize("n", [2, 7, 300])
+def test_candidate_lists_match_brute_force(layout, n):
+    rng = np.random.default_rng(n)
+    if layout == "uniform":
+        coordinates = np.column_stack([rng.uniform(24.0, 25.0, n), rng.uniform(54.0, 55.0, n)])
+    else:
+        coordinates = np.concatenate([rng.normal([24.5, 54.5], 0.005, (n // 2, 2)),
+                                      rng.normal([24.9, 54.1], 0.2, (n - n // 2, 2))])
+    index = GridIndex(coordinates)
+    lists = index.candidate_lists(8)
+    assert lists.shape == (n, min(8, n - 1))
+    distances = planar_distances(index)
+    expected = candidate_lists_from_matrix(distances, 8)
+    assert not (lists == np.arange(n)[:, np.newaxis]).any()
+    np.testing.assert_allclose(np.take_along_axis(distances, lists, axis=1),
+                               np.take_along_axis(distances, expected, axis=1))
+
+def test_query_matches_brute_force():
+    rng = np.random.default_rng(1)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 200), rng.uniform(54.0, 55.0, 200)])
+    index = GridIndex(coordinates)
+    # Query points inside and well outside the indexed area.
+    queries = np.array([[24.5, 54.5], [24.01, 54.99], [26.0, 56.0]])
+    nearest = index.query(queries, 5)
+    distances = planar_distances(index, index._project(np.radians(queries)))
+    np.testing.assert_allclose(np.take_along_axis(distances, nearest, axis=1), np.sort(distances, axis=1)[:, :5])
+
+@pytest.mark.parametrize("closed", [True, False])
+@pytest.mark.parametrize("move", ["swap", "two_opt", "or_opt"])
+def test_focused_moves_keep_exact_deltas(closed, move):
+    rng = np.random.default_rng(5)
+    points = rng.random((30, 2))
+    matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+    fitness = RouteDistanceFitness(matrix, closed=closed)
+    lists = candidate_lists_from_matrix(matrix, 4)
+    neighborhood = TourNeighborhood(matrix, rng.permutation(30), closed=closed, rng=rng, neighbor_lists=lists)
+    applied = 0
+    for _ in range(200):
+        before = neighborhood.route()
+        _, params, deltas = neighborhood.propose(4, move)
+        valid = np.flatnonzero(np.isfinite(deltas))
+        if valid.size == 0:
+            continue
+        k = int(valid[0])
+        neighborhood.apply(move, params, k, deltas[k])
+        after = neighborhood.route()
+        applied += 1
+        assert sorted(after) == list(range(30))
+        assert fitness(before) - fitness(after) == pytest.approx(deltas[k], abs=1e-9)
+    assert applied > 100
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_focused_mutation_keeps_permutations(batch):
+    random.seed(0)
+    rng = np.random.default_rng(2)
+    points = rng.random((25, 2))
+    matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+    fitness = RouteDistanceFitness(matrix)
+    ga = GeneticAlgorithm(20, 0.2, 0.7, fitness, batch_fitness_fn=fitness.evaluate_batch if batch else None,
+                          neighbor_lists=candidate_lists_from_matrix(matrix, 5))
+    best, best_fitness = ga.run(list(range(25)), 25, generations=10)
+    assert sorted(best) == list(range(25))
+    assert best_fitness == pytest.approx(fitness(best))
+
+def test_optimizer_with_candidate_lists():
+    random.seed(0)
+    rng = np.random.default_rng(3)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 80), rng.uniform(54.0, 55.0, 80)])
+    optimizer = Optimizer.from_coordinates(coordinates, neighbors=8)
+    assert optimizer.neighbor_lists.shape == (80, 8)
+    np.testing.assert_array_equal(optimizer.neighbor_lists, candidate_lists(coordinates, 8))
+    initial = list(range(80))
+    best, best_fitness = optimizer.run_simulated_annealing(initial_solution=initial, initial_temp=1.0, max_iter=500)
+    assert sorted(best) == initial
+    assert best_fitness > optimizer.fitness_fn(initial)
+
+@pytest.mark.parametrize("depot", [None, 0])
+def test_nearest_neighbor_with_candidate_lists_matches_scan(depot):
+    rng = np.random.default_rng(4)
+    coordinates = np.column_stack([rng.uniform(24.0, 25.0, 200), rng.uniform(54.0, 55.0, 200)])
+    matrix = haversine_matrix(coordinates)
+    nodes = list(range(1, 200)) if depot == 0 else list(range(200))
+    lists = candidate_lists(coordinates, 6)
+    assert nearest_neighbor(matrix, nodes, depot=depot, neighbor_lists=lists) == nearest_neighbor(matrix, nodes, depot=depot)
+    # A subset of the stops: candidates outside it are skipped.
+    subset = list(range(0, 200, 3))
+    assert nearest_neighbor(matrix, subset, neighbor_lists=lists) == nearest_neighbor(matrix, subset)
+
+def test_list_mode_annealing_tracks_positions():
+    random.seed(1)
+    rng = np.random.default_rng(5)
+    points = rng.random((40, 2))
+    matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+    fitness = RouteDistanceFitness(matrix)
+    initial = rng.permutation(40).tolist()
+    sa = SimulatedAnnealing(initial, fitness, initial_temp=0.5, cooling_rate=0.8, min_temp=0.05, max_iter=200,
+                            neighbor_lists=candidate_lists_from_matrix(matrix, 5))
+    best, best_fitness = sa.run()
+    assert sorted(best) == list(range(40))
+    assert best_fitness > fitness(initial)
+    # The map was updated in place for accepted moves and matches the final state.
+    assert sa._positions_of is sa.final_state
+    assert all(sa._positions[node] == index for index, node in enumerate(sa.final_state))
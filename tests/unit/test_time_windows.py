@@ -0,0 +1,99 @@
+"""
+Unit tests for time-window feasibility.
+Tests include:
+- Parsing ISO 8601 delivery windows.
+- Forward/backward schedule arrays against a step-by-step simulation.
+- O(1) insertion checks (exact) and relocation checks (never accept an infeasible move).
+- Feasibility-preserving simulated annealing.
+"""
+
+import random
+import pytest
+import numpy as np
+from src.services.optimization.time_windows import (
+    parse_delivery_windows, TimeWindows, TimeWindowFitness, travel_time_matrix,
+)
+from src.services.optimization.optimizer import Optimizer
+
+def simulate(time_windows, route):
+    nodes = [time_windows.depot, *route] + ([time_windows.depot] if time_windows.return_to_depot else [])
+    time = time_windows.start_time
+    for previous, node in zip(nodes, nodes[1:]):
+        time = max(time + time_windows.service_times[previous] + time_windows.travel_times[previous, node],
+                   time_windows.earliest[node])
+        if time > time_windows.latest[node] + 1e-9:
+            return False
+    return True
+
+def random_instance(rng, n, return_to_depot):
+    points = rng.random((n + 1, 2)) * 10
+    travel = np.sqrt(((points[:, np.newaxis] - points[np.newaxis]) ** 2).sum(axis=-1))
+    earliest = rng.uniform(0, 30, n + 1)
+    latest = earliest + rng.uniform(5, 40, n + 1)
+    earliest[0], latest[0] = 0.0, 200.0
+    return TimeWindows(travel, earliest, latest, rng.uniform(0, 2, n + 1), return_to_depot=return_to_depot)
+
+def test_parse_delivery_windows():
+    earliest, latest, reference = parse_delivery_windows([
+        {"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T12:00:00Z"},
+        {"start": "2025-01-01T13:00:00+00:00", "end": "2025-01-01T17:00:00Z"},
+    ])
+    assert reference.hour == 8
+    assert earliest.tolist() == [0.0, 5 * 3600.0]
+    assert latest.tolist() == [4 * 3600.0, 9 * 3600.0]
+
+@pytest.mark.parametrize("return_to_depot", [True, False])
+def test_schedule_checks_match_simulation(return_to_depot):
+    rng = np.random.default_rng(0)
+    for _ in range(150):
+        n = int(rng.integers(2, 8))
+        time_windows = random_instance(rng, n, return_to_depot)
+        route = rng.permutation(np.arange(1, n + 1)).tolist()
+        schedule = time_windows.schedule(route)
+        assert schedule.feasible == simulate(time_windows, route)
+        if not schedule.feasible:
+            continue
+        for stop in route:
+            rest = [s for s in route if s != stop]
+            rest_schedule = time_windows.schedule(rest)
+            for position in range(1, len(rest) + 2):
+                candidate = rest[:position - 1] + [stop] + rest[position - 1:]
+                assert rest_schedule.can_insert(stop, position) == simulate(time_windows, candidate)
+        for source in range(1, n + 1):
+            for target in range(1, n + 2):
+                if target in (source, source + 1):
+                    continue
+                rest = route[:source - 1] + route[source:]
+                position = target if target < source else target - 1
+                candidate = rest[:position - 1] + [route[source - 1]] + rest[position - 1:]
+                if schedule.relocation_feasible(np.array([source]), np.array([target]))[0]:
+                    assert simulate(time_windows, candidate), "Relocation checks must never accept infeasible moves."
+
+def test_simulated_annealing_keeps_time_windows_feasible():
+    rng = np.random.default_rng(1)
+    coordinates = np.column_stack([rng.uniform(24.0, 24.3, 21), rng.uniform(54.0, 54.3, 21)])
+    optimizer = Optimizer.from_coordinates(coordinates)
+    travel = travel_time_matrix(optimizer.distance_matrix, speed_kmh=40.0)
+    # Windows that the identity route meets with an hour to spare at every stop.
+    arrival = np.concatenate([[0.0], np.cumsum(travel[np.arange(20), np.arange(1, 21)])])
+    time_windows = TimeWindows(travel, arrival - 3600.0, arrival + 3600.0, depot=0, start_time=0.0,
+                               return_to_depot=False)
+    time_windows.latest[0] = np.inf
+    optimizer = Optimizer.from_coordinates(coordinates, time_windows=time_windows, lateness_penalty=10.0)
+    assert optimizer.gene_pool == list(range(1, 21))
+    initial_solution = list(range(1, 21))
+    random.seed(3)
+    best_solution, best_fitness = optimizer.run_simulated_annealing(
+        initial_solution=initial_solution, initial_temp=5, cooling_rate=0.8, min_temp=0.01, max_iter=2000
+    )
+    assert sorted(best_solution) == initial_solution
+    assert time_windows.schedule(best_solution).feasible
+    assert best_fitness == pytest.approx(optimizer.fitness_fn(best_solution))
+    assert best_fitness >= optimizer.fitness_fn(initial_solution)
+
+def test_time_window_fitness_penalizes_lateness():
+    travel = np.array([[0, 10, 10], [10, 0, 10], [10, 10, 0]], dtype=float)
+    time_windows = TimeWindows(travel, [0, 0, 0], [100, 15, 100], return_to_depot=False)
+    fitness = TimeWindowFitness(travel, time_windows, lateness_penalty=2.0)
+    assert fitness([1, 2]) == pytest.approx(-10.0)
+    assert fitness([2, 1]) == pytest.approx(-(10.0 + 2.0 * 5.0))
@@ -0,0 +1,74 @@
+"""
+Unit tests for route payload validation.
+Tests include:
+- The fast path and the compiled validator agree with jsonschema.validate on valid and invalid payloads.
+- Invalid payloads raise the same error as jsonschema.validate.
+- Bulk validation reports every error of every item.
+"""
+
+import copy
+import jsonschema
+import pytest
+import numpy as np
+from jsonschema import ValidationError
+from src.services.optimization.validators import (ROUTE_SCHEMA, validate_route_data, route_data_errors,
+                                                  validate_route_data_bulk, _fast_path_accepts)
+
+VALID = {
+    "route": [1, 3.5, 5, 7],
+    "vehicle_capacity": 50,
+    "coordinates": [[24.0, 54.0], [24.1, 54.2]],
+    "delivery_windows": [{"start": "2025-01-01T08:00:00Z", "end": "2025-01-01T12:00:00Z", "note": "gate 2"}],
+}
+
+def variant(**changes):
+    data = copy.deepcopy(VALID)
+    for key, value in changes.items():
+        if value is None:
+            data.pop(key)
+        else:
+            data[key] = value
+    return data
+
+PAYLOADS = [
+    VALID,
+    variant(coordinates=None, delivery_windows=None),
+    variant(route=[np.int64(1), np.float64(2.0)]),
+    variant(route=[1]),
+    variant(route=[1, True]),
+    variant(route=(1, 2)),
+    variant(route=[1, "2"]),
+    variant(vehicle_capacity=None),
+    variant(vehicle_capacity=False),
+    variant(fleet_id="fleet_123"),
+    variant(coordinates=[[24.0]]),
+    variant(coordinates=[[24.0, 54.0, 3.0]]),
+    variant(coordinates=[[24.0, None]]),
+    variant(delivery_windows=[{"start": "2025-01-01T08:00:00Z"}]),
+    variant(delivery_windows=[{"start": 1, "end": "2025-01-01T12:00:00Z"}]),
+    [1, 2, 3],
+]
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_matches_jsonschema(payload):
+    try:
+        jsonschema.validate(instance=payload, schema=ROUTE_SCHEMA)
+        expected = None
+    except ValidationError as error:
+        expected = error
+    if expected is None:
+        assert validate_route_data(payload) is True
+        assert route_data_errors(payload) == []
+    else:
+        assert not _fast_path_accepts(payload)
+        with pytest.raises(ValidationError) as raised:
+            validate_route_data(payload)
+        assert raised.value.message == expected.message
+        assert list(raised.value.path) == list(expected.path)
+
+def test_bulk_reports_all_errors_per_item():
+    results = validate_route_data_bulk([VALID, {"route": [1, "a", None], "fleet": 3}, variant(route=[1])])
+    assert results[0] == []
+    assert {error["path"] for error in results[1]} == {"", "/route/1", "/route/2"}
+    assert len(results[1]) == 4  # Missing capacity, extra property, and two bad route items.
+    assert results[2] == [{"path": "/route", "message": "[1] is too short"}]